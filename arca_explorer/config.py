@@ -1,13 +1,20 @@
 from pathlib import Path
 import os
+import sys
+
+# explorer.py corre suelto: el paquete `codigo` (métricas) es la carpeta de arriba
+sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 SOS_API_TOKEN = os.getenv("SOS_API_TOKEN")
 
 
 BASE_DIR = Path(__file__).resolve().parent
 
-SOURCES_DIR = BASE_DIR / "sources"
-REPORTS_DIR = BASE_DIR / "reports"
+# ARCA_EXPLORER_DIR manda sources/ y reports/ a otro lado (pruebas contra un ARCA local)
+DATA_DIR = Path(os.getenv("ARCA_EXPLORER_DIR", BASE_DIR))
+
+SOURCES_DIR = DATA_DIR / "sources"
+REPORTS_DIR = DATA_DIR / "reports"
 
 # Palabras clave para ARCA (PDF)
 KEYWORDS = [
@@ -21,11 +28,13 @@ KEYWORDS = [
     "Servicio doméstico",
 ]
 
-# URLs base ARCA
+# URLs base ARCA (ARCA_BASE_URL apunta a otro host, ej: benchmarks/servidor_arca.py)
+ARCA_BASE_URL = os.getenv("ARCA_BASE_URL", "https://www.arca.gob.ar").rstrip("/")
+
 ARCA_URLS = {
-    "deducciones_personales": "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/deducciones-personales.asp",
-    "deducciones_generales": "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/deducciones-generales.asp",
-    "bienes_personales": "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp",
+    "deducciones_personales": f"{ARCA_BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/deducciones-personales.asp",
+    "deducciones_generales": f"{ARCA_BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/deducciones-generales.asp",
+    "bienes_personales": f"{ARCA_BASE_URL}/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp",
 }
 
 # =========================
@@ -1,7 +1,4 @@
 import argparse
-import time
-import requests
-import pdfplumber
 from pathlib import Path
 from bs4 import BeautifulSoup
 from tqdm import tqdm
@@ -11,20 +8,25 @@ import urllib.robotparser as robotparser
 from config import (
     SOURCES_DIR,
     REPORTS_DIR,
+    ARCA_BASE_URL,
     ARCA_URLS,
     KEYWORDS,
 )
+from codigo.duplicados import IndiceDocumentos
+from codigo.indice_texto import IndiceTexto
+from codigo.metricas import contar, iniciar, log, medido
+from codigo.ritmo import CircuitoAbierto, ControlRitmo
 
 # =========================
 # CONFIG GENERAL
 # =========================
 
-USER_AGENT = "TGA-Impuestos-Explorer"
-HEADERS = {
-    "User-Agent": USER_AGENT
-}
+from codigo.sesion_http import USER_AGENT
 
-DEFAULT_DELAY = 1.0  # segundos entre requests
+DEFAULT_DELAY = 1.0  # segundos entre requests al arrancar (si robots.txt no dice nada)
+DELAY_MINIMO = 0.25  # piso al que acelera el control de ritmo (si robots.txt no dice nada)
+
+ritmo = None  # ControlRitmo de la corrida (run_arca)
 
 
 # =========================
@@ -47,10 +49,18 @@ def can_fetch(rp: robotparser.RobotFileParser, url: str) -> bool:
 
 
 def get_delay(rp: robotparser.RobotFileParser) -> float:
-    rr = rp.request_rate("*")
+    """Intervalo que pide robots.txt (Request-rate / Crawl-delay); 0 si no pide nada."""
+    delays = []
+
+    rr = rp.request_rate(USER_AGENT)
     if rr and rr.requests and rr.seconds and rr.requests > 0:
-        return rr.seconds / rr.requests
-    return DEFAULT_DELAY
+        delays.append(rr.seconds / rr.requests)
+
+    cd = rp.crawl_delay(USER_AGENT)
+    if cd:
+        delays.append(float(cd))
+
+    return max(delays) if delays else 0.0
 
 
 # =========================
@@ -64,7 +74,7 @@ def ensure_dirs(year: str):
 
     html_dir.mkdir(parents=True, exist_ok=True)
     pdf_dir.mkdir(parents=True, exist_ok=True)
-    REPORTS_DIR.mkdir(exist_ok=True)
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     return html_dir, pdf_dir
 
@@ -74,20 +84,18 @@ def ensure_dirs(year: str):
 # =========================
 
 def safe_get(url: str):
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        return r
-    except Exception as e:
-        return None
+    """GET al ritmo del host: reintenta 429/503/timeouts; None si no hubo respuesta."""
+    return ritmo.get(url)
 
 
-def download_html(name: str, url: str, html_dir: Path):
+def download_html(name: str, url: str, html_dir: Path, indice: IndiceTexto):
     r = safe_get(url)
     if not r or r.status_code != 200:
         return None, r.status_code if r else "ERROR"
 
     path = html_dir / f"{name}.html"
     path.write_text(r.text, encoding="utf-8")
+    indice.agregar_html(url, r.text)
     return path, 200
 
 
@@ -104,39 +112,51 @@ def extract_pdf_links(html_path: Path, base_url: str):
     return list(set(links))
 
 
-def download_pdf(url: str, pdf_dir: Path):
-    name = url.split("/")[-1]
-    path = pdf_dir / name
-
-    if path.exists():
-        return path, "CACHED"
+def download_pdf(url: str, pdf_dir: Path, documentos: IndiceDocumentos, indice: IndiceTexto):
+    """→ (path, status, análisis, previo): previo si el contenido ya estaba bajo otra URL."""
+    conocido = documentos.por_url(url)
+    if conocido and (pdf_dir / conocido["archivo"]).exists():
+        contar("pdf_cache_hits")
+        return pdf_dir / conocido["archivo"], "CACHED", conocido["analisis"], None
 
     r = safe_get(url)
     if not r or r.status_code != 200:
-        return None, r.status_code if r else "ERROR"
+        return None, r.status_code if r else "ERROR", None, None
 
-    path.write_bytes(r.content)
-    return path, 200
+    # los repetidos exactos reusan el análisis (los casi iguales se analizan igual)
+    paginas = []
+    path, analysis, previo = documentos.registrar_pdf(pdf_dir, url, r.content, lambda p: analyze_pdf(p, paginas))
+    # toda URL queda en el índice; un repetido exacto reusa el texto del original
+    indice.agregar_pdf(url, paginas, r.content, path=path)
+    return path, 200, analysis, previo
 
 
 # =========================
 # PDF ANALYSIS
 # =========================
 
-def analyze_pdf(pdf_path: Path):
+@medido()
+def analyze_pdf(pdf_path: Path, paginas: list = None):
+    """`paginas`, si viene, se llena con el texto de cada página (para el índice de texto)."""
     result = {
         "has_text": False,
         "keywords": [],
         "pages": 0,
     }
 
+    import pdfplumber  # recién acá: muchas corridas no bajan ningún PDF
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
             result["pages"] = len(pdf.pages)
+            contar("pdf_paginas", result["pages"])
             full_text = ""
 
             for page in pdf.pages:
-                full_text += page.extract_text() or ""
+                texto_pagina = page.extract_text() or ""
+                full_text += texto_pagina
+                if paginas is not None:
+                    paginas.append(texto_pagina)
 
             if full_text.strip():
                 result["has_text"] = True
@@ -155,62 +175,78 @@ def analyze_pdf(pdf_path: Path):
 # =========================
 
 def run_arca(year: str):
+    global ritmo
     html_dir, pdf_dir = ensure_dirs(year)
+    documentos = IndiceDocumentos(pdf_dir / "documentos.json")
+    indice = IndiceTexto()
 
-    rp, robots_url = get_robots_parser("https://www.arca.gob.ar/")
+    rp, robots_url = get_robots_parser(f"{ARCA_BASE_URL}/")
+    # si robots.txt fija un ritmo, ése es el techo; si no, arranca en DEFAULT_DELAY y acelera
     delay = get_delay(rp)
+    ritmo = ControlRitmo(inicial=delay or DEFAULT_DELAY, minimo=delay or DELAY_MINIMO)
 
     report = []
     report.append(f"[ARCA EXPLORER] Año {year}")
     report.append(f"User-Agent: {USER_AGENT}")
     report.append(f"robots.txt: {robots_url}")
-    report.append(f"delay_s: {delay:.2f}")
+    report.append(f"delay_s: {ritmo.delay:.2f} (mínimo {ritmo.minimo:.2f}, adaptativo)")
     report.append("")
 
-    for name, url in ARCA_URLS.items():
-        report.append(f"\n=== Página índice: {name} ===")
-        report.append(f"URL: {url}")
+    try:
+        for name, url in ARCA_URLS.items():
+            report.append(f"\n=== Página índice: {name} ===")
+            report.append(f"URL: {url}")
+
+            if not can_fetch(rp, url):
+                report.append("❌ BLOQUEADO por robots.txt")
+                continue
 
-        if not can_fetch(rp, url):
-            report.append("❌ BLOQUEADO por robots.txt")
-            continue
+            html_path, status = download_html(name, url, html_dir, indice)
 
-        time.sleep(delay)
-        html_path, status = download_html(name, url, html_dir)
+            if status != 200 or not html_path:
+                report.append(f"⚠️ No se pudo descargar HTML (status: {status})")
+                continue
 
-        if status != 200 or not html_path:
-            report.append(f"⚠️ No se pudo descargar HTML (status: {status})")
-            continue
+            report.append("✔ HTML descargado")
 
-        report.append("✔ HTML descargado")
+            pdf_links = extract_pdf_links(html_path, url)
+            report.append(f"PDFs encontrados: {len(pdf_links)}")
 
-        pdf_links = extract_pdf_links(html_path, url)
-        report.append(f"PDFs encontrados: {len(pdf_links)}")
+            for pdf_url in tqdm(pdf_links, desc=f"PDFs {name}"):
+                if not can_fetch(rp, pdf_url):
+                    report.append(f"  ❌ BLOQUEADO por robots: {pdf_url}")
+                    continue
 
-        for pdf_url in tqdm(pdf_links, desc=f"PDFs {name}"):
-            if not can_fetch(rp, pdf_url):
-                report.append(f"  ❌ BLOQUEADO por robots: {pdf_url}")
-                continue
+                pdf_path, pdf_status, analysis, previo = download_pdf(pdf_url, pdf_dir, documentos, indice)
 
-            time.sleep(delay)
-            pdf_path, pdf_status = download_pdf(pdf_url, pdf_dir)
+                if pdf_status != 200 and pdf_status != "CACHED":
+                    report.append(f"  ⚠️ Error al bajar PDF ({pdf_status}): {pdf_url}")
+                    continue
 
-            if pdf_status != 200 and pdf_status != "CACHED":
-                report.append(f"  ⚠️ Error al bajar PDF ({pdf_status}): {pdf_url}")
-                continue
+                line = f"  ✔ {pdf_path.name} | páginas: {analysis['pages']}"
 
-            analysis = analyze_pdf(pdf_path)
+                if analysis.get("has_text"):
+                    line += " | TEXTO"
+                    if analysis["keywords"]:
+                        line += f" | keywords: {', '.join(analysis['keywords'])}"
+                else:
+                    line += " | SIN TEXTO"
 
-            line = f"  ✔ {pdf_path.name} | páginas: {analysis['pages']}"
+                if previo:
+                    line += f" | {'=' if previo['equivalencia'] == 'exacta' else '≈'} {previo['url']}"
 
-            if analysis.get("has_text"):
-                line += " | TEXTO"
-                if analysis["keywords"]:
-                    line += f" | keywords: {', '.join(analysis['keywords'])}"
-            else:
-                line += " | SIN TEXTO"
+                report.append(line)
+    except CircuitoAbierto as e:
+        log.warning("⛔ ARCA no responde (%s): corto la exploración", e)
+        report.append(f"\n⛔ Exploración cortada: ARCA no responde ({e})")
 
-            report.append(line)
+    documentos.guardar()
+    indice.close()
+    grupos = documentos.grupos()
+    if grupos:
+        report.append(f"\n=== PDFs repetidos ({len(grupos)} grupos) ===")
+        for urls in grupos:
+            report.append("  " + " = ".join(urls))
 
     return report
 
@@ -229,8 +265,12 @@ def main(year: str):
 
 
 if __name__ == "__main__":
+    iniciar("explorer")  # saca --profile de argv
+
     parser = argparse.ArgumentParser(description="ARCA Explorer (modo exploración)")
     parser.add_argument("--year", required=True, help="Año fiscal (ej: 2024, 2025)")
+    parser.add_argument("--profile", nargs="?", const="cprofile", metavar="MODO",
+                        help="perfilar la corrida (cprofile | muestreo) en outputs/perfiles/")
     args = parser.parse_args()
 
     main(args.year)
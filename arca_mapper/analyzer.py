@@ -1,10 +1,11 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-import pdfplumber
 
 from config import KEYWORDS
+from codigo.metricas import contar, medido
 
 
+@medido()
 def analyze_html(html_text: str, base_url: str):
     soup = BeautifulSoup(html_text, "html.parser")
 
@@ -40,20 +41,28 @@ def analyze_html(html_text: str, base_url: str):
     }
 
 
-def analyze_pdf(pdf_path):
+@medido()
+def analyze_pdf(pdf_path, paginas: list = None):
+    """`paginas`, si viene, se llena con el texto de cada página (para el índice de texto)."""
     result = {
         "pages": 0,
         "has_text": False,
         "keywords": [],
     }
 
+    import pdfplumber  # recién acá: la mayoría de las páginas son HTML
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
             result["pages"] = len(pdf.pages)
+            contar("pdf_paginas", result["pages"])
             text = ""
 
             for page in pdf.pages:
-                text += page.extract_text() or ""
+                texto_pagina = page.extract_text() or ""
+                text += texto_pagina
+                if paginas is not None:
+                    paginas.append(texto_pagina)
 
             if text.strip():
                 result["has_text"] = True
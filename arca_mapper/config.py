@@ -1,28 +1,44 @@
+import os
+import sys
 from pathlib import Path
+from urllib.parse import urlparse
+
+# los scripts de arca_mapper corren sueltos: el paquete `codigo` (métricas) es la carpeta de arriba
+sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 # =========================
 # SITE CONFIG
 # =========================
 
-BASE_DOMAIN = "www.arca.gob.ar"
+# ARCA_BASE_URL apunta los crawlers a otro host (ej: benchmarks/servidor_arca.py)
+BASE_URL = os.getenv("ARCA_BASE_URL", "https://www.arca.gob.ar").rstrip("/")
+BASE_DOMAIN = urlparse(BASE_URL).netloc
+
+# contra ARCA se siguen también los subdominios; contra un host local, sólo ese host
+DOMINIO_INTERNO = "arca.gob.ar" if BASE_DOMAIN.endswith("arca.gob.ar") else BASE_DOMAIN
+
 START_URLS = [
-    "https://www.arca.gob.ar/gananciasYBienes/",
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/",
+    f"{BASE_URL}/gananciasYBienes/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/",
 ]
 
 
 MAX_PAGES = 300          # límite total de páginas
 MAX_DEPTH = 4            # profundidad de navegación
-REQUEST_DELAY = 1.0      # segundos entre requests
+REQUEST_DELAY = float(os.getenv("ARCA_REQUEST_DELAY", 1.0))  # intervalo inicial entre requests
+# piso al que el control de ritmo (codigo/ritmo.py) acelera si ARCA responde bien; robots.txt puede pedir más
+REQUEST_DELAY_MIN = float(os.getenv("ARCA_REQUEST_DELAY_MIN", min(REQUEST_DELAY, 0.25)))
 
-USER_AGENT = "PublicData-Explorer/1.0"
+from codigo.sesion_http import USER_AGENT  # el mismo para todos los scripts (robots.txt lo evalúa)
 
 OUTPUT_DIR = Path("outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-SITE_MAP_JSON = OUTPUT_DIR / "site_map.json"
+SITE_MAP_JSONL = OUTPUT_DIR / "site_map.jsonl"   # una entrada por línea, se escribe durante el crawl
+SITE_MAP_JSON = OUTPUT_DIR / "site_map.json"     # formato viejo (lista entera); sólo se lee
 SUMMARY_TXT = OUTPUT_DIR / "summary.txt"
+DOCUMENTOS_JSON = OUTPUT_DIR / "documentos.json"   # PDFs por contenido (codigo/duplicados.py)
 
 # =========================
 # KEYWORDS
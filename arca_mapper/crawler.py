@@ -1,5 +1,3 @@
-import json
-import requests
 from collections import deque
 from urllib.parse import urlparse
 
@@ -7,36 +5,43 @@ from urllib.parse import urlparse
 from tqdm import tqdm
 
 from config import (
-    BASE_DOMAIN,
+    BASE_URL,
+    DOMINIO_INTERNO,
     START_URLS,
     MAX_PAGES,
     MAX_DEPTH,
-    USER_AGENT,
-    SITE_MAP_JSON,
+    SITE_MAP_JSONL,
     SUMMARY_TXT,
+    DOCUMENTOS_JSON,
 )
 from robots import RobotsManager
 from analyzer import analyze_html, analyze_pdf
-
-
-HEADERS = {"User-Agent": USER_AGENT}
+from site_map import EscritorSiteMap
+from codigo.duplicados import IndiceDocumentos
+from codigo.indice_texto import IndiceTexto
+from codigo.metricas import contar, iniciar, log
+from codigo.ritmo import CircuitoAbierto
 
 
 def is_internal(url: str) -> bool:
     netloc = urlparse(url).netloc
-    return netloc.endswith("arca.gob.ar")
+    return netloc.endswith(DOMINIO_INTERNO)
 
 
 
 def crawl():
-    robots = RobotsManager("https://www.arca.gob.ar/")
+    robots = RobotsManager(f"{BASE_URL}/")
 
 
     visited = set()
     queue = deque((url, 0) for url in START_URLS)
 
 
-    site_map = []
+    # cada entrada va al .jsonl apenas se analiza: memoria constante y
+    # resultados parciales legibles (summarize_sources) con el crawl en curso
+    site_map = EscritorSiteMap(SITE_MAP_JSONL)
+    documentos = IndiceDocumentos(DOCUMENTOS_JSON)
+    indice = IndiceTexto()
     page_count = 0
 
     progress = tqdm(total=MAX_PAGES, desc="Crawling ARCA")
@@ -51,14 +56,17 @@ def crawl():
             continue
 
         if not robots.can_fetch(url):
+            contar("robots_bloqueadas")
             continue
 
         visited.add(url)
-        robots.wait()
 
         try:
-            r = requests.get(url, headers=HEADERS, timeout=30)
-        except Exception:
+            r = robots.get(url)
+        except CircuitoAbierto as e:
+            log.warning("⛔ ARCA no responde (%s): corto el crawl con %d páginas", e, page_count)
+            break
+        if r is None:
             continue
 
         entry = {
@@ -68,7 +76,7 @@ def crawl():
         }
 
         if r.status_code != 200:
-            site_map.append(entry)
+            site_map.agregar(entry)
             continue
 
         content_type = r.headers.get("Content-Type", "").lower()
@@ -78,6 +86,7 @@ def crawl():
 
             analysis = analyze_html(r.text, url)
             entry.update(analysis)
+            indice.agregar_html(url, r.text)
 
             for link in analysis["links"]:
                 if link not in visited:
@@ -89,34 +98,44 @@ def crawl():
         elif "pdf" in content_type or url.lower().endswith(".pdf"):
             entry["type"] = "pdf"
 
-            filename = url.split("/")[-1]
-            path = SITE_MAP_JSON.parent / filename
-
-            if not path.exists():
-                with open(path, "wb") as f:
-                    f.write(r.content)
-
-            entry["pdf"] = analyze_pdf(path)
-
-        site_map.append(entry)
+            # mismo contenido que otro PDF ya visto → se reusa su análisis; los casi iguales se analizan
+            paginas = []
+            path, entry["pdf"], previo = documentos.registrar_pdf(
+                SITE_MAP_JSONL.parent, url, r.content, lambda p: analyze_pdf(p, paginas)
+            )
+            # toda URL queda en el índice; un repetido exacto reusa el texto del original
+            indice.agregar_pdf(url, paginas, r.content, path=path)
+            entry["archivo"] = path.name
+            if previo:
+                entry["duplicado_de"] = previo
+
+        site_map.agregar(entry)
+        contar("paginas", tipo=entry["type"] or "otro")
         page_count += 1
         progress.update(1)
 
     progress.close()
+    documentos.guardar()
+    indice.close()
 
-    SITE_MAP_JSON.write_text(json.dumps(site_map, indent=2, ensure_ascii=False), encoding="utf-8")
+    # al final del mapa, los grupos de URLs con el mismo documento
+    grupos = documentos.grupos()
+    site_map.agregar({"type": "duplicados", "grupos": grupos})
+    site_map.close()
 
     summary_lines = [
-        f"Páginas analizadas: {len(site_map)}",
-        f"HTML: {sum(1 for e in site_map if e.get('type') == 'html')}",
-        f"PDFs: {sum(1 for e in site_map if e.get('type') == 'pdf')}",
+        f"Páginas analizadas: {site_map.conteo['total']}",
+        f"HTML: {site_map.conteo['html']}",
+        f"PDFs: {site_map.conteo['pdf']}",
+        f"PDFs repetidos: {sum(len(g) - 1 for g in grupos)} (en {len(grupos)} grupos)",
     ]
 
     SUMMARY_TXT.write_text("\n".join(summary_lines), encoding="utf-8")
 
 
 if __name__ == "__main__":
+    iniciar("crawler")
     crawl()
     print("Mapa del sitio generado.")
-    print(f"- {SITE_MAP_JSON}")
+    print(f"- {SITE_MAP_JSONL}")
     print(f"- {SUMMARY_TXT}")
@@ -1,38 +1,38 @@
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 from tqdm import tqdm
-import time
 
-HEADERS = {
-    "User-Agent": "Impuestos-Explorer"
-}
+from config import BASE_URL, DOMINIO_INTERNO, REQUEST_DELAY
+from robots import RobotsManager
+from codigo.metricas import contar, iniciar, log
+from codigo.ritmo import CircuitoAbierto
 
 SEEDS = [
     # Ganancias
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/",
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/",
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/",
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/documentos/",
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/declaracion-jurada/",
-    "https://www.arca.gob.ar/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/declaracion-jurada/documentos/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/documentos/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/declaracion-jurada/",
+    f"{BASE_URL}/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/declaracion-jurada/documentos/",
 
     # Bienes Personales
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/declaracion-jurada/",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/valuaciones/",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/valuaciones/documentos/",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/conceptos-basicos/",
-    "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/conceptos-basicos/alicuotas.asp",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/declaracion-jurada/",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/valuaciones/",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/valuaciones/documentos/",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/conceptos-basicos/",
+    f"{BASE_URL}/gananciasYBienes/bienes-personales/conceptos-basicos/alicuotas.asp",
 ]
 
 visited = set()
 found_pdfs = set()
+robots = None
 
 def is_internal(url: str) -> bool:
-    return urlparse(url).netloc.endswith("arca.gob.ar")
+    return urlparse(url).netloc.endswith(DOMINIO_INTERNO)
 
 def crawl(url: str, depth: int = 0, max_depth: int = 4):
     if url in visited or depth > max_depth:
@@ -40,14 +40,16 @@ def crawl(url: str, depth: int = 0, max_depth: int = 4):
 
     visited.add(url)
 
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-    except Exception:
+    if not robots.can_fetch(url):
+        contar("robots_bloqueadas")
         return
 
-    if r.status_code != 200:
+    r = robots.get(url)  # al ritmo que aguante ARCA
+    if r is None or r.status_code != 200:
         return
 
+    contar("paginas", tipo="html")
+
     soup = BeautifulSoup(r.text, "html.parser")
 
     for a in soup.find_all("a", href=True):
@@ -62,11 +64,15 @@ def crawl(url: str, depth: int = 0, max_depth: int = 4):
         else:
             crawl(full_url, depth + 1, max_depth)
 
-    time.sleep(0.5)  # ser prolijos con ARCA
-
 if __name__ == "__main__":
-    for seed in tqdm(SEEDS, desc="Crawling dirigido ARCA"):
-        crawl(seed)
+    iniciar("crawler_dirigido")
+    robots = RobotsManager(f"{BASE_URL}/", delay=min(REQUEST_DELAY, 0.5))
+
+    try:
+        for seed in tqdm(SEEDS, desc="Crawling dirigido ARCA"):
+            crawl(seed)
+    except CircuitoAbierto as e:
+        log.warning("⛔ ARCA no responde (%s): muestro lo encontrado hasta acá", e)
 
     print("\nPDFs encontrados:\n")
     for pdf in sorted(found_pdfs):
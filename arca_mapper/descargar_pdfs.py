@@ -0,0 +1,77 @@
+import sys
+import time
+
+from config import REQUEST_DELAY
+from codigo.duplicados import IndiceDocumentos, nombre_archivo
+from codigo.metricas import iniciar
+from codigo.paths import FILES_DIR, OUTPUTS_DIR
+from codigo.sesion_http import get
+
+# Listas de prefilter_pdfs.py
+FUENTES = {
+    "ganancias": OUTPUTS_DIR / "fuentes_utiles_ganancias.txt",
+    "bienes": OUTPUTS_DIR / "fuentes_utiles_bienes.txt",
+}
+
+# Qué URL bajó cada archivo de FILES_DIR (la carpeta que leen los parsers):
+# si ARCA usa el mismo nombre para otro contenido, no se pisa (ver duplicados.py)
+DOCUMENTOS_JSON = FILES_DIR / "documentos.json"
+
+
+def _sin_analisis(path):
+    return None
+
+
+def descargar(categoria: str, todo: bool = False):
+    """
+    Baja los PDFs de la categoría que todavía no están en files/ (o todos con todo=True).
+    Devuelve la lista de (url, error) que no se pudieron bajar.
+    """
+    urls = [u.strip() for u in FUENTES[categoria].read_text(encoding="utf-8").splitlines() if u.strip()]
+    FILES_DIR.mkdir(parents=True, exist_ok=True)
+    documentos = IndiceDocumentos(DOCUMENTOS_JSON)
+
+    bajados, existentes, errores = [], [], []
+    for url in urls:
+        conocido = documentos.por_url(url)
+        path = FILES_DIR / (conocido["archivo"] if conocido else nombre_archivo(url))
+        if path.exists() and not todo:
+            existentes.append(path)
+            continue
+
+        try:
+            r = get(url, timeout=(10, 60))
+            r.raise_for_status()
+        except Exception as e:
+            errores.append((url, e))
+            continue
+
+        if conocido is None and path.exists() and not documentos.conoce_archivo(path.name):
+            path.unlink()   # bajado antes de que hubiera índice: es de esta URL, se reemplaza
+
+        path, _, previo = documentos.registrar_pdf(FILES_DIR, url, r.content, _sin_analisis)
+        if previo and previo["equivalencia"] == "exacta":
+            print(f"  = {url}: mismo contenido que {previo['url']} ({path.name})")
+        bajados.append(path)
+        time.sleep(REQUEST_DELAY)
+
+    documentos.guardar()
+
+    print(f"Descarga {categoria} finalizada")
+    print(f"- Descargados: {len(bajados)}")
+    print(f"- Ya estaban:  {len(existentes)}")
+    print(f"- Con error:   {len(errores)}")
+    for url, e in errores:
+        print(f"  ⚠️ {url}: {e}")
+    return errores
+
+
+if __name__ == "__main__":
+    iniciar("descargar_pdfs")
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    errores = []
+    for categoria in args or list(FUENTES):
+        errores += descargar(categoria, todo="--todo" in sys.argv)
+    if errores:
+        # que el pipeline no siga con PDFs viejos o faltantes
+        sys.exit(f"❌ {len(errores)} PDF(s) sin bajar")
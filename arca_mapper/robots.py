@@ -1,12 +1,12 @@
-import time
 import urllib.robotparser as robotparser
 from urllib.parse import urlparse
 
-from config import USER_AGENT, REQUEST_DELAY
+from config import USER_AGENT, REQUEST_DELAY, REQUEST_DELAY_MIN
+from codigo.ritmo import ControlRitmo
 
 
 class RobotsManager:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, delay: float = REQUEST_DELAY, minimo: float = REQUEST_DELAY_MIN):
         parsed = urlparse(base_url)
         self.robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
 
@@ -14,8 +14,20 @@ class RobotsManager:
         self.rp.set_url(self.robots_url)
         self.rp.read()
 
+        # arranca en `delay` y acelera hasta `minimo`, nunca más rápido de lo que pide robots.txt
+        piso = max(minimo, self.delay_robots())
+        self.ritmo = ControlRitmo(inicial=max(delay, piso), minimo=piso)
+
     def can_fetch(self, url: str) -> bool:
         return self.rp.can_fetch(USER_AGENT, url)
 
-    def wait(self):
-        time.sleep(REQUEST_DELAY)
+    def delay_robots(self) -> float:
+        """Crawl-delay / Request-rate de robots.txt para nuestro User-Agent (0 si no hay)."""
+        crawl_delay = self.rp.crawl_delay(USER_AGENT) or 0
+        rate = self.rp.request_rate(USER_AGENT)
+        por_rate = rate.seconds / rate.requests if rate and rate.requests else 0
+        return float(max(crawl_delay, por_rate))
+
+    def get(self, url: str, **kwargs):
+        """GET al ritmo del host (ver codigo/ritmo.py): None si no hubo respuesta."""
+        return self.ritmo.get(url, **kwargs)
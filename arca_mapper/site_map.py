@@ -0,0 +1,51 @@
+import json
+from collections import Counter
+
+from config import SITE_MAP_JSONL, SITE_MAP_JSON
+
+
+class EscritorSiteMap:
+    """
+    Escribe el mapa del sitio como JSON Lines a medida que se crawlea:
+    una entrada por línea, con flush, así el archivo se puede leer (o
+    resumir) mientras el crawl sigue y la memoria no crece con las páginas.
+    """
+
+    def __init__(self, path=SITE_MAP_JSONL):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.f = open(self.path, "w", encoding="utf-8")
+        self.conteo = Counter()
+
+    def agregar(self, entry: dict):
+        self.f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.f.flush()
+        if "url" in entry:   # páginas; no los registros de resumen (ej: duplicados)
+            self.conteo["total"] += 1
+            self.conteo[entry.get("type") or "otro"] += 1
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def leer_site_map(path=SITE_MAP_JSONL):
+    """
+    Entradas del mapa una por una. Una última línea cortada (crawl en curso)
+    se ignora. Si sólo existe el site_map.json de crawls viejos, se lee ese.
+    """
+    if not path.exists() and SITE_MAP_JSON.exists():
+        yield from json.loads(SITE_MAP_JSON.read_text(encoding="utf-8"))
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for linea in f:
+            if not linea.endswith("\n"):
+                break  # todavía se está escribiendo
+            if linea.strip():
+                yield json.loads(linea)
@@ -1,24 +1,27 @@
-import json
-from pathlib import Path
+from config import OUTPUT_DIR, SITE_MAP_JSONL
+from site_map import leer_site_map
 
-SITE_MAP = Path("outputs/site_map.json")
-OUTPUT = Path("outputs/fuentes_utiles.txt")
+OUTPUT = OUTPUT_DIR / "fuentes_utiles.txt"
 
-with SITE_MAP.open(encoding="utf-8") as f:
-    data = json.load(f)
-
-lines = []
+# el mapa se recorre línea a línea y cada fuente se escribe al toque:
+# sirve también sobre un site_map.jsonl que el crawler todavía está llenando
+out = OUTPUT.open("w", encoding="utf-8")
+fuentes = 0
 
 def add(title, url, tipo, aporta):
-    lines.append(f"FUENTE: {title}")
-    lines.append(f"URL: {url}")
-    lines.append(f"TIPO: {tipo}")
-    lines.append("DATOS QUE APORTA:")
-    for a in aporta:
-        lines.append(f"- {a}")
-    lines.append("-" * 60)
+    global fuentes
+    lines = [
+        f"FUENTE: {title}",
+        f"URL: {url}",
+        f"TIPO: {tipo}",
+        "DATOS QUE APORTA:",
+        *(f"- {a}" for a in aporta),
+        "-" * 60,
+    ]
+    out.write(("\n" if fuentes else "") + "\n".join(lines))
+    fuentes += 1
 
-for entry in data:
+for entry in leer_site_map(SITE_MAP_JSONL):
     url = entry.get("url", "")
     tipo = entry.get("type")
 
@@ -72,7 +75,7 @@ for entry in data:
             ],
         )
 
-OUTPUT.write_text("\n".join(lines), encoding="utf-8")
+out.close()
 
-print("Resumen de fuentes generado:")
+print(f"Resumen de fuentes generado ({fuentes} fuentes):")
 print(OUTPUT)
@@ -0,0 +1,53 @@
+"""
+Benchmark del motor de Bienes Personales a escala cartera (100k contribuyentes).
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_bienes_personales [N]
+"""
+import sys
+import time
+
+import numpy as np
+
+from codigo.benchmarks.parametros_2024 import (
+    ANIO, PARAMETROS, MINIMO_NO_IMPONIBLE, BP_GENERAL, BP_CUMPLIDORES,
+)
+from codigo.calculators.bienes_personales import calcular_bp
+
+
+def _escalar(valor, cumplidor):
+    """Referencia: cálculo fila por fila como en la planilla."""
+    base = max(valor - MINIMO_NO_IMPONIBLE, 0.0)
+    filas = BP_CUMPLIDORES if cumplidor else BP_GENERAL
+    for desde, hasta, fijo, pct, exced in filas:
+        if hasta is None or base <= hasta:
+            return (fijo or 0.0) + (base - (exced or 0.0)) * pct / 100
+    return 0.0
+
+
+def main(n: int = 100_000):
+    rng = np.random.default_rng(42)
+    valores = rng.lognormal(mean=19.5, sigma=1.2, size=n)
+    cumplidores = rng.random(n) < 0.3
+
+    calcular_bp(valores[:10], cumplidores[:10], ANIO, PARAMETROS)  # warm-up
+
+    t0 = time.perf_counter()
+    impuesto = calcular_bp(valores, cumplidores, ANIO, PARAMETROS)
+    t_vec = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ref = [_escalar(v, c) for v, c in zip(valores.tolist(), cumplidores.tolist())]
+    t_esc = time.perf_counter() - t0
+
+    diff = float(np.max(np.abs(impuesto - np.array(ref))))
+
+    print(f"Contribuyentes:  {n:,}")
+    print(f"Vectorizado:     {t_vec * 1000:8.2f} ms  ({n / t_vec:,.0f} contrib/s)")
+    print(f"Fila por fila:   {t_esc * 1000:8.2f} ms  ({n / t_esc:,.0f} contrib/s)")
+    print(f"Speedup:         {t_esc / t_vec:8.1f}x")
+    print(f"Dif. máx. vs ref: {diff:.6f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
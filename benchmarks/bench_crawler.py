@@ -0,0 +1,109 @@
+"""
+Prueba de carga de los crawlers contra el ARCA local (servidor_arca.py):
+corre arca_mapper/crawler.py, crawler_dirigido.py y arca_explorer/explorer.py
+apuntados con ARCA_BASE_URL y mide, del lado del servidor, páginas/s,
+espaciado entre requests y si respetan robots.txt.
+
+Cada cliente corre en un subproceso dentro de una carpeta temporal (sus
+outputs no tocan el repo).
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_crawler [--solo crawler] [--errores 0.05] [--lentas 0.05] [--salida JSON]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from codigo.benchmarks.servidor_arca import argumentos_sitio, servidor, sitio_desde_args
+from codigo.paths import OUTPUTS_DIR
+
+REPO_DIR = Path(__file__).resolve().parents[1]
+RESULTADOS_DIR = OUTPUTS_DIR / "benchmarks"
+
+CLIENTES = {
+    "crawler": [REPO_DIR / "arca_mapper" / "crawler.py"],
+    "crawler_dirigido": [REPO_DIR / "arca_mapper" / "crawler_dirigido.py"],
+    "explorer": [REPO_DIR / "arca_explorer" / "explorer.py", "--year", "bench"],
+}
+
+
+def correr_cliente(nombre: str, url: str, tmp: Path, timeout: int):
+    """Corre el cliente en tmp/<nombre> → (segundos, returncode, cola de stderr)."""
+    cwd = tmp / nombre
+    cwd.mkdir()
+    env = {
+        **os.environ,
+        "ARCA_BASE_URL": url,
+        "ARCA_REQUEST_DELAY": "0",        # que mande robots.txt
+        "ARCA_EXPLORER_DIR": str(cwd),
+        "IMPUESTOS_INDICE_DB": str(cwd / "indice_texto.sqlite"),
+    }
+    t0 = time.perf_counter()
+    r = subprocess.run(
+        [sys.executable, *map(str, CLIENTES[nombre])],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=timeout,
+    )
+    return time.perf_counter() - t0, r.returncode, r.stderr[-2000:]
+
+
+def _fmt(x, fmt="{:.3f}"):
+    return "-" if x is None else fmt.format(x)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga de los crawlers contra el ARCA local")
+    argumentos_sitio(parser)
+    parser.add_argument("--solo", choices=list(CLIENTES), action="append", help="clientes a correr (default: todos)")
+    parser.add_argument("--timeout", type=int, default=600, help="segundos máximos por cliente")
+    parser.add_argument("--salida", type=Path, default=None, help="JSON de resultados (default: outputs/benchmarks/)")
+    args = parser.parse_args()
+
+    sitio = sitio_desde_args(args)
+    resultado = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "sitio": {
+            "rutas": len(sitio.archivos),
+            "robots": sitio.robots.decode(),
+            "lentas": args.lentas,
+            "demora": args.demora,
+            "errores": args.errores,
+        },
+        "clientes": {},
+    }
+
+    print(f"{'CLIENTE':18} {'SEG':>7} {'PÁG':>5} {'PÁG/S':>7} {'ESP MIN':>8} {'ESP P50':>8} "
+          f"{'VIOL ESP':>8} {'VIOL ROBOTS':>11} STATUS")
+
+    with tempfile.TemporaryDirectory() as tmp, servidor(sitio) as (url, _):
+        for nombre in args.solo or CLIENTES:
+            sitio.reiniciar()
+            segundos, rc, stderr = correr_cliente(nombre, url, Path(tmp), args.timeout)
+            stats = sitio.estadisticas()
+            stats.update({"segundos_cliente": segundos, "returncode": rc})
+            if rc != 0:
+                stats["stderr"] = stderr
+            resultado["clientes"][nombre] = stats
+
+            marca = "✅" if rc == 0 and stats["robots_leido"] and not stats["violaciones_robots"] \
+                and not stats["violaciones_espaciado"] else "⚠️"
+            print(f"{nombre:18} {segundos:7.1f} {stats['paginas']:5d} {_fmt(stats['paginas_por_seg'], '{:.1f}'):>7} "
+                  f"{_fmt(stats['espaciado_min']):>8} {_fmt(stats['espaciado_p50']):>8} "
+                  f"{stats['violaciones_espaciado']:8d} {stats['violaciones_robots']:11d} "
+                  f"{marca} {stats['por_status']}")
+            if rc != 0:
+                print(f"   ❌ rc={rc}: {stderr.strip().splitlines()[-1] if stderr.strip() else ''}")
+
+    salida = args.salida or RESULTADOS_DIR / f"crawler_{datetime.now():%Y%m%d_%H%M%S}.json"
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    salida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(salida.resolve())
+
+
+if __name__ == "__main__":
+    main()
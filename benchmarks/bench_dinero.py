@@ -0,0 +1,72 @@
+"""
+Benchmark de representación de montos: float vs int64 (centavos) vs Decimal,
+liquidando Ganancias (Art. 30 + Art. 94) para 1 millón de contribuyentes.
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_dinero [N]
+"""
+import sys
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+import numpy as np
+
+from codigo.benchmarks.parametros_2024 import ANIO, PARAMETROS, GAN_ART94, GAN_DEDUCCIONES
+from codigo.calculators.ganancias import liquidar_ganancias
+from codigo.normalizers.utils import formatear_centavos
+
+CENT = Decimal("0.01")
+MUESTRA_DECIMAL = 100_000
+
+
+def _decimal(bruto_cent):
+    """Referencia exacta con Decimal, fila por fila, redondeando cada impuesto al centavo."""
+    gni = Decimal(str(GAN_DEDUCCIONES["ganancia_no_imponible"]))
+    tramos = [
+        (Decimal(str(d)), Decimal(str(h)) if h is not None else None, Decimal(str(f)), Decimal(p) / 100, Decimal(str(e)))
+        for d, h, f, p, e in GAN_ART94
+    ]
+    out = []
+    for cent in bruto_cent:
+        neta = max(Decimal(cent) / 100 - gni, Decimal(0))
+        for desde, hasta, fijo, tasa, exced in tramos:
+            if hasta is None or neta <= hasta:
+                out.append((fijo + (neta - exced) * tasa).quantize(CENT, ROUND_HALF_UP))
+                break
+    return out
+
+
+def main(n: int = 1_000_000):
+    rng = np.random.default_rng(42)
+    bruto_cent = rng.integers(1_000_000_00, 150_000_000_00, size=n, dtype=np.int64)
+    bruto_float = bruto_cent / 100
+
+    t0 = time.perf_counter()
+    imp_float = liquidar_ganancias(bruto_float, ANIO, parametros=PARAMETROS)["impuesto"]
+    t_float = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    imp_cent = liquidar_ganancias(bruto_cent, ANIO, parametros=PARAMETROS, centavos=True)["impuesto"]
+    t_cent = time.perf_counter() - t0
+
+    m = min(n, MUESTRA_DECIMAL)
+    t0 = time.perf_counter()
+    imp_dec = _decimal(bruto_cent[:m].tolist())
+    t_dec = (time.perf_counter() - t0) * n / m
+
+    total_dec = sum(imp_dec)
+    total_cent = int(imp_cent[:m].sum())
+    total_float = float(imp_float[:m].sum())
+
+    print(f"Contribuyentes:   {n:,}  (Decimal sobre {m:,}, extrapolado)")
+    print(f"float64:          {t_float * 1000:9.1f} ms")
+    print(f"int64 centavos:   {t_cent * 1000:9.1f} ms")
+    print(f"Decimal:          {t_dec * 1000:9.1f} ms")
+    print()
+    print(f"Total Decimal:    {total_dec}")
+    print(f"Total centavos:   {formatear_centavos(total_cent)}  (dif. {total_cent - int(total_dec * 100)} cent.)")
+    print(f"Total float:      {total_float:,.6f}  (dif. {total_float - float(total_dec):+.6f})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,55 @@
+"""
+Benchmark del inventario de Bienes Personales (1 millón de bienes).
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_inventario_bp [N_BIENES]
+"""
+import sys
+import time
+
+import numpy as np
+
+from codigo.benchmarks.parametros_2024 import ANIO, PARAMETROS
+from codigo.calculators.bienes_personales import calcular_bp
+from codigo.calculators.inventario_bp import RUBROS, agregar_inventario
+
+# cotizaciones comprador 31/12/2024 (raw_monedas_2024.json)
+COTIZACIONES = [
+    ("USD", "DIVISA", 1029.0),
+    ("USD", "BILLETE", 1012.5),
+    ("EUR", "DIVISA", 1068.6165),
+    ("BRL", "BILLETE", 170.75),
+]
+PARAMETROS_MONEDAS = PARAMETROS + [
+    {"concepto": f"BP_MONEDA_{cod}_{tipo}_COMP_31_12", "anio": ANIO, "valor_num": v}
+    for cod, tipo, v in COTIZACIONES
+]
+
+
+def main(n: int = 1_000_000):
+    rng = np.random.default_rng(42)
+    contribuyentes = max(n // 10, 1)
+
+    ids = rng.integers(20_000_000_000, 20_000_000_000 + contribuyentes, size=n)
+    rubro = rng.choice(RUBROS, size=n)
+    extranjera = rng.random(n) < 0.2
+    moneda = np.where(extranjera, rng.choice(["USD", "EUR"], size=n), "ARS")
+    monto = np.where(extranjera, rng.lognormal(10, 1.5, size=n), rng.lognormal(17, 1.5, size=n))
+
+    t0 = time.perf_counter()
+    base = agregar_inventario(ids, rubro, monto, ANIO, moneda, "DIVISA", parametros=PARAMETROS_MONEDAS)
+    t_agg = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    calcular_bp(base["gravado"], False, ANIO, PARAMETROS_MONEDAS)
+    t_bp = time.perf_counter() - t0
+
+    print(f"Bienes:            {n:,}")
+    print(f"Contribuyentes:    {len(base['contribuyente']):,}")
+    print(f"Agregación:        {t_agg * 1000:8.1f} ms  ({n / t_agg:,.0f} bienes/s)")
+    print(f"Impuesto BP:       {t_bp * 1000:8.1f} ms")
+    print(f"Exento / total:    {base['exento'].sum() / base['total'].sum():.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
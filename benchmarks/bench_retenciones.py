@@ -0,0 +1,70 @@
+"""
+Benchmark del simulador de retenciones mensuales (10k empleados × 12 meses).
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_retenciones [N]
+"""
+import sys
+import time
+
+import numpy as np
+
+from codigo.benchmarks.parametros_2024 import ANIO, PARAMETROS, GAN_ART94, GAN_DEDUCCIONES
+from codigo.calculators.retenciones import simular_retenciones
+
+
+def _escalar(fila, conyuge, hijos):
+    """Referencia: mes a mes con la escala prorrateada explícitamente (como la planilla)."""
+    anual = (
+        GAN_DEDUCCIONES["ganancia_no_imponible"]
+        + GAN_DEDUCCIONES["deduccion_especial_ap2"]
+        + conyuge * GAN_DEDUCCIONES["cargas_familia_conyuge"]
+        + hijos * GAN_DEDUCCIONES["cargas_familia_hijo"]
+    )
+    acumulado, anterior, out = 0.0, 0.0, []
+    for m, bruto in enumerate(fila, start=1):
+        f = m / 12
+        acumulado += bruto
+        neta = max(acumulado - anual * f, 0.0)
+        impuesto = 0.0
+        for desde, hasta, fijo, pct, exced in GAN_ART94:
+            if hasta is None or neta <= hasta * f:
+                impuesto = fijo * f + (neta - exced * f) * pct / 100
+                break
+        out.append(impuesto - anterior)
+        anterior = impuesto
+    return out
+
+
+def main(n: int = 10_000):
+    rng = np.random.default_rng(42)
+    sueldo = rng.lognormal(mean=14.8, sigma=0.6, size=(n, 1))
+    bruto = np.repeat(sueldo, 12, axis=1)
+    bruto[:, 5] *= 1.5   # aguinaldo junio
+    bruto[:, 11] *= 1.5  # aguinaldo diciembre
+    conyuge = rng.random(n) < 0.4
+    hijos = rng.integers(0, 4, size=n)
+
+    kwargs = dict(conyuge=conyuge, hijos=hijos, deduccion_especial="ap2", parametros=PARAMETROS)
+    simular_retenciones(bruto[:10], ANIO, **{**kwargs, "conyuge": conyuge[:10], "hijos": hijos[:10]})
+
+    t0 = time.perf_counter()
+    res = simular_retenciones(bruto, ANIO, **kwargs)
+    t_vec = time.perf_counter() - t0
+
+    muestra = min(n, 2_000)
+    t0 = time.perf_counter()
+    ref = [_escalar(bruto[i].tolist(), bool(conyuge[i]), int(hijos[i])) for i in range(muestra)]
+    t_esc = (time.perf_counter() - t0) * n / muestra
+
+    diff = float(np.max(np.abs(res["retencion"][:muestra] - np.array(ref))))
+
+    print(f"Empleados × meses: {n:,} × 12")
+    print(f"Vectorizado:       {t_vec * 1000:8.2f} ms")
+    print(f"Mes a mes (est.):  {t_esc * 1000:8.2f} ms")
+    print(f"Speedup:           {t_esc / t_vec:8.1f}x")
+    print(f"Dif. máx. vs ref:  {diff:.6f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
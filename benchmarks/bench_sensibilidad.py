@@ -0,0 +1,42 @@
+"""
+Benchmark del barrido de sensibilidad (grilla de ~3 millones de puntos).
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_sensibilidad [N_BRUTOS] [SALIDA.csv|.parquet]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from codigo.benchmarks.parametros_2024 import ANIO, PARAMETROS
+from codigo.calculators.sensibilidad import barrido, exportar_barrido
+
+
+def main(n_brutos: int = 75_000, salida: Path = None):
+    brutos = np.linspace(1_000_000, 150_000_000, n_brutos)
+    hijos = range(5)
+    conyuge = (False, True)
+    especial = ("", "ap1", "ap1_nuevo", "ap2")
+
+    t0 = time.perf_counter()
+    res = barrido(brutos, ANIO, hijos, conyuge, especial, parametros=PARAMETROS)
+    t_calc = time.perf_counter() - t0
+
+    puntos = res["impuesto"].size
+    print(f"Puntos de grilla: {puntos:,} {res['impuesto'].shape}")
+    print(f"Cálculo:          {t_calc * 1000:8.1f} ms  ({puntos / t_calc:,.0f} puntos/s)")
+
+    if salida:
+        t0 = time.perf_counter()
+        exportar_barrido(res, salida)
+        t_exp = time.perf_counter() - t0
+        print(f"Export {salida.suffix}:    {t_exp:8.1f} s   ({puntos / t_exp:,.0f} filas/s)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 75_000,
+        Path(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,353 @@
+"""
+Suite de benchmarks de la parte de extracción: limpieza de números, análisis
+de HTML/PDF del crawler, cada parser, el excel_loader sobre un libro grande y
+el arranque en frío (proceso nuevo) del CLI y de los módulos pesados.
+
+Usa los fixtures versionados de benchmarks/fixtures (HTML de ARCA y PDFs
+chicos con la forma de los documentos reales); los parsers HTML se sirven
+desde un http.server local, sin salir a internet.
+
+Escribe un JSON con ops/s y pico de memoria (tracemalloc) por caso, para
+comparar dos corridas con --comparar.
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.bench_suite [--solo PATRON] [--salida JSON] [--comparar JSON]
+"""
+import argparse
+import contextlib
+import functools
+import http.server
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from codigo.benchmarks.parametros_2024 import PARAMETROS
+from codigo.paths import OUTPUTS_DIR
+
+REPO_DIR = Path(__file__).resolve().parents[1]
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+RESULTADOS_DIR = OUTPUTS_DIR / "benchmarks"
+
+MIN_SEG = 1.0           # tiempo mínimo medido por caso
+FILAS_EXCEL = 5_000     # filas de Parametros_ARCA en el libro sintético
+HOJAS_CLIENTES = 3      # hojas extra (el libro "CH - Anuales" tiene muchas)
+FILAS_CLIENTE = 2_000
+
+
+# ==========================
+# MEDICIÓN
+# ==========================
+
+def medir(fn, setup=None, ops_por_llamada: int = 1, min_seg: float = MIN_SEG):
+    """
+    Corre fn hasta juntar min_seg de tiempo medido (setup no cuenta).
+    El pico de memoria se toma en una corrida aparte con tracemalloc.
+    """
+    if setup:
+        setup()
+    fn()  # calentamiento
+
+    llamadas, total = 0, 0.0
+    while total < min_seg:
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        total += time.perf_counter() - t0
+        llamadas += 1
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ops = llamadas * ops_por_llamada
+    return {
+        "ops_por_seg": ops / total,
+        "seg_por_op": total / ops,
+        "ops": ops,
+        "segundos": total,
+        "pico_memoria_kb": pico / 1024,
+    }
+
+
+@contextlib.contextmanager
+def _silencio():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@contextlib.contextmanager
+def servidor_fixtures():
+    """http.server local con los fixtures; devuelve la URL base."""
+    handler = functools.partial(_HandlerSilencioso, directory=str(FIXTURES_DIR))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    hilo = threading.Thread(target=server.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _HandlerSilencioso(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+# ==========================
+# DATOS
+# ==========================
+
+def muestras_numeros(n: int = 2_000, seed: int = 7):
+    """Textos como los que salen de pdfplumber: montos sanos, con espacios/puntos de más y basura."""
+    rng = random.Random(seed)
+    crudos = [
+        "3.503.688,17", ".53.688,17", ".28.17,6", "16.817.73,2", "12.262.938,63", "1.360.200,00",
+        "10.928,00", "6.120.00,00", ".78.767,25", "41.316.075,00", "0,00", "5.709.439,50",
+        "$ 292.994.964,89", "0,50%", "en adelante", "-", "113.643,398800",
+    ]
+    out = []
+    for _ in range(n):
+        base = rng.choice(crudos)
+        r = rng.random()
+        if r < 0.3:
+            base = base.replace(".", ". ", 1)
+        elif r < 0.4:
+            base = " " + base.replace(",", " ,")
+        elif r < 0.5:
+            base = f"{rng.randint(1, 99_999_999):,}".replace(",", ".") + f",{rng.randint(0, 99):02d}"
+        out.append(base)
+    return out
+
+
+def libro_sintetico(path: Path, filas: int = FILAS_EXCEL):
+    """Libro con Parametros_ARCA de `filas` filas + hojas de clientes."""
+    from openpyxl import Workbook
+
+    import codigo.excel_loader as excel_loader
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = excel_loader.SHEET_NAME
+    headers = list(excel_loader.HEADER_MAP.values())
+    ws.append(headers)
+    for i in range(filas):
+        p = PARAMETROS[i % len(PARAMETROS)]
+        anio = 1900 + i // len(PARAMETROS)
+        ws.append([{**p, "anio": anio}.get(k) for k in excel_loader.HEADER_MAP])
+
+    for h in range(HOJAS_CLIENTES):
+        hoja = wb.create_sheet(f"Cliente {h + 1}")
+        for r in range(FILAS_CLIENTE):
+            hoja.append([r, f"Bien {r}", r * 1_234.5, "ARS", None, "texto libre"])
+
+    wb.save(path)
+
+    # JSON con las mismas filas, 1% modificadas y 1% nuevas
+    rng = random.Random(3)
+    data = []
+    for i in range(filas):
+        p = dict(PARAMETROS[i % len(PARAMETROS)])
+        p["anio"] = 1900 + i // len(PARAMETROS)
+        if rng.random() < 0.01:
+            p["fuente"] = "ARCA (actualizado)"
+        data.append(p)
+    for i in range(filas // 100):
+        p = dict(PARAMETROS[i % len(PARAMETROS)])
+        p["anio"] = 3000 + i
+        data.append(p)
+    return data
+
+
+# ==========================
+# CASOS
+# ==========================
+
+def casos(tmp: Path, url_base: str):
+    """nombre → (fn, setup, ops_por_llamada). Importa lo necesario recién acá."""
+    sys.path.insert(0, str(REPO_DIR / "arca_mapper"))
+    import analyzer  # arca_mapper usa imports planos (from config import ...)
+
+    import codigo.numeros as numeros
+    import codigo.parsers.parse_art30_raw as art30
+    import codigo.parsers.parse_bienes_alicuotas_html_raw as alicuotas
+    import codigo.parsers.parse_bp_determinativa_html_raw as determinativa
+    import codigo.parsers.parse_escalas_art94_raw as art94
+    import codigo.parsers.parse_monedas_extranjeras_raw as monedas
+
+    # parsers apuntando a fixtures / tmp
+    for mod in (art30, art94, monedas):
+        mod.FILES_DIR = FIXTURES_DIR
+        mod.OUTPUTS_DIR = tmp
+    alicuotas.URL = f"{url_base}/alicuotas.html"
+    alicuotas.OUT = tmp / "raw_bienes_alicuotas_all.json"
+    determinativa.URL = f"{url_base}/determinativa.html"
+    determinativa.OUT = tmp / "raw_bp_determinativa.json"
+
+    muestras = muestras_numeros()
+    htmls = [
+        ((FIXTURES_DIR / nombre).read_text(encoding="utf-8"), f"https://www.arca.gob.ar/{nombre}")
+        for nombre in ("alicuotas.html", "determinativa.html", "ganancias_y_bienes.html")
+    ]
+    pdfs = sorted(FIXTURES_DIR.glob("*.pdf"))
+
+    def _todos(fn, valores):
+        def correr():
+            for v in valores:
+                fn(v)
+        return correr
+
+    def _silencioso(fn, *args):
+        def correr():
+            with _silencio():
+                fn(*args)
+        return correr
+
+    def _limpiar_caches(*fns):
+        def setup():
+            for f in fns:
+                f.cache_clear()
+        return setup
+
+    # excel_loader.main() sobre una copia fresca del libro sintético
+    import codigo.excel_loader as excel_loader
+
+    libro_base = tmp / "libro_base.xlsx"
+    libro = tmp / "libro.xlsx"
+    json_excel = tmp / "parametros_excel.json"
+    json_excel.write_text(json.dumps(libro_sintetico(libro_base), ensure_ascii=False), encoding="utf-8")
+
+    def _excel(*extra):
+        def correr():
+            sys.argv, argv_previo = ["excel_loader", "--excel", str(libro), "--parametros", str(json_excel), *extra], sys.argv
+            try:
+                with _silencio():
+                    excel_loader.main()
+            finally:
+                sys.argv = argv_previo
+        return correr
+
+    def _copiar_libro():
+        shutil.copyfile(libro_base, libro)
+
+    # arranque en frío: `codigo` importable desde donde lo importó este proceso
+    raiz = str(Path(sys.modules["codigo"].__path__[0]).parent)
+    env = {**os.environ, "PYTHONPATH": raiz}
+
+    def _arranque(*args):
+        def correr():
+            subprocess.run([sys.executable, *args], cwd=tmp, env=env, capture_output=True, check=True)
+        return correr
+
+    libro_al_dia = tmp / "libro_al_dia.xlsx"
+
+    def _preparar_al_dia():
+        if not libro_al_dia.exists():
+            _copiar_libro()
+            _excel()()
+            shutil.copyfile(libro, libro_al_dia)
+        shutil.copyfile(libro_al_dia, libro)
+
+    return {
+        "clean_number_art30": (_todos(art30.clean_number, muestras), _limpiar_caches(art30.clean_number), len(muestras)),
+        "clean_number_art94": (_todos(art94.clean_number, muestras), _limpiar_caches(art94.clean_number), len(muestras)),
+        "to_number": (_todos(numeros.to_number, muestras), _limpiar_caches(numeros._parse_str), len(muestras)),
+        "parse_batch": (lambda: numeros.parse_batch(muestras), _limpiar_caches(numeros._parse_str), len(muestras)),
+        "analyze_html": (lambda: [analyzer.analyze_html(h, u) for h, u in htmls], None, len(htmls)),
+        "analyze_pdf": (lambda: [analyzer.analyze_pdf(p) for p in pdfs], None, len(pdfs)),
+        "parse_art30": (_silencioso(art30.parse, 2024), None, 1),
+        "parse_art94": (_silencioso(art94.parse, 2024), None, 1),
+        "parse_monedas": (_silencioso(monedas.parse, 2024), None, 1),
+        "parse_bp_alicuotas": (_silencioso(alicuotas.parse), None, 1),
+        "parse_bp_determinativa": (_silencioso(determinativa.parse), None, 1),
+        "excel_loader_main": (_excel(), _copiar_libro, 1),
+        "excel_loader_sync_sin_cambios": (_excel("--sync"), _preparar_al_dia, 1),
+        "arranque_python": (_arranque("-c", "pass"), None, 1),
+        "arranque_cli_help": (_arranque("-m", "codigo.cli", "--help"), None, 1),
+        "arranque_cli_parse_help": (_arranque("-m", "codigo.cli", "parse", "--help"), None, 1),
+        "import_numeros": (_arranque("-c", "import codigo.numeros"), None, 1),
+        "import_parse_art30": (_arranque("-c", "import codigo.parsers.parse_art30_raw"), None, 1),
+        "import_normalize_all": (_arranque("-c", "import codigo.normalizers.normalize_all"), None, 1),
+        "import_excel_loader": (_arranque("-c", "import codigo.excel_loader"), None, 1),
+    }
+
+
+# ==========================
+# RESULTADOS
+# ==========================
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def comparar(anterior: dict, actual: dict):
+    print()
+    print(f"{'CASO':32} {'ANTES ops/s':>14} {'AHORA ops/s':>14} {'×':>7} {'MEM KB antes→ahora':>22}")
+    for nombre, r in actual["casos"].items():
+        a = anterior.get("casos", {}).get(nombre)
+        if a is None:
+            print(f"{nombre:32} {'-':>14} {r['ops_por_seg']:14,.1f}")
+            continue
+        ratio = r["ops_por_seg"] / a["ops_por_seg"]
+        marca = "🟢" if ratio >= 1.05 else "🔴" if ratio <= 0.95 else "  "
+        print(f"{nombre:32} {a['ops_por_seg']:14,.1f} {r['ops_por_seg']:14,.1f} {ratio:6.2f}{marca} "
+              f"{a['pico_memoria_kb']:10,.0f} → {r['pico_memoria_kb']:,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de parsers, limpieza de números, HTML/PDF y excel_loader")
+    parser.add_argument("--solo", default=None, help="sólo los casos cuyo nombre contiene este texto")
+    parser.add_argument("--min-seg", type=float, default=MIN_SEG, help="tiempo mínimo medido por caso")
+    parser.add_argument("--salida", type=Path, default=None, help="JSON de resultados (default: outputs/benchmarks/)")
+    parser.add_argument("--comparar", type=Path, default=None, help="JSON de una corrida anterior")
+    args = parser.parse_args()
+
+    resultado = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "min_seg": args.min_seg,
+        "casos": {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp, servidor_fixtures() as url_base:
+        for nombre, (fn, setup, ops) in casos(Path(tmp), url_base).items():
+            if args.solo and args.solo not in nombre:
+                continue
+            r = medir(fn, setup, ops, args.min_seg)
+            resultado["casos"][nombre] = r
+            print(f"{nombre:32} {r['ops_por_seg']:14,.1f} ops/s  {r['seg_por_op'] * 1e3:10.3f} ms/op  "
+                  f"pico {r['pico_memoria_kb']:10,.0f} KB")
+
+    salida = args.salida or RESULTADOS_DIR / f"suite_{datetime.now():%Y%m%d_%H%M%S}.json"
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    salida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(salida.resolve())
+
+    if args.comparar:
+        comparar(json.loads(args.comparar.read_text(encoding="utf-8")), resultado)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Genera los fixtures de la suite de benchmarks a partir de los raw de outputs/:
+páginas HTML con la estructura de las de ARCA y PDFs chicos con la forma de
+los documentos Art. 30, Art. 94 y Moneda Extranjera.
+
+Los archivos generados se versionan; este script sólo hace falta para
+rearmarlos.
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.benchmarks.fixtures.generar_fixtures
+"""
+import json
+from html import escape
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent
+RAW_DIR = FIXTURES_DIR.parents[1] / "outputs"
+
+ANIO = 2024
+
+PDF_ART30 = FIXTURES_DIR / f"Deducciones-personales-art-30-liquidacion-anual-{ANIO}.pdf"
+PDF_ART94 = FIXTURES_DIR / f"Tabla-art-94-liquidacion-anual-final-{ANIO}.pdf"
+PDF_MONEDAS = FIXTURES_DIR / f"Valuaciones-{ANIO}-Moneda-Extranjera.pdf"
+HTML_ALICUOTAS = FIXTURES_DIR / "alicuotas.html"
+HTML_DETERMINATIVA = FIXTURES_DIR / "determinativa.html"
+HTML_INDICE = FIXTURES_DIR / "ganancias_y_bienes.html"
+
+ART30_CONCEPTOS = [
+    ("Ganancia no imponible", "ganancia_no_imponible"),
+    ("Cargas de familia - Cónyuge", "cargas_familia_conyuge"),
+    ("Cargas de familia - Hijo", "cargas_familia_hijo"),
+    ("Cargas de familia - Hijo incapacitado para el trabajo", "cargas_familia_hijo_incapaz"),
+    ("Deducción especial - Apartado 1", "deduccion_especial_ap1"),
+    ("Deducción especial - Apartado 1 (nuevos profesionales)", "deduccion_especial_ap1_nuevo"),
+    ("Deducción especial - Apartado 2", "deduccion_especial_ap2"),
+]
+
+
+# ==========================
+# PDF mínimo (una página, Helvetica, sin dependencias)
+# ==========================
+
+def _esc_pdf(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def pdf_bytes(textos, lineas=()):
+    """textos: [(x, y, texto)], lineas: [(x1, y1, x2, y2)] → PDF A4 de una página."""
+    ops = [f"{x1} {y1} m {x2} {y2} l S" for x1, y1, x2, y2 in lineas]
+    ops += [f"BT /F1 9 Tf {x} {y} Td ({_esc_pdf(t)}) Tj ET" for x, y, t in textos]
+    contenido = "\n".join(ops).encode("cp1252")
+
+    objetos = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R"
+        b" /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(contenido) + contenido + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objetos, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objetos) + 1)
+    for o in offsets:
+        out += b"%010d 00000 n \n" % o
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objetos) + 1, xref)
+    return bytes(out)
+
+
+def _tabla(x0, y0, filas, anchos, alto=16):
+    """Grilla con bordes (pdfplumber la detecta como tabla)."""
+    xs = [x0]
+    for a in anchos:
+        xs.append(xs[-1] + a)
+    lineas = [(x0, y0 - r * alto, xs[-1], y0 - r * alto) for r in range(len(filas) + 1)]
+    lineas += [(x, y0, x, y0 - len(filas) * alto) for x in xs]
+    textos = [
+        (xs[c] + 3, y0 - (r + 1) * alto + 5, txt)
+        for r, fila in enumerate(filas) for c, txt in enumerate(fila)
+    ]
+    return textos, lineas
+
+
+def pdf_art30(raw):
+    textos = [
+        (50, 800, f"DEDUCCIONES PERSONALES - ARTICULO 30 - PERIODO FISCAL {ANIO}"),
+        (50, 785, "Importes anuales en pesos para la liquidación anual"),
+    ]
+    for i, (titulo, clave) in enumerate(ART30_CONCEPTOS):
+        textos.append((50, 750 - i * 22, titulo))
+        textos.append((420, 750 - i * 22, f"$ {raw['items'][clave]}"))
+    return pdf_bytes(textos)
+
+
+def pdf_art94(raw):
+    textos = [
+        (50, 800, f"ARTICULO 94 - ESCALA DEL IMPUESTO - PERIODO FISCAL {ANIO}"),
+        (50, 785, "Ganancia neta imponible acumulada   Pagarán   Más el %   Sobre el excedente de"),
+    ]
+    for i, t in enumerate(raw):
+        y = 760 - i * 20
+        if t["hasta"] == "en adelante":
+            celdas = [t["desde"], t["monto_fijo"], t["excedente_desde"], t["porcentaje"]]
+            xs = [50, 250, 350, 500]
+        else:
+            celdas = [t["desde"], t["hasta"], t["monto_fijo"], t["excedente_desde"], t["porcentaje"]]
+            xs = [50, 150, 250, 350, 500]
+        textos += [(x, y, c) for x, c in zip(xs, celdas)]
+    return pdf_bytes(textos)
+
+
+def pdf_monedas(raw):
+    textos, lineas = [(40, 815, f"VALUACIONES AL 31/12/{ANIO} - MONEDA EXTRANJERA")], []
+    y0 = 800
+    for tipo in ("divisas", "billetes"):
+        filas = [["MONEDA", "COMPRADOR", "VENDEDOR"]]
+        filas += [[d["descripcion"], d["comprador"] or "", d["vendedor"] or ""] for d in raw[tipo]]
+        t, l = _tabla(40, y0, filas, [250, 120, 120], alto=14)
+        textos += t
+        lineas += l
+        y0 -= len(filas) * 14 + 30
+    return pdf_bytes(textos, lineas)
+
+
+# ==========================
+# HTML
+# ==========================
+
+def _desmojibake(s: str) -> str:
+    """Los raw se guardaron con el encoding mal detectado ("PagarÃ¡n")."""
+    try:
+        return s.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return s
+
+
+NAV = [
+    ("/gananciasYBienes/", "Ganancias y Bienes Personales"),
+    ("/gananciasYBienes/ganancias/", "Ganancias"),
+    ("/gananciasYBienes/bienes-personales/", "Bienes Personales"),
+    ("/gananciasYBienes/bienes-personales/conceptos-basicos/alicuotas.asp", "Alícuotas"),
+    ("/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp", "Declaración jurada determinativa"),
+]
+
+
+def pagina(titulo, cuerpo):
+    nav = "\n".join(f'      <li><a href="{href}">{escape(txt)}</a></li>' for href, txt in NAV)
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+  <meta charset="utf-8">
+  <title>{escape(titulo)} | ARCA</title>
+</head>
+<body>
+  <header>
+    <ul>
+{nav}
+    </ul>
+  </header>
+  <main>
+    <section>
+      <div>
+        <div>
+          <article>
+{cuerpo}
+          </article>
+        </div>
+      </div>
+    </section>
+  </main>
+  <footer>
+    <h2>Footer ARCA</h2>
+    <ul>
+      <li><a href="/institucional/">Institucional</a></li>
+      <li><a href="/denuncias/">Denuncias</a></li>
+      <li><a href="/contactos/">Contactos</a></li>
+    </ul>
+  </footer>
+</body>
+</html>
+"""
+
+
+def html_alicuotas(raw):
+    bloques = ["<h1>Alícuotas</h1>"]
+    titulos = [
+        f"Escala general - período {ANIO}",
+        f"Contribuyentes cumplidores - período {ANIO}",
+        f"Escala general - período {ANIO - 1}",
+        f"Contribuyentes cumplidores - período {ANIO - 1}",
+    ]
+    for tabla, titulo in zip(raw["tablas"], titulos):
+        filas = []
+        for i, fila in enumerate(tabla["rows"]):
+            tag = "th" if i < 2 else "td"
+            celdas = "".join(f"<{tag}>{escape(_desmojibake(c))}</{tag}>" for c in fila)
+            filas.append(f"<tr>{celdas}</tr>")
+        bloques.append(f"<h3>{escape(titulo)}</h3>")
+        bloques.append("<table>\n" + "\n".join(filas) + "\n</table>")
+    return pagina("Alícuotas", "\n".join(bloques))
+
+
+def html_determinativa(raw):
+    bloques = [
+        "<h1>Declaración jurada</h1>",
+        "<h2>Declaración jurada determinativa</h2>",
+        "<h3>¿Tengo que presentarla?</h3>",
+        "<p>Tendrás que inscribirte en el impuesto y presentar la declaración jurada que establece "
+        "el monto a pagar, cuando tus bienes al 31 de diciembre, se encuentren valuados por un monto superior a:</p>",
+    ]
+    items = "\n".join(
+        f"<li>Para el período {t['year']}: <strong>{escape(t['amount_raw'])}</strong></li>"
+        for t in raw["thresholds"]
+    )
+    # la lista de montos tiene que ser el primer <ul> del artículo (ver el xpath en el raw)
+    bloques.insert(0, f"<ul>\n{items}\n</ul>")
+    return pagina("Declaración jurada determinativa", "\n".join(bloques))
+
+
+def html_indice():
+    links = [
+        ("/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/documentos/"
+         + PDF_ART30.name, "Deducciones personales Art. 30"),
+        ("/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/documentos/"
+         + PDF_ART94.name, "Tabla Art. 94"),
+        ("/gananciasYBienes/bienes-personales/valuaciones/documentos/" + PDF_MONEDAS.name,
+         "Valuaciones moneda extranjera"),
+    ]
+    cuerpo = "<h1>Ganancias y Bienes Personales</h1>\n<p>Escala, deducciones y alícuotas vigentes.</p>\n<ul>\n"
+    cuerpo += "\n".join(f'<li><a href="{href}">{escape(txt)}</a></li>' for href, txt in links)
+    cuerpo += "\n</ul>"
+    return pagina("Ganancias y Bienes Personales", cuerpo)
+
+
+# ==========================
+# EJECUCIÓN
+# ==========================
+
+def main():
+    def raw(nombre):
+        return json.loads((RAW_DIR / nombre).read_text(encoding="utf-8"))
+
+    PDF_ART30.write_bytes(pdf_art30(raw(f"raw_art30_{ANIO}.json")))
+    PDF_ART94.write_bytes(pdf_art94(raw(f"raw_art94_{ANIO}.json")))
+    PDF_MONEDAS.write_bytes(pdf_monedas(raw(f"raw_monedas_{ANIO}.json")))
+    HTML_ALICUOTAS.write_text(html_alicuotas(raw("raw_bienes_alicuotas_all.json")), encoding="utf-8")
+    HTML_DETERMINATIVA.write_text(html_determinativa(raw("raw_bp_determinativa.json")), encoding="utf-8")
+    HTML_INDICE.write_text(html_indice(), encoding="utf-8")
+
+    for path in (PDF_ART30, PDF_ART94, PDF_MONEDAS, HTML_ALICUOTAS, HTML_DETERMINATIVA, HTML_INDICE):
+        print(f"✅ {path.name} ({path.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Parámetros período 2024 (mismos valores que los raw de outputs/), en el
+# formato de parametros_arca.json, para que los benchmarks no dependan de
+# haber corrido normalize_all.
+
+ANIO = 2024
+
+MINIMO_NO_IMPONIBLE = 292994964.89
+
+# (desde, hasta, monto_fijo, porcentaje, excedente_desde)
+BP_GENERAL = [
+    (None, 40107213.86, None, 0.50, None),
+    (40107213.86, 86898963.43, 200536.07, 0.75, 40107213.86),
+    (86898963.43, 240643283.28, 551474.19, 1.00, 86898963.43),
+    (240643283.28, None, 2088917.39, 1.25, 240643283.28),
+]
+BP_CUMPLIDORES = [
+    (None, 40107213.86, None, 0.00, None),
+    (40107213.86, 86898963.43, 0.00, 0.25, 40107213.86),
+    (86898963.43, 240643283.28, 116979.37, 0.50, 86898963.43),
+    (240643283.28, None, 885700.97, 0.75, 240643283.28),
+]
+GAN_ART94 = [
+    (0.00, 1360200.00, 0.00, 5, 0.00),
+    (1360200.00, 2720400.00, 68010.00, 9, 1360200.00),
+    (2720400.00, 4080600.00, 190428.00, 12, 2720400.00),
+    (4080600.00, 6120900.00, 353652.00, 15, 4080600.00),
+    (6120900.00, 12241800.00, 659697.00, 19, 6120900.00),
+    (12241800.00, 18362700.00, 1822668.00, 23, 12241800.00),
+    (18362700.00, 27544050.00, 3230475.00, 27, 18362700.00),
+    (27544050.00, 41316075.00, 5709439.50, 31, 27544050.00),
+    (41316075.00, None, 9978767.25, 35, 41316075.00),
+]
+GAN_DEDUCCIONES = {
+    "ganancia_no_imponible": 3503688.17,
+    "cargas_familia_conyuge": 3299771.52,
+    "cargas_familia_hijo": 1664386.82,
+    "cargas_familia_hijo_incapaz": 3328173.63,
+    "deduccion_especial_ap1": 12262908.60,
+    "deduccion_especial_ap1_nuevo": 14014752.69,
+    "deduccion_especial_ap2": 16817703.23,
+}
+
+
+def _tramos(impuesto, prefijo, filas):
+    out = []
+    for i, (desde, hasta, fijo, pct, exced) in enumerate(filas, start=1):
+        out.append({
+            "concepto": f"{prefijo}{i}",
+            "impuesto": impuesto,
+            "anio": ANIO,
+            "desde": desde,
+            "hasta": hasta,
+            "monto_fijo": fijo,
+            "porcentaje": pct,
+            "excedente_desde": exced,
+        })
+    return out
+
+
+PARAMETROS = (
+    [{"concepto": "BP_MINIMO_NO_IMPONIBLE", "impuesto": "BIENES_PERSONALES", "anio": ANIO,
+      "valor_num": MINIMO_NO_IMPONIBLE}]
+    + _tramos("BIENES_PERSONALES", "BP_ALICUOTA_GENERAL_TRAMO_", BP_GENERAL)
+    + _tramos("BIENES_PERSONALES", "BP_ALICUOTA_CUMPLIDORES_TRAMO_", BP_CUMPLIDORES)
+    + _tramos("GANANCIAS", "GAN_ESCALA_TRAMO_", GAN_ART94)
+    + [{"concepto": f"GAN_DED_{k.upper()}", "impuesto": "GANANCIAS", "anio": ANIO, "valor_num": v}
+       for k, v in GAN_DEDUCCIONES.items()]
+)
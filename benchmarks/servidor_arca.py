@@ -0,0 +1,311 @@
+"""
+ARCA local para pruebas de carga de los crawlers: sirve un árbol sintético
+de /gananciasYBienes/ (índices HTML, páginas .asp, PDFs de fixtures) con
+robots.txt (Request-rate / Crawl-delay / Disallow), redirecciones, respuestas
+lentas y 429/503 transitorios.
+
+Registra cada request y calcula páginas/s, espaciado entre requests por
+User-Agent y violaciones de robots.txt (GET /__stats, POST /__reset).
+
+Los crawlers se apuntan con ARCA_BASE_URL (y ARCA_REQUEST_DELAY=0 para que
+mande sólo robots.txt):
+    python -m codigo.benchmarks.servidor_arca [--puerto 8765] [--errores 0.05] [--lentas 0.05]
+    ARCA_BASE_URL=http://127.0.0.1:8765 ARCA_REQUEST_DELAY=0 python arca_mapper/crawler.py
+"""
+import argparse
+import contextlib
+import http.server
+import json
+import statistics
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from html import escape
+from urllib.parse import urlsplit
+
+from codigo.benchmarks.fixtures import generar_fixtures as fx
+
+PUERTO = 8765
+PAGINAS = 40                 # páginas sintéticas por sección
+REQUEST_RATE = "20/1"        # robots.txt: 20 requests por segundo
+CRAWL_DELAY = 0              # robots.txt: segundos (urllib.robotparser sólo acepta enteros)
+DISALLOW = "/gananciasYBienes/privado/"
+TOLERANCIA = 0.9             # un hueco < 90% del intervalo de robots (menos el jitter) es violación
+JITTER = 0.01                # segundos de ruido entre que el cliente manda y el servidor recibe
+
+SECCIONES = ("ganancias", "bienes-personales")
+
+DEDUCCIONES = "/gananciasYBienes/ganancias/personas-humanas-sucesiones-indivisas/deducciones/"
+DOCUMENTOS_DEDUCCIONES = DEDUCCIONES + "documentos/"
+DOCUMENTOS_VALUACIONES = "/gananciasYBienes/bienes-personales/valuaciones/documentos/"
+
+TEXTO = (
+    "<p>Información sobre ganancias, deducciones, alícuotas y escala del impuesto. "
+    "Mínimo exento de bienes personales, valuación de inmuebles y casa habitación.</p>"
+)
+
+
+# ==========================
+# ÁRBOL DEL SITIO
+# ==========================
+
+def _lista(links):
+    items = "\n".join(f'<li><a href="{href}">{escape(txt)}</a></li>' for href, txt in links)
+    return f"<ul>\n{items}\n</ul>"
+
+
+def armar_sitio(paginas: int = PAGINAS):
+    """
+    → (archivos, redirecciones)
+    archivos: path → (content-type, bytes); redirecciones: path viejo → path nuevo.
+    Los directorios tienen una página índice con sus hijos, como en ARCA.
+    """
+    pdfs = [fx.PDF_ART30.read_bytes(), fx.PDF_ART94.read_bytes(), fx.PDF_MONEDAS.read_bytes()]
+    html = "text/html; charset=utf-8"
+
+    archivos = {
+        "/gananciasYBienes/bienes-personales/conceptos-basicos/alicuotas.asp":
+            (html, fx.HTML_ALICUOTAS.read_bytes()),
+        "/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp":
+            (html, fx.HTML_DETERMINATIVA.read_bytes()),
+        DOCUMENTOS_DEDUCCIONES + fx.PDF_ART30.name: ("application/pdf", pdfs[0]),
+        DOCUMENTOS_DEDUCCIONES + fx.PDF_ART94.name: ("application/pdf", pdfs[1]),
+        DOCUMENTOS_VALUACIONES + fx.PDF_MONEDAS.name: ("application/pdf", pdfs[2]),
+    }
+    archivos[DEDUCCIONES + "deducciones-personales.asp"] = (html, fx.pagina("Deducciones personales", "\n".join([
+        "<h1>Deducciones personales</h1>", TEXTO,
+        _lista([(DOCUMENTOS_DEDUCCIONES + fx.PDF_ART30.name, "Deducciones personales Art. 30"),
+                (DOCUMENTOS_DEDUCCIONES + fx.PDF_ART94.name, "Tabla Art. 94")]),
+    ])).encode())
+    archivos[DEDUCCIONES + "deducciones-generales.asp"] = (html, fx.pagina(
+        "Deducciones generales", "<h1>Deducciones generales</h1>\n" + TEXTO).encode())
+
+    redirecciones = {}
+    for seccion in SECCIONES:
+        base = f"/gananciasYBienes/{seccion}/novedades/"
+        for i in range(paginas):
+            links = [
+                (f"{base}pagina-{(i + 1) % paginas:03d}.asp", "Siguiente"),
+                (f"{base}pagina-{(i + 7) % paginas:03d}.htm", "Ver también"),  # dirección vieja (301)
+            ]
+            if i % 5 == 0:
+                links.append((f"{base}documentos/anexo-{i:03d}.pdf", f"Anexo {i}"))
+                archivos[f"{base}documentos/anexo-{i:03d}.pdf"] = ("application/pdf", pdfs[i // 5 % len(pdfs)])
+            if i % 10 == 0:
+                links.append((f"{DISALLOW}borrador-{i:03d}.asp", "Borrador"))
+                archivos[f"{DISALLOW}borrador-{i:03d}.asp"] = (html, fx.pagina("Borrador", "<h1>Borrador</h1>").encode())
+
+            cuerpo = f"<h1>Novedad {i} - {seccion}</h1>\n{TEXTO}\n{_lista(links)}"
+            archivos[f"{base}pagina-{i:03d}.asp"] = (html, fx.pagina(f"Novedad {i}", cuerpo).encode())
+            redirecciones[f"{base}pagina-{i:03d}.htm"] = f"{base}pagina-{i:03d}.asp"
+
+    hijos = defaultdict(set)
+    for path in list(archivos):
+        partes = path.strip("/").split("/")
+        for n in range(1, len(partes)):
+            padre = "/" + "/".join(partes[:n - 1]) + ("/" if n > 1 else "")
+            hijos[padre].add("/" + "/".join(partes[:n]) + "/")
+        hijos["/" + "/".join(partes[:-1]) + "/"].add(path)
+
+    for directorio, contenido in hijos.items():
+        if directorio == "/":
+            continue
+        links = [(h, h.rstrip("/").rsplit("/", 1)[-1]) for h in sorted(contenido)]
+        titulo = directorio.rstrip("/").rsplit("/", 1)[-1]
+        archivos[directorio] = (html, fx.pagina(titulo, f"<h1>{escape(titulo)}</h1>\n{TEXTO}\n{_lista(links)}").encode())
+
+    redirecciones["/"] = "/gananciasYBienes/"
+    return archivos, redirecciones
+
+
+def _fraccion(path: str, sal: str) -> float:
+    """Número estable en [0, 1) por path: decide qué páginas fallan o tardan."""
+    return zlib.crc32(f"{sal}:{path}".encode()) % 10_000 / 10_000
+
+
+# ==========================
+# SITIO + REGISTRO
+# ==========================
+
+class SitioArca:
+    def __init__(self, paginas: int = PAGINAS, request_rate: str = REQUEST_RATE, crawl_delay: int = CRAWL_DELAY,
+                 lentas: float = 0.0, demora: float = 0.5, errores: float = 0.0):
+        self.archivos, self.redirecciones = armar_sitio(paginas)
+        self.lentas, self.demora, self.errores = lentas, demora, errores
+
+        requests_, segundos = (int(x) for x in request_rate.split("/"))
+        self.intervalo = max(float(crawl_delay), segundos / requests_)
+        lineas = ["User-agent: *", f"Request-rate: {request_rate}", f"Disallow: {DISALLOW}"]
+        if crawl_delay:
+            lineas.insert(1, f"Crawl-delay: {crawl_delay}")
+        self.robots = ("\n".join(lineas) + "\n").encode()
+
+        self._lock = threading.Lock()
+        self._fallados = set()
+        self.registro = []   # (t, user_agent, path, status)
+
+    def responder(self, path: str):
+        """→ (status, headers, body). Los 429/503 fallan sólo la primera vez (Retry-After: 1)."""
+        if path == "/robots.txt":
+            return 200, {"Content-Type": "text/plain"}, self.robots
+
+        if path in self.redirecciones:
+            return 301, {"Location": self.redirecciones[path]}, b""
+        if path not in self.archivos and path + "/" in self.archivos:
+            return 301, {"Location": path + "/"}, b""
+        if path not in self.archivos:
+            return 404, {"Content-Type": "text/plain"}, b"no encontrado"
+
+        if _fraccion(path, "lenta") < self.lentas:
+            time.sleep(self.demora)
+
+        if _fraccion(path, "error") < self.errores:
+            with self._lock:
+                primera = path not in self._fallados
+                self._fallados.add(path)
+            if primera:
+                status = 429 if zlib.crc32(path.encode()) % 2 else 503
+                return status, {"Content-Type": "text/plain", "Retry-After": "1"}, b"intente mas tarde"
+
+        tipo, cuerpo = self.archivos[path]
+        return 200, {"Content-Type": tipo}, cuerpo
+
+    def registrar(self, t: float, user_agent: str, path: str, status: int):
+        with self._lock:
+            self.registro.append((t, user_agent, path, status))
+
+    def reiniciar(self):
+        with self._lock:
+            self.registro.clear()
+            self._fallados.clear()
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            registro = sorted(self.registro)
+
+        paginas = [r for r in registro if r[2] != "/robots.txt"]
+        duracion = paginas[-1][0] - paginas[0][0] if len(paginas) > 1 else 0.0
+
+        por_ua = defaultdict(list)
+        for r in paginas:
+            por_ua[r[1]].append(r)
+
+        huecos = []
+        for reqs in por_ua.values():
+            inicio = reqs[0][0]
+            for anterior, actual in zip(reqs, reqs[1:]):
+                # seguir un 3xx lo hace el cliente HTTP sin esperar: el hueco se mide
+                # desde el primer request de la cadena de redirecciones
+                if 300 <= anterior[3] < 400:
+                    continue
+                huecos.append(actual[0] - inicio)
+                inicio = actual[0]
+
+        return {
+            "requests": len(registro),
+            "paginas": len(paginas),
+            "segundos": duracion,
+            "paginas_por_seg": (len(paginas) - 1) / duracion if duracion else None,
+            "por_status": dict(Counter(r[3] for r in registro)),
+            "robots_leido": any(r[2] == "/robots.txt" for r in registro),
+            "violaciones_robots": sum(r[2].startswith(DISALLOW) for r in paginas),
+            "intervalo_robots": self.intervalo,
+            "espaciado_min": min(huecos) if huecos else None,
+            "espaciado_p50": statistics.median(huecos) if huecos else None,
+            "violaciones_espaciado": sum(h < self.intervalo * TOLERANCIA - JITTER for h in huecos),
+            "user_agents": sorted(por_ua),
+        }
+
+
+# ==========================
+# HTTP
+# ==========================
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    sitio: SitioArca = None
+
+    def log_message(self, *args):
+        pass
+
+    def _enviar(self, status, headers, cuerpo, con_cuerpo=True):
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        if con_cuerpo:
+            self.wfile.write(cuerpo)
+
+    def _servir(self, con_cuerpo):
+        t = time.monotonic()
+        path = urlsplit(self.path).path
+        if path == "/__stats":
+            cuerpo = json.dumps(self.sitio.estadisticas(), indent=2).encode()
+            return self._enviar(200, {"Content-Type": "application/json"}, cuerpo, con_cuerpo)
+
+        status, headers, cuerpo = self.sitio.responder(path)
+        self.sitio.registrar(t, self.headers.get("User-Agent", ""), path, status)
+        self._enviar(status, headers, cuerpo, con_cuerpo)
+
+    def do_GET(self):
+        self._servir(True)
+
+    def do_HEAD(self):
+        self._servir(False)
+
+    def do_POST(self):
+        if urlsplit(self.path).path == "/__reset":
+            self.sitio.reiniciar()
+            return self._enviar(204, {}, b"")
+        self._enviar(405, {}, b"")
+
+
+@contextlib.contextmanager
+def servidor(sitio: SitioArca = None, puerto: int = 0):
+    """Levanta el sitio en un hilo; devuelve (url_base, sitio)."""
+    sitio = sitio or SitioArca()
+    handler = type("Handler", (_Handler,), {"sitio": sitio})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", puerto), handler)
+    hilo = threading.Thread(target=server.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", sitio
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def argumentos_sitio(parser: argparse.ArgumentParser):
+    parser.add_argument("--paginas", type=int, default=PAGINAS, help="páginas sintéticas por sección")
+    parser.add_argument("--request-rate", default=REQUEST_RATE, help="Request-rate de robots.txt (requests/segundos)")
+    parser.add_argument("--crawl-delay", type=int, default=CRAWL_DELAY, help="Crawl-delay de robots.txt (0 = sin)")
+    parser.add_argument("--lentas", type=float, default=0.0, help="fracción de páginas que tardan --demora")
+    parser.add_argument("--demora", type=float, default=0.5, help="segundos de las respuestas lentas")
+    parser.add_argument("--errores", type=float, default=0.0, help="fracción de páginas con 429/503 transitorio")
+
+
+def sitio_desde_args(args) -> SitioArca:
+    return SitioArca(args.paginas, args.request_rate, args.crawl_delay, args.lentas, args.demora, args.errores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCA local para pruebas de carga de los crawlers")
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    argumentos_sitio(parser)
+    args = parser.parse_args()
+
+    sitio = sitio_desde_args(args)
+    with servidor(sitio, args.puerto) as (url, _):
+        print(f"🌐 ARCA local en {url} ({len(sitio.archivos)} rutas, robots: {sitio.robots.decode().strip()!r})")
+        print(f"   ARCA_BASE_URL={url} ARCA_REQUEST_DELAY=0 python arca_mapper/crawler.py")
+        print(f"   estadísticas: {url}/__stats")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(json.dumps(sitio.estadisticas(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import numpy as np
+
+from codigo.calculators.escalas import escala
+from codigo.calculators.parametros import parametros_default, valor, valor_centavos
+
+IMPUESTO = "BIENES_PERSONALES"
+CONCEPTO_MINIMO = "BP_MINIMO_NO_IMPONIBLE"
+
+
+def calcular_bp(valores, cumplidores, anio: int, parametros=None, centavos: bool = False):
+    """
+    Impuesto determinado de Bienes Personales para una cartera completa.
+
+    valores: array con el valor total de los bienes de cada contribuyente.
+    cumplidores: array bool (True = escala "contribuyentes cumplidores"); None = todos general.
+    anio: período fiscal (escalar, o array con un año por contribuyente).
+    parametros: lista de parametros_arca; si falta se lee parametros_arca.json.
+    centavos: True → valores e impuesto en centavos (int64), cálculo exacto.
+
+    Devuelve un array con el impuesto de cada contribuyente.
+    """
+    if parametros is None:
+        parametros = parametros_default()
+
+    dtype = np.int64 if centavos else np.float64
+    valores = np.asarray(valores, dtype=dtype)
+    if cumplidores is None:
+        cumplidores = np.zeros(valores.shape, dtype=bool)
+    else:
+        cumplidores = np.broadcast_to(np.asarray(cumplidores, dtype=bool), valores.shape)
+
+    anios = np.broadcast_to(np.asarray(anio), valores.shape)
+    impuesto = np.zeros(valores.shape, dtype=dtype)
+
+    # un pase por año presente (normalmente uno solo)
+    for a in np.unique(anios):
+        a = int(a)
+        en_anio = anios == a
+
+        minimo = (valor_centavos if centavos else valor)(parametros, CONCEPTO_MINIMO, a)
+        base = np.maximum(valores - minimo, 0)
+
+        for tabla, mascara in (
+            ("GENERAL", en_anio & ~cumplidores),
+            ("CUMPLIDORES", en_anio & cumplidores),
+        ):
+            if not mascara.any():
+                continue
+            tabla_bp = escala(IMPUESTO, tabla, a, parametros)
+            if centavos:
+                impuesto[mascara] = tabla_bp.evaluar_centavos_batch(base[mascara])
+            else:
+                impuesto[mascara] = tabla_bp.evaluar_batch(base[mascara])
+
+    return impuesto
@@ -0,0 +1,179 @@
+import numpy as np
+
+from codigo.calculators.parametros import parametros_default, tramos
+from codigo.normalizers.utils import to_centavos
+
+# (impuesto, tabla) → prefijo de concepto en parametros_arca
+TABLAS = {
+    ("GANANCIAS", "ART94"): "GAN_ESCALA_TRAMO_",
+    ("BIENES_PERSONALES", "GENERAL"): "BP_ALICUOTA_GENERAL_TRAMO_",
+    ("BIENES_PERSONALES", "CUMPLIDORES"): "BP_ALICUOTA_CUMPLIDORES_TRAMO_",
+}
+
+# tope para el "en adelante" en centavos
+SIN_TOPE_CENT = np.iinfo(np.int64).max
+
+# diferencia admitida (ARS) entre el monto fijo publicado y el que surge del tramo anterior
+TOLERANCIA_CONTINUIDAD = 1.0
+
+_CACHE = {}
+
+
+class Escala:
+    """
+    Escala progresiva compilada: monto fijo + % sobre el excedente.
+
+    Guarda arrays contiguos (desde, hasta, monto_fijo, tasa, excedente_desde)
+    ordenados por `desde`. La tasa es fracción (0.35, no 35). El último tramo
+    ("en adelante") tiene hasta = inf.
+
+    En paralelo guarda la misma escala en punto fijo (int64): montos en
+    centavos y tasa en puntos básicos, para cálculos exactos al centavo.
+    """
+
+    def __init__(self, lista_tramos, nombre: str = ""):
+        if not lista_tramos:
+            raise ValueError(f"Escala {nombre}: sin tramos")
+
+        # los '-' de ARCA llegan como None desde to_number y valen 0
+        filas = sorted(lista_tramos, key=lambda t: t.get("desde") or 0.0)
+
+        def col(key, vacio=0.0):
+            return np.ascontiguousarray(
+                [vacio if t.get(key) is None else t.get(key) for t in filas], dtype=np.float64
+            )
+
+        self.nombre = nombre
+        self.desde = col("desde")
+        self.hasta = col("hasta", np.inf)
+        self.monto_fijo = col("monto_fijo")
+        self.tasa = col("porcentaje") / 100
+        self.excedente_desde = col("excedente_desde")
+
+        def col_cent(key, campo, vacio=0):
+            # *_cent / porcentaje_bp del normalizer; si no están, se derivan del float
+            valores = []
+            for t in filas:
+                v = t.get(campo)
+                if v is None:
+                    v = vacio if t.get(key) is None else to_centavos(t.get(key))
+                valores.append(v)
+            return np.ascontiguousarray(valores, dtype=np.int64)
+
+        self.desde_cent = col_cent("desde", "desde_cent")
+        self.hasta_cent = col_cent("hasta", "hasta_cent", SIN_TOPE_CENT)
+        self.monto_fijo_cent = col_cent("monto_fijo", "monto_fijo_cent")
+        self.tasa_bp = col_cent("porcentaje", "porcentaje_bp")
+        self.excedente_desde_cent = col_cent("excedente_desde", "excedente_desde_cent")
+
+        if np.any(np.diff(self.desde) <= 0):
+            raise ValueError(f"Escala {nombre}: los tramos no son crecientes")
+
+        # impuesto al inicio de cada tramo (para la inversa)
+        self._impuesto_desde = self.evaluar_batch(self.desde)
+
+    def __len__(self):
+        return len(self.desde)
+
+    def __repr__(self):
+        return f"Escala({self.nombre!r}, tramos={len(self)})"
+
+    # ==========================
+    # EVALUACIÓN
+    # ==========================
+
+    def tramo(self, base):
+        """Índice de tramo para cada base (array)."""
+        idx = np.searchsorted(self.desde, base, side="right") - 1
+        return np.clip(idx, 0, len(self.desde) - 1)
+
+    def evaluar_batch(self, base):
+        base = np.asarray(base, dtype=np.float64)
+        idx = self.tramo(base)
+        return self.monto_fijo[idx] + (base - self.excedente_desde[idx]) * self.tasa[idx]
+
+    def evaluar(self, base: float) -> float:
+        return float(self.evaluar_batch(base))
+
+    def evaluar_centavos_batch(self, base_cent):
+        """Igual que evaluar_batch pero en int64 (centavos); redondeo half-up al centavo."""
+        base = np.asarray(base_cent, dtype=np.int64)
+        idx = np.searchsorted(self.desde_cent, base, side="right") - 1
+        idx = np.clip(idx, 0, len(self.desde_cent) - 1)
+        excedente = (base - self.excedente_desde_cent[idx]) * self.tasa_bp[idx]
+        return self.monto_fijo_cent[idx] + (excedente + 5_000) // 10_000
+
+    def tasa_marginal(self, base):
+        return self.tasa[self.tramo(np.asarray(base, dtype=np.float64))]
+
+    # ==========================
+    # INVERSA
+    # ==========================
+
+    def inversa_batch(self, impuesto):
+        """
+        Base mínima que genera el impuesto dado. En tramos de tasa 0 (cumplidores)
+        cualquier base del tramo da lo mismo: se devuelve el inicio del tramo.
+        """
+        impuesto = np.maximum(np.asarray(impuesto, dtype=np.float64), 0.0)
+        idx = np.searchsorted(self._impuesto_desde, impuesto, side="left") - 1
+        idx = np.clip(idx, 0, len(self.desde) - 1)
+
+        tasa = self.tasa[idx]
+        excedente = np.divide(
+            impuesto - self.monto_fijo[idx], tasa,
+            out=np.zeros_like(impuesto), where=tasa > 0,
+        )
+        return np.where(tasa > 0, self.excedente_desde[idx] + excedente, self.desde[idx])
+
+    def inversa(self, impuesto: float) -> float:
+        return float(self.inversa_batch(impuesto))
+
+    # ==========================
+    # VALIDACIÓN
+    # ==========================
+
+    def validar_continuidad(self, tolerancia: float = TOLERANCIA_CONTINUIDAD):
+        """
+        Devuelve la lista de problemas: huecos entre `hasta` y el `desde` siguiente,
+        y saltos entre el monto fijo publicado y el que resulta del tramo anterior.
+        Lista vacía = escala continua.
+        """
+        problemas = []
+        for i in range(1, len(self.desde)):
+            if abs(self.hasta[i - 1] - self.desde[i]) > tolerancia:
+                problemas.append(
+                    f"tramo {i + 1}: desde {self.desde[i]:,.2f} ≠ hasta anterior {self.hasta[i - 1]:,.2f}"
+                )
+            esperado = self.monto_fijo[i - 1] + (self.desde[i] - self.excedente_desde[i - 1]) * self.tasa[i - 1]
+            if abs(esperado - self.monto_fijo[i]) > tolerancia:
+                problemas.append(
+                    f"tramo {i + 1}: monto fijo {self.monto_fijo[i]:,.2f} ≠ esperado {esperado:,.2f}"
+                )
+        if not np.isinf(self.hasta[-1]):
+            problemas.append(f"último tramo cerrado en {self.hasta[-1]:,.2f} (se esperaba 'en adelante')")
+        return problemas
+
+
+def escala(impuesto: str, tabla: str, anio: int, parametros=None) -> Escala:
+    """
+    Escala compilada para (impuesto, tabla, anio), construida una sola vez.
+    El caché se invalida si se pasa otra lista de parámetros.
+    """
+    if parametros is None:
+        parametros = parametros_default()
+
+    key = (impuesto, tabla, anio)
+    hit = _CACHE.get(key)
+    if hit is not None and hit[0] is parametros:
+        return hit[1]
+
+    try:
+        prefijo = TABLAS[(impuesto, tabla)]
+    except KeyError:
+        raise KeyError(f"Escala desconocida: {impuesto}/{tabla}") from None
+
+    compilada = Escala(tramos(parametros, prefijo, anio), nombre=f"{impuesto}/{tabla}/{anio}")
+    _CACHE[key] = (parametros, compilada)
+    return compilada
+
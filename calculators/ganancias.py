@@ -0,0 +1,91 @@
+import numpy as np
+
+from codigo.calculators.escalas import escala
+from codigo.calculators.parametros import parametros_default, valor, valor_centavos
+
+IMPUESTO = "GANANCIAS"
+
+# Conceptos de normalize_ganancias_deducciones (Art. 30)
+GNI = "GAN_DED_GANANCIA_NO_IMPONIBLE"
+CONYUGE = "GAN_DED_CARGAS_FAMILIA_CONYUGE"
+HIJO = "GAN_DED_CARGAS_FAMILIA_HIJO"
+HIJO_INCAPAZ = "GAN_DED_CARGAS_FAMILIA_HIJO_INCAPAZ"
+
+# código de deducción especial → concepto ("" = no corresponde)
+DEDUCCION_ESPECIAL = {
+    "ap1": "GAN_DED_DEDUCCION_ESPECIAL_AP1",
+    "ap1_nuevo": "GAN_DED_DEDUCCION_ESPECIAL_AP1_NUEVO",
+    "ap2": "GAN_DED_DEDUCCION_ESPECIAL_AP2",
+}
+
+
+def deducciones_art30(parametros, anio: int, conyuge=False, hijos=0, hijos_incapaces=0, deduccion_especial="",
+                      centavos: bool = False):
+    """
+    Total de deducciones personales (Art. 30) por contribuyente.
+
+    conyuge: bool / array bool
+    hijos, hijos_incapaces: cantidad (escalar o array)
+    deduccion_especial: "", "ap1", "ap1_nuevo" o "ap2" (escalar o array de str); otro → ValueError
+    centavos: True → int64 en centavos (valor_cent) en lugar de float en pesos
+    """
+    leer = valor_centavos if centavos else valor
+    dtype = np.int64 if centavos else np.float64
+
+    conyuge = np.asarray(conyuge, dtype=bool).astype(dtype)
+    hijos = np.asarray(hijos, dtype=dtype)
+    hijos_incapaces = np.asarray(hijos_incapaces, dtype=dtype)
+    tipo = np.asarray(deduccion_especial, dtype=str)
+    desconocidos = set(np.unique(tipo).tolist()) - {""} - set(DEDUCCION_ESPECIAL)
+    if desconocidos:
+        raise ValueError(f"deduccion_especial desconocida: {sorted(desconocidos)} "
+                         f"(opciones: \"\", {', '.join(DEDUCCION_ESPECIAL)})")
+
+    total = (
+        leer(parametros, GNI, anio)
+        + conyuge * leer(parametros, CONYUGE, anio)
+        + hijos * leer(parametros, HIJO, anio)
+        + hijos_incapaces * leer(parametros, HIJO_INCAPAZ, anio)
+    )
+
+    especial = np.zeros(tipo.shape, dtype=dtype)
+    for codigo, concepto in DEDUCCION_ESPECIAL.items():
+        mascara = tipo == codigo
+        if mascara.any():
+            especial[mascara] = leer(parametros, concepto, anio)
+
+    return total + especial
+
+
+def impuesto_art94(ganancia_neta, parametros, anio: int, centavos: bool = False):
+    """Impuesto determinado según la escala del Art. 94."""
+    art94 = escala(IMPUESTO, "ART94", anio, parametros)
+    if centavos:
+        return art94.evaluar_centavos_batch(np.maximum(np.asarray(ganancia_neta, dtype=np.int64), 0))
+    return art94.evaluar_batch(np.maximum(np.asarray(ganancia_neta, dtype=np.float64), 0.0))
+
+
+def liquidar_ganancias(bruto, anio: int, conyuge=False, hijos=0, hijos_incapaces=0,
+                       deduccion_especial="", parametros=None, centavos: bool = False):
+    """
+    Liquidación anual de Ganancias (4ta categoría) vectorizada.
+
+    Con centavos=True `bruto` va en centavos (int) y todo el cálculo es int64.
+
+    Devuelve dict de arrays: deducciones, ganancia_neta, impuesto.
+    """
+    if parametros is None:
+        parametros = parametros_default()
+
+    bruto = np.asarray(bruto, dtype=np.int64 if centavos else np.float64)
+    deducciones = np.broadcast_to(
+        deducciones_art30(parametros, anio, conyuge, hijos, hijos_incapaces, deduccion_especial, centavos),
+        bruto.shape,
+    )
+    ganancia_neta = np.maximum(bruto - deducciones, 0)
+
+    return {
+        "deducciones": deducciones,
+        "ganancia_neta": ganancia_neta,
+        "impuesto": impuesto_art94(ganancia_neta, parametros, anio, centavos),
+    }
@@ -0,0 +1,110 @@
+import numpy as np
+
+from codigo.calculators.monedas import valuar
+from codigo.calculators.parametros import valor
+
+# Ley 27.743: casa-habitación exenta si su valuación es igual o inferior al
+# tope del período (350 M para 2023; después se actualiza por IPC, como el
+# mínimo no imponible). Si los parámetros traen el concepto, manda ese.
+CONCEPTO_TOPE_CASA = "BP_TOPE_CASA_HABITACION"
+TOPES_CASA_HABITACION = {
+    2023: 350_000_000.0,
+    2024: 1_025_482_377.13,
+    2025: 1_346_548_155.99,
+}
+
+# rubro → tope de exención en ARS (None = exento siempre, dict = tope por año).
+# Rubros que no figuran acá son gravados.
+EXENCIONES = {
+    "casa_habitacion": TOPES_CASA_HABITACION,
+    "deposito_ar": None,        # depósitos en entidades financieras del país
+    "titulos_publicos": None,   # títulos públicos nacionales/provinciales/municipales
+}
+
+RUBROS = (
+    "inmueble",
+    "casa_habitacion",
+    "deposito_ar",
+    "deposito_exterior",
+    "moneda_extranjera",
+    "titulos_publicos",
+    "acciones",
+    "rodado",
+    "otros",
+)
+
+
+def tope_casa_habitacion(anio: int, parametros=None) -> float:
+    """Tope de casa-habitación del año: BP_TOPE_CASA_HABITACION de los parámetros o TOPES_CASA_HABITACION."""
+    if parametros is not None:
+        try:
+            return valor(parametros, CONCEPTO_TOPE_CASA, anio)
+        except KeyError:
+            pass
+    try:
+        return TOPES_CASA_HABITACION[anio]
+    except KeyError:
+        raise KeyError(f"{CONCEPTO_TOPE_CASA}: sin tope de casa-habitación para el año {anio} "
+                       f"(agregarlo a los parámetros o pasar exenciones=)") from None
+
+
+def _tope(rubro: str, exenciones, anio: int, parametros) -> float:
+    if rubro not in exenciones:
+        return -np.inf  # gravado
+    tope = exenciones[rubro]
+    if tope is TOPES_CASA_HABITACION:
+        return tope_casa_habitacion(anio, parametros)
+    if isinstance(tope, dict):
+        try:
+            return tope[anio]
+        except KeyError:
+            raise KeyError(f"{rubro}: sin tope de exención para el año {anio}") from None
+    return np.inf if tope is None else tope
+
+
+def agregar_inventario(contribuyente, rubro, monto, anio: int, moneda="ARS", tipo_moneda="DIVISA",
+                       exenciones=None, parametros=None):
+    """
+    Base de Bienes Personales por contribuyente a partir de un inventario columnar
+    (un bien por posición en cada array).
+
+    contribuyente: id de cada bien (CUIT, número de cliente...)
+    rubro: ver RUBROS / EXENCIONES
+    monto: valor del bien en su moneda
+    moneda, tipo_moneda: para valuar en ARS al 31/12 (ver monedas.valuar)
+    exenciones: reemplaza EXENCIONES (ej: otro tope de casa-habitación, fijo o {año: tope})
+
+    Devuelve dict de arrays por contribuyente (ordenados por id):
+    contribuyente, total, exento, gravado. `gravado` va directo a calcular_bp.
+    """
+    if exenciones is None:
+        exenciones = EXENCIONES
+
+    monto = np.asarray(monto, dtype=np.float64)
+    n = monto.shape[0]
+    rubro = np.broadcast_to(np.asarray(rubro, dtype=str), (n,))
+    moneda = np.broadcast_to(np.asarray(moneda, dtype=str), (n,))
+
+    # Valuación: sólo se consultan cotizaciones si hay algo en moneda extranjera
+    monedas_distintas = np.unique(moneda)
+    if np.all(np.char.upper(monedas_distintas) == "ARS"):
+        valor_ars = monto
+    else:
+        valor_ars = valuar(moneda, monto, anio, tipo_moneda, parametros=parametros)
+
+    # Exenciones por rubro (se resuelve por rubro distinto, no por fila)
+    rubros, inv_rubro = np.unique(rubro, return_inverse=True)
+    tope = np.array([_tope(r, exenciones, anio, parametros) for r in rubros], dtype=np.float64)[inv_rubro]
+    exento = np.where(valor_ars <= tope, valor_ars, 0.0)
+
+    # Agregación por contribuyente
+    ids, inv = np.unique(np.asarray(contribuyente), return_inverse=True)
+    total = np.bincount(inv, weights=valor_ars, minlength=len(ids))
+    exento_total = np.bincount(inv, weights=exento, minlength=len(ids))
+
+    return {
+        "contribuyente": ids,
+        "total": total,
+        "exento": exento_total,
+        "gravado": total - exento_total,
+    }
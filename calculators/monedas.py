@@ -0,0 +1,92 @@
+import re
+
+import numpy as np
+
+from codigo.calculators.parametros import parametros_default
+
+# conceptos de normalize_bp_monedas: BP_MONEDA_<COD>_<DIVISA|BILLETE>_<COMP|VEND>_31_12
+RE_CONCEPTO = re.compile(r"^BP_MONEDA_(.+)_(DIVISA|BILLETE)_(COMP|VEND)_31_12$")
+
+LADOS = {"COMP": "comprador", "VEND": "vendedor"}
+
+_CACHE = {}
+
+
+class Cotizaciones:
+    """
+    Cotizaciones al 31/12 de un año, indexadas por "<COD>|<DIVISA|BILLETE>".
+    Las claves quedan ordenadas en un array para buscarlas con searchsorted.
+    Los pesos (ARS) valen 1 en ambos tipos.
+    """
+
+    def __init__(self, parametros, anio: int):
+        valores = {}
+        for p in parametros:
+            if p.get("anio") != anio:
+                continue
+            m = RE_CONCEPTO.match(p.get("concepto") or "")
+            if not m or p.get("valor_num") is None:
+                continue
+            codigo, tipo, lado = m.groups()
+            valores.setdefault(f"{codigo}|{tipo}", {})[lado] = p["valor_num"]
+
+        if not valores:
+            raise KeyError(f"Sin cotizaciones BP_MONEDA_* para el año {anio}")
+
+        for tipo in ("DIVISA", "BILLETE"):
+            valores[f"ARS|{tipo}"] = {"COMP": 1.0, "VEND": 1.0}
+
+        self.anio = anio
+        self.claves = np.array(sorted(valores))
+        self.tasas = {
+            lado: np.array([valores[k].get(lado, np.nan) for k in self.claves], dtype=np.float64)
+            for lado in LADOS
+        }
+
+    def __repr__(self):
+        return f"Cotizaciones({self.anio}, monedas={len(self.claves)})"
+
+    def tasa(self, monedas, tipos="DIVISA", lado: str = "COMP"):
+        """Cotización por unidad para cada (moneda, tipo). Falla con las monedas desconocidas."""
+        # se resuelven sólo los valores distintos y se expanden con el inverso
+        monedas, inv_moneda = np.unique(np.asarray(monedas, dtype=str), return_inverse=True)
+        tipos, inv_tipo = np.unique(np.asarray(tipos, dtype=str), return_inverse=True)
+
+        claves = np.char.add(np.char.add(np.char.upper(monedas)[:, None], "|"), np.char.upper(tipos)[None, :])
+        idx = np.clip(np.searchsorted(self.claves, claves), 0, len(self.claves) - 1)
+
+        encontrada = self.claves[idx] == claves
+        usadas = np.zeros(claves.shape, dtype=bool)
+        usadas[inv_moneda, inv_tipo] = True
+        if np.any(usadas & ~encontrada):
+            faltan = sorted(claves[usadas & ~encontrada].tolist())
+            raise KeyError(f"Sin cotización al 31/12/{self.anio} para: {', '.join(faltan)}")
+
+        return self.tasas[lado][idx][inv_moneda, inv_tipo]
+
+
+def cotizaciones(anio: int, parametros=None) -> Cotizaciones:
+    """Tabla de cotizaciones del año, armada una sola vez (mismo criterio que escalas.escala)."""
+    if parametros is None:
+        parametros = parametros_default()
+
+    hit = _CACHE.get(anio)
+    if hit is not None and hit[0] is parametros:
+        return hit[1]
+
+    tabla = Cotizaciones(parametros, anio)
+    _CACHE[anio] = (parametros, tabla)
+    return tabla
+
+
+def valuar(monedas, montos, anio: int, tipos="DIVISA", lado: str = "COMP", parametros=None):
+    """
+    Valuación en pesos de tenencias en moneda extranjera al 31/12 del año.
+
+    monedas: códigos ISO (USD, EUR, BRL, ...; ARS vale 1)
+    montos: cantidad de moneda extranjera
+    tipos: "DIVISA" (cuentas, depósitos) o "BILLETE" (efectivo), escalar o array
+    lado: "COMP" (comprador, el que usa Bienes Personales) o "VEND"
+    """
+    tabla = cotizaciones(anio, parametros)
+    return np.asarray(montos, dtype=np.float64) * tabla.tasa(monedas, tipos, lado)
@@ -0,0 +1,284 @@
+"""
+Paquete binario de parámetros por período fiscal (.arcapack).
+
+Un archivo por año con los valores simples y los tramos de las escalas ya
+armados como arrays numpy, para que cada worker arranque con un mmap en vez
+de leer y recorrer parametros_arca.json.
+
+Formato (little-endian):
+    cabecera   64 bytes: magic, versión, año, cantidad de conceptos,
+               cantidad de tramos, sha256 del cuerpo
+    conceptos  array CONCEPTO_DTYPE ordenado por concepto (búsqueda binaria)
+    tramos     array TRAMO_DTYPE ordenado por (tabla, n)
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.calculators.paquete [--parametros JSON] [--salida DIR]
+"""
+import argparse
+import hashlib
+import mmap
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from codigo.calculators.parametros import PARAMETROS_JSON, RE_TRAMO, cargar_parametros
+from codigo.normalizers.utils import to_centavos
+from codigo.paths import OUTPUTS_DIR
+
+MAGIC = b"ARCAPACK"
+VERSION = 1
+EXTENSION = ".arcapack"
+PAQUETES_DIR = OUTPUTS_DIR / "paquetes"
+
+CABECERA = struct.Struct("<8sHHiII32s")
+TAM_CABECERA = 64
+
+# faltantes: NaN en los float, INT_NULO en los int
+INT_NULO = np.iinfo(np.int64).min
+
+CONCEPTO_DTYPE = np.dtype([
+    ("concepto", "S64"),
+    ("impuesto", "S32"),
+    ("valor_num", "<f8"),
+    ("valor_cent", "<i8"),
+])
+
+CAMPOS_TRAMO_FLOAT = ("desde", "hasta", "monto_fijo", "porcentaje", "excedente_desde")
+CAMPOS_TRAMO_INT = ("desde_cent", "hasta_cent", "monto_fijo_cent", "porcentaje_bp", "excedente_desde_cent")
+
+TRAMO_DTYPE = np.dtype(
+    [("tabla", "S48"), ("impuesto", "S32"), ("n", "<i4")]
+    + [(c, "<f8") for c in CAMPOS_TRAMO_FLOAT]
+    + [(c, "<i8") for c in CAMPOS_TRAMO_INT]
+)
+
+
+def nombre_paquete(anio: int) -> str:
+    return f"parametros_{anio}{EXTENSION}"
+
+
+# ==========================
+# ESCRITURA
+# ==========================
+
+def _f(x):
+    return np.nan if x is None else x
+
+
+def _i(x):
+    return INT_NULO if x is None else x
+
+
+def construir_paquete(parametros, anio: int) -> bytes:
+    """Bytes del paquete de un año a partir de la lista de parametros_arca."""
+    conceptos, tramos = [], []
+    for p in parametros:
+        if p.get("anio") != anio:
+            continue
+        concepto = p.get("concepto") or ""
+        impuesto = (p.get("impuesto") or "").encode()
+        m = RE_TRAMO.search(concepto)
+        if m:
+            tabla = concepto[:m.start()] + "_TRAMO_"
+            tramos.append(
+                (tabla.encode(), impuesto, int(m.group(1)))
+                + tuple(_f(p.get(c)) for c in CAMPOS_TRAMO_FLOAT)
+                + tuple(_i(p.get(c)) for c in CAMPOS_TRAMO_INT)
+            )
+        else:
+            # mismo criterio que parametros.valor_centavos para los JSON viejos
+            cent = p.get("valor_cent")
+            if cent is None and p.get("valor_num") is not None:
+                cent = to_centavos(p.get("valor_num"))
+            conceptos.append((concepto.encode(), impuesto, _f(p.get("valor_num")), _i(cent)))
+
+    if not conceptos and not tramos:
+        raise KeyError(f"Sin parámetros para el año {anio}")
+
+    largo = CONCEPTO_DTYPE["concepto"].itemsize
+    largos = [c[0] for c in conceptos if len(c[0]) > largo]
+    if largos:
+        raise ValueError(f"Conceptos de más de {largo} bytes: {largos}")
+
+    arr_conceptos = np.array(sorted(conceptos), dtype=CONCEPTO_DTYPE)
+    arr_tramos = np.array(sorted(tramos, key=lambda t: (t[0], t[2])), dtype=TRAMO_DTYPE)
+
+    cuerpo = arr_conceptos.tobytes() + arr_tramos.tobytes()
+    cabecera = CABECERA.pack(
+        MAGIC, VERSION, 0, anio, len(arr_conceptos), len(arr_tramos),
+        hashlib.sha256(cuerpo).digest(),
+    )
+    return cabecera.ljust(TAM_CABECERA, b"\0") + cuerpo
+
+
+def escribir_paquetes(parametros, salida: Path = PAQUETES_DIR):
+    """Un .arcapack por año presente en parametros. Devuelve las rutas escritas."""
+    salida = Path(salida)
+    salida.mkdir(parents=True, exist_ok=True)
+
+    escritos = []
+    for anio in sorted({p.get("anio") for p in parametros if p.get("anio") is not None}):
+        path = salida / nombre_paquete(anio)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(construir_paquete(parametros, anio))
+        tmp.replace(path)
+        escritos.append(path)
+    return escritos
+
+
+# ==========================
+# LECTURA
+# ==========================
+
+class Paquete:
+    """
+    Parámetros de un año leídos por mmap: los arrays apuntan directo al archivo.
+
+    Se usa en lugar de la lista de parametros_arca (valor, valor_centavos y
+    tramos de calculators.parametros lo reconocen). Iterarlo devuelve los
+    registros como dicts, para el código que recorre la lista.
+    """
+
+    def __init__(self, path: Path, verificar: bool = True):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < TAM_CABECERA:
+            raise ValueError(f"{self.path}: no es un paquete de parámetros")
+        magic, version, _, anio, n_conceptos, n_tramos, sha = CABECERA.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: no es un paquete de parámetros")
+        if version != VERSION:
+            raise ValueError(f"{self.path}: versión {version} no soportada (se espera {VERSION})")
+
+        tam = n_conceptos * CONCEPTO_DTYPE.itemsize + n_tramos * TRAMO_DTYPE.itemsize
+        if len(self._mm) != TAM_CABECERA + tam:
+            raise ValueError(f"{self.path}: tamaño inválido (archivo truncado)")
+        if verificar and hashlib.sha256(self._mm[TAM_CABECERA:]).digest() != sha:
+            raise ValueError(f"{self.path}: checksum inválido")
+
+        self.anio = anio
+        self.sha256 = sha.hex()
+        self.conceptos = np.frombuffer(self._mm, CONCEPTO_DTYPE, n_conceptos, TAM_CABECERA)
+        self.tramos_arr = np.frombuffer(
+            self._mm, TRAMO_DTYPE, n_tramos, TAM_CABECERA + n_conceptos * CONCEPTO_DTYPE.itemsize
+        )
+
+    def __repr__(self):
+        return f"Paquete({self.anio}, conceptos={len(self.conceptos)}, tramos={len(self.tramos_arr)})"
+
+    def _fila(self, concepto: str, anio: int):
+        if anio == self.anio:
+            clave = concepto.encode()
+            i = np.searchsorted(self.conceptos["concepto"], clave)
+            if i < len(self.conceptos) and self.conceptos["concepto"][i] == clave:
+                return self.conceptos[i]
+        raise KeyError(f"{concepto}: sin valor para el año {anio}")
+
+    def valor(self, concepto: str, anio: int) -> float:
+        v = float(self._fila(concepto, anio)["valor_num"])
+        return None if np.isnan(v) else v
+
+    def valor_centavos(self, concepto: str, anio: int) -> int:
+        c = int(self._fila(concepto, anio)["valor_cent"])
+        return None if c == INT_NULO else c
+
+    def tramos(self, prefijo: str, anio: int):
+        """Tramos de la escala como dicts (mismo formato que parametros.tramos)."""
+        if anio == self.anio:
+            clave = prefijo.encode()
+            tablas = self.tramos_arr["tabla"]
+            ini = np.searchsorted(tablas, clave, side="left")
+            fin = np.searchsorted(tablas, clave, side="right")
+            if fin > ini:
+                return [self._tramo_dict(t) for t in self.tramos_arr[ini:fin]]
+        raise KeyError(f"{prefijo}: sin tramos para el año {anio}")
+
+    def _tramo_dict(self, t) -> dict:
+        out = {
+            "concepto": f"{t['tabla'].decode()}{int(t['n'])}",
+            "impuesto": t["impuesto"].decode(),
+            "anio": self.anio,
+        }
+        for c in CAMPOS_TRAMO_FLOAT:
+            v = float(t[c])
+            out[c] = None if np.isnan(v) else v
+        for c in CAMPOS_TRAMO_INT:
+            v = int(t[c])
+            out[c] = None if v == INT_NULO else v
+        return out
+
+    def __iter__(self):
+        for c in self.conceptos:
+            v, cent = float(c["valor_num"]), int(c["valor_cent"])
+            yield {
+                "concepto": c["concepto"].decode(),
+                "impuesto": c["impuesto"].decode(),
+                "anio": self.anio,
+                "valor_num": None if np.isnan(v) else v,
+                "valor_cent": None if cent == INT_NULO else cent,
+            }
+        for t in self.tramos_arr:
+            yield self._tramo_dict(t)
+
+
+class Paquetes:
+    """Varios años (un Paquete por año) con la misma interfaz que un Paquete."""
+
+    def __init__(self, paquetes):
+        self.por_anio = {p.anio: p for p in paquetes}
+
+    def __repr__(self):
+        return f"Paquetes({sorted(self.por_anio)})"
+
+    def _anio(self, anio: int, concepto: str) -> Paquete:
+        try:
+            return self.por_anio[anio]
+        except KeyError:
+            raise KeyError(f"{concepto}: sin paquete para el año {anio}") from None
+
+    def valor(self, concepto: str, anio: int):
+        return self._anio(anio, concepto).valor(concepto, anio)
+
+    def valor_centavos(self, concepto: str, anio: int):
+        return self._anio(anio, concepto).valor_centavos(concepto, anio)
+
+    def tramos(self, prefijo: str, anio: int):
+        return self._anio(anio, prefijo).tramos(prefijo, anio)
+
+    def __iter__(self):
+        for anio in sorted(self.por_anio):
+            yield from self.por_anio[anio]
+
+
+def abrir_paquetes(path: Path, verificar: bool = True):
+    """Un .arcapack (→ Paquete) o una carpeta de paquetes (→ Paquetes)."""
+    path = Path(path)
+    if path.is_dir():
+        archivos = sorted(path.glob(f"*{EXTENSION}"))
+        if not archivos:
+            raise FileNotFoundError(f"No hay paquetes {EXTENSION} en {path}")
+        return Paquetes(Paquete(a, verificar) for a in archivos)
+    return Paquete(path, verificar)
+
+
+# ==========================
+# EJECUCIÓN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera un paquete binario de parámetros por año")
+    parser.add_argument("--parametros", type=Path, default=PARAMETROS_JSON)
+    parser.add_argument("--salida", type=Path, default=PAQUETES_DIR)
+    args = parser.parse_args()
+
+    for path in escribir_paquetes(cargar_parametros(args.parametros), args.salida):
+        paquete = Paquete(path)
+        print(f"📦 {paquete}  sha256={paquete.sha256[:12]}")
+        print(path.resolve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import json
+import re
+from pathlib import Path
+
+from codigo.normalizers.utils import to_centavos
+from codigo.paths import OUTPUTS_DIR
+
+PARAMETROS_JSON = OUTPUTS_DIR / "parametros_arca.json"
+
+RE_TRAMO = re.compile(r"_TRAMO_(\d+)$")
+
+_DEFAULT = None
+
+
+def cargar_parametros(path: Path = PARAMETROS_JSON):
+    """
+    Lee parametros_arca.json (salida de normalize_all). Con un .arcapack o una
+    carpeta de paquetes devuelve el paquete mapeado (ver calculators.paquete).
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"No se encontró parametros_arca.json: {path} (correr normalize_all)")
+    if path.is_dir() or path.suffix == ".arcapack":
+        from codigo.calculators.paquete import abrir_paquetes
+
+        return abrir_paquetes(path)
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def parametros_default():
+    """parametros_arca.json leído una sola vez por proceso."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = cargar_parametros()
+    return _DEFAULT
+
+
+def _sin_anio(parametros, concepto: str, anio: int, que: str = "valor") -> KeyError:
+    """KeyError con los años que sí tiene el concepto (el error típico: pedir ANIO_TRABAJO con datos de otro año)."""
+    anios = sorted({p.get("anio") for p in parametros if (p.get("concepto") or "").startswith(concepto)} - {None})
+    hay = ", ".join(map(str, anios)) if anios else "ninguno"
+    return KeyError(f"{concepto}: sin {que} para el año {anio} (años en parametros_arca.json: {hay})")
+
+
+def valor(parametros, concepto: str, anio: int) -> float:
+    """valor_num de un concepto simple (ej: BP_MINIMO_NO_IMPONIBLE) para el año."""
+    if hasattr(parametros, "valor"):  # paquete binario: búsqueda indexada
+        return parametros.valor(concepto, anio)
+    for p in parametros:
+        if p.get("concepto") == concepto and p.get("anio") == anio:
+            return p.get("valor_num")
+    raise _sin_anio(parametros, concepto, anio)
+
+
+def valor_centavos(parametros, concepto: str, anio: int) -> int:
+    """
+    valor_cent (int) de un concepto simple. Con un parametros_arca.json anterior
+    al punto fijo se deriva de valor_num.
+    """
+    if hasattr(parametros, "valor_centavos"):
+        return parametros.valor_centavos(concepto, anio)
+    for p in parametros:
+        if p.get("concepto") == concepto and p.get("anio") == anio:
+            cent = p.get("valor_cent")
+            return cent if cent is not None else to_centavos(p.get("valor_num"))
+    raise _sin_anio(parametros, concepto, anio)
+
+
+def tramos(parametros, prefijo: str, anio: int):
+    """
+    Tramos de una escala (ej: BP_ALICUOTA_GENERAL_TRAMO_n) ordenados por n.
+    """
+    if hasattr(parametros, "tramos"):
+        return parametros.tramos(prefijo, anio)
+    encontrados = []
+    for p in parametros:
+        concepto = p.get("concepto") or ""
+        if not concepto.startswith(prefijo) or p.get("anio") != anio:
+            continue
+        m = RE_TRAMO.search(concepto)
+        if m:
+            encontrados.append((int(m.group(1)), p))
+
+    if not encontrados:
+        raise _sin_anio(parametros, prefijo, anio, "tramos")
+
+    return [p for _, p in sorted(encontrados, key=lambda x: x[0])]
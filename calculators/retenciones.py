@@ -0,0 +1,49 @@
+import numpy as np
+
+from codigo.calculators.escalas import escala
+from codigo.calculators.ganancias import IMPUESTO, deducciones_art30
+from codigo.calculators.parametros import parametros_default
+
+
+def simular_retenciones(bruto_mensual, anio: int, conyuge=False, hijos=0, hijos_incapaces=0,
+                        deduccion_especial="", parametros=None):
+    """
+    Retenciones mensuales de Ganancias (4ta categoría) por el método acumulado.
+
+    bruto_mensual: matriz (empleados × meses), normalmente 12 columnas.
+    conyuge / hijos / hijos_incapaces / deduccion_especial: un valor por empleado
+    (o escalar), mismos códigos que deducciones_art30.
+
+    Para el mes m los valores anuales del Art. 30 y la escala del Art. 94 se
+    prorratean a m/12. Como la escala es lineal por tramos, la escala
+    prorrateada aplicada a x es (m/12) · escala_anual(x · 12/m), así que todos
+    los meses se evalúan en un solo pase sobre la matriz.
+
+    Devuelve dict de matrices (empleados × meses): ganancia_neta_acumulada,
+    impuesto_acumulado y retencion (negativa = devolución).
+    """
+    if parametros is None:
+        parametros = parametros_default()
+
+    bruto = np.atleast_2d(np.asarray(bruto_mensual, dtype=np.float64))
+    meses = bruto.shape[1]
+    fraccion = np.arange(1, meses + 1, dtype=np.float64) / 12  # (meses,)
+
+    deduccion_anual = np.broadcast_to(
+        deducciones_art30(parametros, anio, conyuge, hijos, hijos_incapaces, deduccion_especial),
+        bruto.shape[:1],
+    )
+
+    bruto_acumulado = np.cumsum(bruto, axis=1)
+    neta_acumulada = np.maximum(bruto_acumulado - deduccion_anual[:, None] * fraccion, 0.0)
+
+    art94 = escala(IMPUESTO, "ART94", anio, parametros)
+    impuesto_acumulado = art94.evaluar_batch(neta_acumulada / fraccion) * fraccion
+
+    retencion = np.diff(impuesto_acumulado, axis=1, prepend=0.0)
+
+    return {
+        "ganancia_neta_acumulada": neta_acumulada,
+        "impuesto_acumulado": impuesto_acumulado,
+        "retencion": retencion,
+    }
@@ -0,0 +1,46 @@
+import csv
+from pathlib import Path
+
+
+# Escritura incremental de chunks columnares (dict columna → lista).
+# La primera llamada fija las columnas; Parquet requiere pyarrow.
+
+class EscritorCSV:
+    def __init__(self, path: Path):
+        self.f = path.open("w", newline="", encoding="utf-8")
+        self.writer = None
+
+    def escribir(self, chunk: dict):
+        columnas = list(chunk)
+        if self.writer is None:
+            self.writer = csv.writer(self.f)
+            self.writer.writerow(columnas)
+        self.writer.writerows(zip(*(chunk[c] for c in columnas)))
+
+    def cerrar(self):
+        self.f.close()
+
+
+class EscritorParquet:
+    def __init__(self, path: Path):
+        self.path = path
+        self.writer = None
+
+    def escribir(self, chunk: dict):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        tabla = pa.table(chunk)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, tabla.schema)
+        self.writer.write_table(tabla.cast(self.writer.schema))
+
+    def cerrar(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def abrir_escritor(path: Path):
+    if path.suffix.lower() == ".parquet":
+        return EscritorParquet(path)
+    return EscritorCSV(path)
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import numpy as np
+
+from codigo.calculators.escalas import escala
+from codigo.calculators.ganancias import IMPUESTO, deducciones_art30
+from codigo.calculators.parametros import parametros_default
+from codigo.calculators.salidas import abrir_escritor
+
+EJES = ("bruto", "hijos", "conyuge", "deduccion_especial")
+
+CHUNK_EXPORT = 500_000
+
+
+def barrido(brutos, anio: int, hijos=(0,), conyuge=(False,), deduccion_especial=("",), parametros=None):
+    """
+    Barrido "qué pasa si" de Ganancias sobre una grilla completa.
+
+    Cada argumento es un eje; la grilla es el producto de todos:
+    (len(brutos), len(hijos), len(conyuge), len(deduccion_especial)).
+    Se evalúa en un solo cálculo con broadcasting, sin armar la grilla fila por fila.
+
+    Devuelve dict con los ejes y arrays densos de esa forma:
+    impuesto, tasa_efectiva (impuesto / bruto) y tasa_marginal
+    (fracción que se lleva el impuesto de $1 adicional de bruto).
+    """
+    if parametros is None:
+        parametros = parametros_default()
+
+    ejes = {
+        "bruto": np.asarray(brutos, dtype=np.float64),
+        "hijos": np.asarray(hijos, dtype=np.float64),
+        "conyuge": np.asarray(conyuge, dtype=bool),
+        "deduccion_especial": np.asarray(deduccion_especial, dtype=str),
+    }
+
+    bruto = ejes["bruto"][:, None, None, None]
+    deducciones = deducciones_art30(
+        parametros, anio,
+        conyuge=ejes["conyuge"][None, None, :, None],
+        hijos=ejes["hijos"][None, :, None, None],
+        deduccion_especial=ejes["deduccion_especial"][None, None, None, :],
+    )
+
+    neta = np.maximum(bruto - deducciones, 0.0)
+    art94 = escala(IMPUESTO, "ART94", anio, parametros)
+
+    impuesto = art94.evaluar_batch(neta)
+    tasa_efectiva = np.divide(impuesto, bruto, out=np.zeros_like(impuesto), where=bruto > 0)
+    tasa_marginal = np.where(bruto > deducciones, art94.tasa_marginal(neta), 0.0)
+
+    return {
+        **ejes,
+        "impuesto": impuesto,
+        "tasa_efectiva": tasa_efectiva,
+        "tasa_marginal": tasa_marginal,
+    }
+
+
+def exportar_barrido(resultado: dict, path: Path, chunk: int = CHUNK_EXPORT):
+    """
+    Escribe el barrido en formato largo (una fila por punto de la grilla) a CSV
+    o Parquet, de a `chunk` filas para no duplicar la grilla en memoria.
+    """
+    forma = resultado["impuesto"].shape
+    total = resultado["impuesto"].size
+    planos = {k: resultado[k].reshape(-1) for k in ("impuesto", "tasa_efectiva", "tasa_marginal")}
+
+    escritor = abrir_escritor(Path(path))
+    try:
+        for inicio in range(0, total, chunk):
+            plano = np.arange(inicio, min(inicio + chunk, total))
+            indices = np.unravel_index(plano, forma)
+            columnas = {eje: resultado[eje][idx].tolist() for eje, idx in zip(EJES, indices)}
+            for k, v in planos.items():
+                columnas[k] = v[plano].tolist()
+            escritor.escribir(columnas)
+    finally:
+        escritor.cerrar()
+
+    return total
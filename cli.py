@@ -0,0 +1,99 @@
+"""
+Comando único `impuestos` (pyproject.toml → [project.scripts]).
+
+Cada subcomando corre el script de siempre como __main__ (mismos argumentos,
+mismo iniciar() / --profile); nada pesado se importa hasta elegir el
+subcomando, así `impuestos --help` arranca en milisegundos.
+
+    impuestos crawl [--dirigido]
+    impuestos explore --year 2024
+    impuestos prefilter
+    impuestos download [ganancias|bienes] [--todo]
+    impuestos parse art30|art94|monedas|bp-alicuotas|bp-determinativa [AÑO]
+    impuestos normalize
+    impuestos load-excel [--sync] [--excel X.xlsx]
+    impuestos inspect html|pdf|bp-determinativa
+    impuestos pipeline [etapas...] [--plan]
+    impuestos search buscar "deducción especial" [--anio 2024]
+    impuestos search indexar [CARPETAS...]
+
+Sin instalar: python -m codigo.cli <subcomando> ...
+"""
+import argparse
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent
+
+# destino: módulo del paquete ("codigo.x") o script suelto (Path, usa imports planos)
+PARSERS = {
+    "art30": "codigo.parsers.parse_art30_raw",
+    "art94": "codigo.parsers.parse_escalas_art94_raw",
+    "monedas": "codigo.parsers.parse_monedas_extranjeras_raw",
+    "bp-alicuotas": "codigo.parsers.parse_bienes_alicuotas_html_raw",
+    "bp-determinativa": "codigo.parsers.parse_bp_determinativa_html_raw",
+}
+INSPECT = {
+    "html": RAIZ / "inspect" / "inspect_html.py",
+    "pdf": RAIZ / "inspect" / "inspect_pdf.py",
+    "bp-determinativa": "codigo.inspect_bp_determinativa",
+}
+COMANDOS = {
+    # nombre: (ayuda, destino o dict de destinos)
+    "crawl": ("mapea el sitio de ARCA (arca_mapper/crawler.py)", RAIZ / "arca_mapper" / "crawler.py"),
+    "explore": ("descarga y analiza fuentes por año (arca_explorer)", RAIZ / "arca_explorer" / "explorer.py"),
+    "prefilter": ("clasifica los PDFs encontrados", RAIZ / "arca_mapper" / "prefilter_pdfs.py"),
+    "download": ("baja los PDFs útiles a files/", RAIZ / "arca_mapper" / "descargar_pdfs.py"),
+    "parse": ("corre un parser raw", PARSERS),
+    "normalize": ("genera parametros_arca.* (normalize_all)", "codigo.normalizers.normalize_all"),
+    "load-excel": ("carga parametros_arca.json en el Excel", "codigo.excel_loader"),
+    "inspect": ("inspección manual de fuentes", INSPECT),
+    "pipeline": ("pipeline incremental completo", "codigo.pipeline"),
+    "search": ("índice de texto completo de PDFs / HTML bajados", "codigo.indice_texto"),
+}
+CRAWLER_DIRIGIDO = RAIZ / "arca_mapper" / "crawler_dirigido.py"
+
+
+def correr(destino, args, prog: str):
+    """Corre el destino como __main__ con sys.argv = [prog, *args]."""
+    import runpy
+
+    sys.argv = [prog, *args]
+    if isinstance(destino, Path):
+        sys.path.insert(0, str(destino.parent))   # arca_mapper / arca_explorer: `from config import ...`
+        runpy.run_path(str(destino), run_name="__main__")
+    else:
+        runpy.run_module(destino, run_name="__main__")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="impuestos",
+        description="Parámetros de ARCA: crawl → parse → normalize → Excel",
+        epilog="Los argumentos después del subcomando van al script (ej: impuestos load-excel --help).",
+    )
+    sub = parser.add_subparsers(dest="comando", metavar="COMANDO", required=True)
+
+    for nombre, (ayuda, destino) in COMANDOS.items():
+        p = sub.add_parser(nombre, help=ayuda, description=ayuda, add_help=isinstance(destino, dict))
+        if isinstance(destino, dict):
+            p.add_argument("cual", choices=list(destino))
+        if nombre == "crawl":
+            p.add_argument("--dirigido", action="store_true", help="crawler_dirigido.py (semillas fijas)")
+
+    # lo que no es del subcomando va tal cual al script
+    args, resto = parser.parse_known_args(argv)
+    ayuda, destino = COMANDOS[args.comando]
+    prog = f"impuestos {args.comando}"
+
+    if isinstance(destino, dict):
+        destino = destino[args.cual]
+        prog += f" {args.cual}"
+    elif args.comando == "crawl" and args.dirigido:
+        destino = CRAWLER_DIRIGIDO
+
+    correr(destino, resto, prog)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Documentos repetidos: ARCA republica el mismo PDF con otra URL / otro nombre
+(liquidación anual vs. final, anexos por sección) y a la vez usa el mismo
+nombre de archivo para documentos distintos.
+
+- Duplicado exacto: mismo sha256 del contenido → se reusa el análisis.
+- Casi duplicado: simhash (64 bits) de shingles de palabras del texto de las
+  primeras páginas a ≤ UMBRAL_CASI bits de uno ya visto, con la misma
+  cantidad de páginas y los mismos años en el texto → se agrupa con ese, pero
+  se analiza igual (la edición de otro período fiscal cambia pocas palabras
+  y muchos montos).
+- Los archivos se guardan con el nombre de la URL; si ese nombre ya es de
+  otro contenido, con el sufijo -<sha[:8]>.
+
+El índice (documentos.json, junto a los archivos) persiste entre corridas:
+
+    documentos = IndiceDocumentos(OUTPUT_DIR / "documentos.json")
+    path, analisis, previo = documentos.registrar_pdf(OUTPUT_DIR, url, r.content, analyze_pdf)
+    ...
+    documentos.guardar()
+    documentos.grupos()   # [[url, url, ...], ...] equivalentes entre sí
+"""
+import hashlib
+import json
+import re
+import unicodedata
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from codigo.metricas import contar
+
+BITS = 64
+SHINGLE = 4                  # palabras por shingle
+UMBRAL_CASI = 6              # bits distintos para agruparlos como el mismo documento
+                             # (una palabra cambiada en ~70 mueve ~6; documentos distintos, ~30)
+BANDAS = UMBRAL_CASI + 1     # con ≤6 bits distintos, alguna de las 7 bandas de 9 bits coincide entera
+PAGINAS_HUELLA = 2           # páginas de texto que entran en el simhash
+
+_RE_PALABRA = re.compile(r"\w+")
+_RE_ANIO = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
+
+# ==========================
+# HUELLAS
+# ==========================
+
+def hash_contenido(datos: bytes) -> str:
+    return hashlib.sha256(datos).hexdigest()
+
+
+def _palabras(texto: str) -> list:
+    sin_acentos = unicodedata.normalize("NFKD", texto.lower()).encode("ascii", "ignore").decode()
+    return _RE_PALABRA.findall(sin_acentos)
+
+
+def simhash(texto: str):
+    """Simhash de shingles de SHINGLE palabras (None si no hay texto)."""
+    palabras = _palabras(texto)
+    if not palabras:
+        return None
+
+    pesos = [0] * BITS
+    for i in range(max(len(palabras) - SHINGLE + 1, 1)):
+        shingle = " ".join(palabras[i:i + SHINGLE])
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=BITS // 8).digest(), "big")
+        for b in range(BITS):
+            pesos[b] += 1 if h >> b & 1 else -1
+
+    return sum(1 << b for b in range(BITS) if pesos[b] > 0)
+
+
+def distancia(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def huella_pdf(path: Path):
+    """
+    (simhash, páginas, años) del PDF: simhash y años ("2023", "2024"...) del
+    texto de las primeras PAGINAS_HUELLA páginas. (None, None, None) si no se
+    puede leer.
+    """
+    import pdfplumber  # recién acá, como en los analyzers
+
+    try:
+        with pdfplumber.open(path) as pdf:
+            texto = "\n".join(p.extract_text() or "" for p in pdf.pages[:PAGINAS_HUELLA])
+            paginas = len(pdf.pages)
+    except Exception:
+        return None, None, None
+    return simhash(texto), paginas, sorted(set(_RE_ANIO.findall(texto)))
+
+
+def nombre_archivo(url: str) -> str:
+    return unquote(urlparse(url).path.rsplit("/", 1)[-1]) or "documento.pdf"
+
+
+def _escribir(path: Path, contenido: bytes):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(contenido)
+    tmp.replace(path)
+
+
+# ==========================
+# ÍNDICE
+# ==========================
+
+class IndiceDocumentos:
+    """sha256 → {"archivo", "urls", "simhash", "paginas", "anios", "analisis", "casi_de"} guardado en un JSON."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.docs = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        self._por_url = {}
+        self._por_archivo = {}
+        self._bandas = {}
+        for sha, doc in self.docs.items():
+            self._indexar(sha, doc)
+
+    def _indexar(self, sha: str, doc: dict):
+        for url in doc["urls"]:
+            self._por_url[url] = sha
+        self._por_archivo[doc["archivo"]] = sha
+        if doc.get("simhash") is not None:
+            for banda in self._claves_bandas(doc["simhash"]):
+                self._bandas.setdefault(banda, []).append(sha)
+
+    @staticmethod
+    def _claves_bandas(huella: int):
+        ancho = BITS // BANDAS
+        return [(i, huella >> (i * ancho) & ((1 << ancho) - 1)) for i in range(BANDAS)]
+
+    # ==========================
+    # CONSULTAS
+    # ==========================
+
+    def por_url(self, url: str):
+        sha = self._por_url.get(url)
+        return self.docs[sha] if sha else None
+
+    def conoce_archivo(self, nombre: str) -> bool:
+        """True si `nombre` es el archivo de algún documento del índice."""
+        return nombre in self._por_archivo
+
+    def casi_duplicado(self, huella, paginas=None, anios=None):
+        """
+        (sha, distancia) del documento más parecido a ≤ UMBRAL_CASI bits, o
+        None. Con `paginas` / `anios`, sólo entre los que tienen los mismos.
+        """
+        if huella is None:
+            return None
+        candidatos = {
+            sha for banda in self._claves_bandas(huella) for sha in self._bandas.get(banda, ())
+            if (paginas is None or self.docs[sha].get("paginas") == paginas)
+            and (anios is None or self.docs[sha].get("anios") == anios)
+        }
+        mejor = min(((distancia(huella, self.docs[sha]["simhash"]), sha) for sha in candidatos), default=None)
+        if mejor and mejor[0] <= UMBRAL_CASI:
+            return mejor[1], mejor[0]
+        return None
+
+    def canonico(self, sha: str) -> str:
+        """El primer documento del grupo (los casi duplicados apuntan a él)."""
+        return self.docs[sha].get("casi_de") or sha
+
+    def grupos(self) -> list:
+        """URLs equivalentes (exactas o casi), sólo los grupos con más de una."""
+        grupos = {}
+        for sha, doc in self.docs.items():
+            grupos.setdefault(self.canonico(sha), []).extend(doc["urls"])
+        return [urls for urls in grupos.values() if len(urls) > 1]
+
+    # ==========================
+    # ALTAS
+    # ==========================
+
+    def archivo_para(self, directorio: Path, url: str, sha: str) -> Path:
+        """Nombre de la URL, salvo que ya lo use otro contenido."""
+        nombre = nombre_archivo(url)
+        path = directorio / nombre
+        dueno = self._por_archivo.get(nombre)
+        if dueno is None and path.exists():
+            dueno = hash_contenido(path.read_bytes())   # archivo de antes del índice
+        if dueno is None or dueno == sha:
+            return path
+        return path.with_name(f"{path.stem}-{sha[:8]}{path.suffix}")
+
+    def _olvidar_url(self, directorio: Path, url: str, sha: str):
+        """
+        Saca `url` del documento `sha` (ARCA cambió el contenido de esa URL). Si
+        no le quedan URLs, el documento y su archivo se borran: el nombre queda
+        libre para el contenido nuevo.
+        """
+        doc = self.docs[sha]
+        doc["urls"].remove(url)
+        del self._por_url[url]
+        if doc["urls"]:
+            return
+
+        del self.docs[sha]
+        if self._por_archivo.get(doc["archivo"]) == sha:
+            del self._por_archivo[doc["archivo"]]
+            (directorio / doc["archivo"]).unlink(missing_ok=True)
+        for shas in self._bandas.values():
+            if sha in shas:
+                shas.remove(sha)
+        for otro in self.docs.values():
+            if otro.get("casi_de") == sha:
+                otro["casi_de"] = None
+        contar("pdf_reemplazados")
+
+    def registrar_pdf(self, directorio: Path, url: str, contenido: bytes, analizar):
+        """
+        Guarda y analiza un PDF bajado, salvo que ya se conozca su contenido
+        exacto. Un casi duplicado se analiza igual y queda en el grupo del otro.
+        → (path, análisis, previo) con previo = {"url", "equivalencia"} si es
+        equivalente a uno anterior. Si la URL ya se conocía con otro contenido,
+        se reemplaza.
+        """
+        sha = hash_contenido(contenido)
+
+        anterior = self._por_url.get(url)
+        if anterior is not None and anterior != sha:
+            self._olvidar_url(directorio, url, anterior)
+
+        if sha in self.docs:
+            doc = self.docs[sha]
+            path = directorio / doc["archivo"]
+            if not path.exists():
+                _escribir(path, contenido)
+            if url in doc["urls"]:
+                contar("pdf_cache_hits")   # la misma URL en otra corrida, sin cambios
+            else:
+                contar("pdf_duplicados", tipo="exacto")
+                doc["urls"].append(url)
+                self._por_url[url] = sha
+            return path, doc["analisis"], self._previo(sha, url)
+
+        path = self.archivo_para(directorio, url, sha)
+        _escribir(path, contenido)
+
+        huella, paginas, anios = huella_pdf(path)
+        casi = self.casi_duplicado(huella, paginas, anios)
+        if casi:
+            contar("pdf_duplicados", tipo="casi")
+        analisis = analizar(path)
+
+        doc = {
+            "archivo": path.name,
+            "urls": [url],
+            "simhash": huella,
+            "paginas": paginas,
+            "anios": anios,
+            "analisis": analisis,
+            "casi_de": self.canonico(casi[0]) if casi else None,
+        }
+        self.docs[sha] = doc
+        self._indexar(sha, doc)
+        return path, analisis, self._previo(sha, url)
+
+    def _previo(self, sha: str, url: str):
+        """Documento anterior equivalente a `url` (None si es el primero de su grupo)."""
+        doc = self.docs[sha]
+        if doc.get("casi_de"):
+            original = self.docs[doc["casi_de"]]
+            return {
+                "url": original["urls"][0],
+                "equivalencia": "casi",
+                "bits_distintos": distancia(doc["simhash"], original["simhash"]),
+            }
+        if url != doc["urls"][0]:
+            return {"url": doc["urls"][0], "equivalencia": "exacta"}
+        return None
+
+    def guardar(self):
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self.docs, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
@@ -0,0 +1,105 @@
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from tqdm import tqdm
+
+from codigo.calculators.parametros import PARAMETROS_JSON
+from codigo.excel_loader import sync
+
+_DATA = None  # parametros_arca.json, una copia por worker
+
+
+# ==========================
+# LIBROS
+# ==========================
+
+def listar_libros(origen: str):
+    """Carpeta (todos los .xlsx) o glob ("clientes/**/*.xlsx"). Ignora los lock "~$" de Excel."""
+    if Path(origen).is_dir():
+        paths = Path(origen).glob("*.xlsx")
+    else:
+        paths = (Path(p) for p in glob.glob(origen, recursive=True))
+    return sorted(p for p in paths if p.is_file() and not p.name.startswith("~$"))
+
+
+# ==========================
+# WORKERS
+# ==========================
+
+def _init_worker(data):
+    global _DATA
+    _DATA = data
+
+
+def actualizar_libro(path: Path) -> dict:
+    """Sync de un libro. Cualquier error queda en el resultado: no corta el resto."""
+    t0 = time.perf_counter()
+    try:
+        stats, guardado = sync(path, _DATA, mostrar_diff=False)
+    except Exception as e:
+        return {"archivo": str(path), "estado": "error", "error": f"{type(e).__name__}: {e}",
+                "segundos": time.perf_counter() - t0}
+    return {"archivo": str(path), "estado": "actualizado" if guardado else "sin_cambios",
+            **stats, "segundos": time.perf_counter() - t0}
+
+
+# ==========================
+# EJECUCIÓN
+# ==========================
+
+def run(origen: str, parametros_path: Path = PARAMETROS_JSON, workers: int = None, resumen: Path = None):
+    """Aplica el mismo upsert de Parametros_ARCA a cada libro, en un pool de procesos."""
+    libros = listar_libros(origen)
+    if not libros:
+        print(f"⚠️ No hay libros en {origen}")
+        return []
+
+    data = json.loads(Path(parametros_path).read_text(encoding="utf-8"))
+    workers = min(workers or os.cpu_count() or 1, len(libros))
+    t0 = time.perf_counter()
+
+    resultados = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,)) as pool:
+        futuros = [pool.submit(actualizar_libro, p) for p in libros]
+        for fut in tqdm(as_completed(futuros), total=len(futuros), desc="Libros", unit="libro"):
+            resultados.append(fut.result())
+
+    resultados.sort(key=lambda r: r["archivo"])
+    elapsed = time.perf_counter() - t0
+
+    por_estado = {e: [r for r in resultados if r["estado"] == e] for e in ("actualizado", "sin_cambios", "error")}
+    for r in por_estado["actualizado"]:
+        print(f"✏️ {r['archivo']}  (+{r['insertados']} / ~{r['actualizados']})")
+    for r in por_estado["error"]:
+        print(f"❌ {r['archivo']}  {r['error']}")
+
+    print(f"✅ {len(libros)} libros en {elapsed:.1f}s con {workers} workers: "
+          f"{len(por_estado['actualizado'])} actualizados, "
+          f"{len(por_estado['sin_cambios'])} sin cambios, "
+          f"{len(por_estado['error'])} con error")
+
+    if resumen:
+        Path(resumen).write_text(json.dumps(resultados, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(Path(resumen).resolve())
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Actualiza Parametros_ARCA en muchos libros de clientes")
+    parser.add_argument("libros", help="carpeta con .xlsx o glob (entre comillas)")
+    parser.add_argument("--parametros", type=Path, default=PARAMETROS_JSON)
+    parser.add_argument("--workers", type=int, default=None, help="procesos (default: núcleos)")
+    parser.add_argument("--resumen", type=Path, default=None, help="JSON con el resultado por libro")
+    args = parser.parse_args()
+
+    run(args.libros, args.parametros, args.workers, args.resumen)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
+import argparse
 import json
+import time
 from openpyxl import load_workbook
 from pathlib import Path
 
+from codigo.metricas import contar, iniciar, span
+from codigo.paths import OUTPUTS_DIR
+
 # ==========================
 # CONFIGURACIÓN
 # ==========================
 
 EXCEL_PATH = Path(r"C:\Users\franl\Desktop\impuestos\CH - Anuales 2024.xlsx")
-JSON_PATH = Path(r"C:\Users\franl\Desktop\impuestos\outputs\parametros_arca.json")
+JSON_PATH = OUTPUTS_DIR / "parametros_arca.json"
 SHEET_NAME = "Parametros_ARCA"
 
 # 👉 PONER EN True SOLO ESTA VEZ
@@ -30,56 +35,226 @@ HEADER_MAP = {
 
 NUMERIC_COLS = {"VALOR", "DESDE", "HASTA", "MONTO_FIJO", "EXCEDENTE_DESDE", "PORCENTAJE"}
 
+KEY_COLS = ("CONCEPTO", "IMPUESTO", "AÑO")
+
 
 # ==========================
-# EJECUCIÓN
+# ÍNDICE DE LA HOJA
 # ==========================
 
-def main():
-    data = json.loads(JSON_PATH.read_text(encoding="utf-8"))
+def indexar_hoja(ws):
+    """
+    Un solo pase con iter_rows(values_only=True): sin crear objetos Cell.
 
-    wb = load_workbook(EXCEL_PATH)
-    ws = wb[SHEET_NAME]
-
-    # 🧹 Limpieza controlada (solo una vez)
-    if REBUILD:
-        ws.delete_rows(2, ws.max_row)
-
-    headers = [c.value for c in ws[1]]
-    excel_cols = {h: i+1 for i, h in enumerate(headers)}
+    Devuelve (excel_cols, existing):
+      excel_cols  header → número de columna (1-based)
+      existing    (concepto, impuesto, año) → (fila, lista de valores actuales)
+    """
+    filas = ws.iter_rows(values_only=True)
+    headers = next(filas, ())
+    excel_cols = {h: i + 1 for i, h in enumerate(headers) if h is not None}
+    pos_key = [excel_cols[c] - 1 for c in KEY_COLS]
 
     existing = {}
-    for r in range(2, ws.max_row + 1):
-        key = (
-            ws.cell(r, excel_cols["CONCEPTO"]).value,
-            ws.cell(r, excel_cols["IMPUESTO"]).value,
-            ws.cell(r, excel_cols["AÑO"]).value,
-        )
+    for r, valores in enumerate(filas, start=2):
+        valores = list(valores)
+        key = tuple(valores[p] if p < len(valores) else None for p in pos_key)
         if all(key):
-            existing[key] = r
+            existing[key] = (r, valores)
+
+    return excel_cols, existing
+
+
+# ==========================
+# DIFF + UPSERT
+# ==========================
+
+def _valores_item(item, excel_cols):
+    """(header, columna, valor) de cada campo del JSON que va a la hoja."""
+    return [
+        (x_key, excel_cols[x_key], item[j_key])
+        for j_key, x_key in HEADER_MAP.items()
+        if j_key in item
+    ]
+
+
+def calcular_diff(ws, data):
+    """
+    Compara los registros de parametros_arca.json con los valores actuales de la hoja
+    por clave (CONCEPTO, IMPUESTO, AÑO), sin escribir nada.
+
+    Devuelve (cambios, stats):
+      cambios  lista de dicts fila/clave/header/columna/antes/despues/nueva, uno por celda
+      stats    conteos insertados, actualizados, sin_cambios
+    """
+    excel_cols, existing = indexar_hoja(ws)
+
+    cambios = []
+    tocadas = set()
+    stats = {"insertados": 0, "actualizados": 0, "sin_cambios": 0}
+    proxima = (ws.max_row or 1) + 1
 
     for item in data:
         key = (item["concepto"], item["impuesto"], item["anio"])
+        nuevos = _valores_item(item, excel_cols)
 
         if key in existing:
-            row = existing[key]
+            row, actuales = existing[key]
+            nueva = False
         else:
-            row = ws.max_row + 1
-            existing[key] = row
+            row, actuales = proxima, []
+            proxima += 1
+            existing[key] = (row, actuales)
+            nueva = True
+            stats["insertados"] += 1
+
+        distintos = [
+            (h, col, v) for h, col, v in nuevos
+            if (actuales[col - 1] if col <= len(actuales) else None) != v
+        ]
+        if not nueva:
+            if not distintos:
+                stats["sin_cambios"] += 1
+                continue
+            if row not in tocadas:
+                stats["actualizados"] += 1
+        tocadas.add(row)
+
+        # el índice refleja lo escrito (por si el JSON repite la clave)
+        ancho = max((col for _, col, _ in nuevos), default=0)
+        if len(actuales) < ancho:
+            actuales.extend([None] * (ancho - len(actuales)))
+        for h, col, v in distintos:
+            cambios.append({
+                "fila": row, "clave": key, "header": h, "columna": col,
+                "antes": actuales[col - 1], "despues": v, "nueva": nueva,
+            })
+            actuales[col - 1] = v
+
+    return cambios, stats
+
+
+def escribir_cambios(ws, cambios):
+    """Escribe sólo las celdas del diff, en orden de fila."""
+    for c in sorted(cambios, key=lambda c: (c["fila"], c["columna"])):
+        cell = ws.cell(c["fila"], c["columna"])
+        value = c["despues"]
+        cell.value = value
+
+        # 🧮 Blindaje contable
+        if c["header"] in NUMERIC_COLS and isinstance(value, (int, float)):
+            cell.number_format = '#,##0.00'
+
+
+def upsert(ws, data):
+    """
+    Aplica los registros de parametros_arca.json sobre la hoja.
+
+    Sólo se escriben las celdas cuyo valor cambió; las filas nuevas van al final.
+    Devuelve conteos: insertados, actualizados, sin_cambios.
+    """
+    cambios, stats = calcular_diff(ws, data)
+    escribir_cambios(ws, cambios)
+    return stats
 
-        for j_key, x_key in HEADER_MAP.items():
-            if j_key in item:
-                cell = ws.cell(row, excel_cols[x_key])
-                value = item[j_key]
-                cell.value = value
 
-                # 🧮 Blindaje contable
-                if x_key in NUMERIC_COLS and isinstance(value, (int, float)):
-                    cell.number_format = '#,##0.00'
+def imprimir_diff(cambios):
+    """➕ filas nuevas (una línea por clave) y ✏️ celdas modificadas (antes → después)."""
+    nuevas = set()
+    for c in cambios:
+        clave = " | ".join(str(k) for k in c["clave"])
+        if c["nueva"]:
+            if c["fila"] not in nuevas:
+                nuevas.add(c["fila"])
+                print(f"   ➕ fila {c['fila']}: {clave}")
+        else:
+            print(f"   ✏️ fila {c['fila']}: {clave}  {c['header']}: {c['antes']!r} → {c['despues']!r}")
+
+
+# ==========================
+# SINCRONIZACIÓN
+# ==========================
+
+def sync(excel_path: Path, data, mostrar_diff: bool = True):
+    """
+    Pre-pase read-only para calcular el diff; el libro sólo se abre en modo
+    edición (y se guarda) si hay algo que cambiar.
+
+    Devuelve (stats, guardado).
+    """
+    with span("excel_diff"):
+        wb = load_workbook(excel_path, read_only=True)
+        try:
+            cambios, stats = calcular_diff(wb[SHEET_NAME], data)
+        finally:
+            wb.close()
+
+    if mostrar_diff:
+        imprimir_diff(cambios)
+    if not cambios:
+        return stats, False
+
+    with span("excel_abrir"):
+        wb = load_workbook(excel_path)
+    with span("excel_upsert"):
+        stats = upsert(wb[SHEET_NAME], data)
+    with span("excel_guardar"):
+        wb.save(excel_path)
+    return stats, True
+
+
+# ==========================
+# EJECUCIÓN
+# ==========================
+
+def _resumen(stats, t0):
+    return (f"➕ {stats['insertados']} insertados | ✏️ {stats['actualizados']} actualizados | "
+            f"= {stats['sin_cambios']} sin cambios | ⏱️ {time.perf_counter() - t0:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga parametros_arca.json en la hoja Parametros_ARCA")
+    parser.add_argument("--sync", action="store_true",
+                        help="sólo escribe celdas distintas, imprime el diff y no guarda si no hay cambios")
+    parser.add_argument("--excel", type=Path, default=EXCEL_PATH)
+    parser.add_argument("--parametros", type=Path, default=JSON_PATH)
+    parser.add_argument("--profile", nargs="?", const="cprofile", metavar="MODO",
+                        help="perfilar la corrida (cprofile | muestreo) en outputs/perfiles/")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    data = json.loads(args.parametros.read_text(encoding="utf-8"))
+
+    if args.sync and not REBUILD:
+        stats, guardado = sync(args.excel, data)
+        for estado, n in stats.items():
+            contar("filas", n, estado=estado)
+        if guardado:
+            print("✅ Excel sincronizado (sólo celdas modificadas)")
+        else:
+            print("✅ Sin cambios: el Excel ya está al día (no se guardó)")
+        print(f"   {_resumen(stats, t0)}")
+        return
+
+    with span("excel_abrir"):
+        wb = load_workbook(args.excel)
+    ws = wb[SHEET_NAME]
+
+    # 🧹 Limpieza controlada (solo una vez)
+    if REBUILD:
+        ws.delete_rows(2, ws.max_row)
+
+    with span("excel_upsert"):
+        stats = upsert(ws, data)
+    for estado, n in stats.items():
+        contar("filas", n, estado=estado)
 
-    wb.save(EXCEL_PATH)
+    with span("excel_guardar"):
+        wb.save(args.excel)
     print("✅ Excel actualizado correctamente (formato contable seguro)")
+    print(f"   {_resumen(stats, t0)}")
 
 
 if __name__ == "__main__":
+    iniciar("excel_loader")
     main()
@@ -0,0 +1,325 @@
+"""
+Índice de texto completo (SQLite FTS5) de lo bajado de ARCA: texto por
+página de los PDFs y por bloque (título, párrafo, ítem, fila de tabla) de
+los HTML. Acentos y mayúsculas no importan ("deduccion" encuentra
+"Deducción").
+
+Se llena solo mientras se baja (crawler.py y explorer.py) y se completa
+con lo que ya está en disco (files/, arca_explorer/sources/) con `indexar`;
+cada fuente se reindexa sólo si cambió. El texto se guarda una vez por
+contenido (sha256): el mismo PDF bajo otra URL o en disco sólo suma la fuente.
+
+    python -m codigo.indice_texto buscar "deducción especial"
+    python -m codigo.indice_texto buscar "ganancia no imponible" --anio 2024
+    python -m codigo.indice_texto buscar --fts 'alicuota NEAR(exterior, 5)'
+    python -m codigo.indice_texto indexar [CARPETAS...]
+"""
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from codigo.metricas import contar, iniciar, log, span
+from codigo.paths import FILES_DIR, OUTPUTS_DIR
+
+# IMPUESTOS_INDICE_DB manda el índice a otro lado (pruebas contra un ARCA local)
+INDICE_DB = Path(os.getenv("IMPUESTOS_INDICE_DB", OUTPUTS_DIR / "indice_texto.sqlite"))
+CARPETAS = [FILES_DIR, Path(__file__).resolve().parent / "arca_explorer" / "sources"]
+LIMITE = 20
+PALABRAS_SNIPPET = 16
+
+# elementos que son un bloque de texto (los anidados van con el de afuera)
+BLOQUES_HTML = ["h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "tr", "caption", "dt", "dd", "pre", "blockquote"]
+
+_RE_ANIO = re.compile(r"(?<!\d)(20\d{2})(?!\d)")
+
+VERSION = 2   # PRAGMA user_version; un índice de otra versión se rehace (es un caché)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS documentos (
+    id INTEGER PRIMARY KEY,
+    firma TEXT UNIQUE NOT NULL,       -- sha256 del contenido: un documento por contenido
+    tipo TEXT NOT NULL,               -- pdf | html
+    anio TEXT,
+    indexado TEXT
+);
+CREATE TABLE IF NOT EXISTS fuentes (
+    fuente TEXT PRIMARY KEY,          -- URL o path
+    documento INTEGER NOT NULL REFERENCES documentos(id)
+);
+CREATE INDEX IF NOT EXISTS fuentes_documento ON fuentes(documento);
+CREATE TABLE IF NOT EXISTS fragmentos (
+    id INTEGER PRIMARY KEY,
+    documento INTEGER NOT NULL REFERENCES documentos(id),
+    posicion INTEGER NOT NULL,        -- página (PDF) o bloque (HTML), desde 1
+    texto TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fragmentos_documento ON fragmentos(documento);
+CREATE VIRTUAL TABLE IF NOT EXISTS fragmentos_fts USING fts5(
+    texto,
+    content = 'fragmentos',
+    content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def _sha256(datos) -> str:
+    if isinstance(datos, str):
+        datos = datos.encode("utf-8")
+    return hashlib.sha256(datos).hexdigest()
+
+
+def bloques_html(html: str) -> list:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+
+    bloques = []
+    for el in soup.find_all(BLOQUES_HTML):
+        if el.find_parent(BLOQUES_HTML):
+            continue
+        texto = el.get_text(" | " if el.name == "tr" else " ", strip=True)
+        if texto:
+            bloques.append(texto)
+    return bloques
+
+
+def paginas_pdf(path: Path) -> list:
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return [p.extract_text() or "" for p in pdf.pages]
+
+
+def consulta_fts(textos: list) -> str:
+    """Cada texto como frase exacta (las comillas se escapan); todas tienen que estar."""
+    return " AND ".join('"' + t.replace('"', '""') + '"' for t in textos if t.strip())
+
+
+# ==========================
+# ÍNDICE
+# ==========================
+
+class IndiceTexto:
+    def __init__(self, path: Path = INDICE_DB):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.con = sqlite3.connect(path)
+        self.con.execute("PRAGMA journal_mode=WAL")   # se puede buscar con un crawl escribiendo
+        if self.con.execute("PRAGMA user_version").fetchone()[0] != VERSION:
+            with self.con:
+                for tabla in ("fragmentos_fts", "fragmentos", "fuentes", "documentos"):
+                    self.con.execute(f"DROP TABLE IF EXISTS {tabla}")
+                self.con.execute(f"PRAGMA user_version = {VERSION}")
+        self.con.executescript(ESQUEMA)
+
+    def al_dia(self, fuente: str, firma: str) -> bool:
+        fila = self.con.execute(
+            "SELECT d.firma FROM fuentes f JOIN documentos d ON d.id = f.documento WHERE f.fuente = ?",
+            (fuente,),
+        ).fetchone()
+        return fila is not None and fila[0] == firma
+
+    def documento(self, firma: str):
+        """id del documento con ese contenido (None si todavía no se indexó)."""
+        fila = self.con.execute("SELECT id FROM documentos WHERE firma = ?", (firma,)).fetchone()
+        return fila[0] if fila else None
+
+    def _borrar(self, documento: int):
+        # tabla FTS con contenido externo: hay que sacarle cada fila a mano
+        self.con.execute(
+            "INSERT INTO fragmentos_fts(fragmentos_fts, rowid, texto) "
+            "SELECT 'delete', id, texto FROM fragmentos WHERE documento = ?",
+            (documento,),
+        )
+        self.con.execute("DELETE FROM fragmentos WHERE documento = ?", (documento,))
+
+    def _enlazar(self, fuente: str, documento: int):
+        """Apunta `fuente` a `documento`; el contenido que tenía antes se borra si ya nadie lo usa."""
+        fila = self.con.execute("SELECT documento FROM fuentes WHERE fuente = ?", (fuente,)).fetchone()
+        self.con.execute("INSERT OR REPLACE INTO fuentes (fuente, documento) VALUES (?, ?)", (fuente, documento))
+        if fila and fila[0] != documento:
+            anterior = fila[0]
+            if not self.con.execute("SELECT 1 FROM fuentes WHERE documento = ?", (anterior,)).fetchone():
+                self._borrar(anterior)
+                self.con.execute("DELETE FROM documentos WHERE id = ?", (anterior,))
+
+    def agregar(self, fuente: str, tipo: str, textos: list, firma: str, anio: str = None) -> bool:
+        """
+        Indexa los fragmentos (páginas o bloques) de un documento. Si el mismo
+        contenido ya está (otra URL / path) sólo se agrega la fuente y
+        `textos` no se usa. False si ya estaba al día o si no hay texto: un
+        documento sin fragmentos no se registra, así se vuelve a intentar.
+        """
+        if self.al_dia(fuente, firma):
+            contar("indice_sin_cambios", tipo=tipo)
+            return False
+
+        documento = self.documento(firma)
+        if documento is not None:
+            with self.con:
+                self._enlazar(fuente, documento)
+            contar("indice_duplicados", tipo=tipo)
+            return True
+
+        if not any(t.strip() for t in textos):
+            contar("indice_sin_texto", tipo=tipo)
+            log.debug("Sin texto para indexar: %s", fuente)
+            return False
+
+        if anio is None:
+            # de la URL / nombre; si no tiene (anexo-000.pdf), del comienzo del texto ("PERIODO FISCAL 2024")
+            m = _RE_ANIO.search(fuente) or _RE_ANIO.search(next((t for t in textos if t.strip()), "")[:500])
+            anio = m.group(1) if m else None
+
+        with span("indice_agregar", tipo=tipo), self.con:
+            documento = self.con.execute(
+                "INSERT INTO documentos (firma, tipo, anio, indexado) VALUES (?, ?, ?, ?)",
+                (firma, tipo, anio, datetime.now().isoformat(timespec="seconds")),
+            ).lastrowid
+            self._enlazar(fuente, documento)
+
+            insertados = 0
+            for posicion, texto in enumerate(textos, start=1):
+                if not texto.strip():
+                    continue
+                rowid = self.con.execute(
+                    "INSERT INTO fragmentos (documento, posicion, texto) VALUES (?, ?, ?)",
+                    (documento, posicion, texto),
+                ).lastrowid
+                self.con.execute("INSERT INTO fragmentos_fts(rowid, texto) VALUES (?, ?)", (rowid, texto))
+                insertados += 1
+
+        contar("indice_documentos", tipo=tipo)
+        contar("indice_fragmentos", insertados, tipo=tipo)
+        return True
+
+    def agregar_html(self, fuente: str, html: str, anio: str = None) -> bool:
+        sha = _sha256(html)
+        if self.al_dia(fuente, sha):
+            return False
+        return self.agregar(fuente, "html", bloques_html(html), sha, anio)
+
+    def agregar_pdf(self, fuente: str, paginas: list, contenido: bytes, anio: str = None, path: Path = None) -> bool:
+        """
+        `paginas`: texto por página si ya se extrajo (analyze_pdf). Si no (PDF
+        repetido que no se analizó) y el contenido no está indexado, se lee de `path`.
+        """
+        sha = _sha256(contenido)
+        if not paginas and path is not None and self.documento(sha) is None:
+            paginas = paginas_pdf(path)
+        return self.agregar(fuente, "pdf", paginas or [], sha, anio)
+
+    def agregar_archivo(self, path: Path) -> bool:
+        """PDF o HTML de disco (fuente = path). Si el contenido ya se bajó por URL, sólo suma la fuente."""
+        contenido = path.read_bytes()
+        sha = _sha256(contenido)
+        if self.al_dia(str(path), sha):
+            return False
+        tipo = "pdf" if path.suffix.lower() == ".pdf" else "html"
+        if self.documento(sha) is not None:
+            return self.agregar(str(path), tipo, [], sha)
+        if tipo == "pdf":
+            return self.agregar(str(path), "pdf", paginas_pdf(path), sha)
+        return self.agregar(str(path), "html", bloques_html(contenido.decode("utf-8", "replace")), sha)
+
+    def buscar(self, consulta: str, anio: str = None, limite: int = LIMITE) -> list:
+        """
+        → [(fuente, tipo, anio, posición, snippet, otras)] por relevancia (bm25).
+        fuente: una URL si hay (si no, el path); otras: cuántas fuentes más tienen el mismo contenido.
+        """
+        sql = f"""
+            SELECT (SELECT fuente FROM fuentes WHERE documento = d.id
+                    ORDER BY fuente NOT LIKE 'http%', rowid LIMIT 1),
+                   d.tipo, d.anio, f.posicion,
+                   snippet(fragmentos_fts, 0, '[', ']', '…', {PALABRAS_SNIPPET}),
+                   (SELECT count(*) - 1 FROM fuentes WHERE documento = d.id)
+            FROM fragmentos_fts
+            JOIN fragmentos f ON f.id = fragmentos_fts.rowid
+            JOIN documentos d ON d.id = f.documento
+            WHERE fragmentos_fts MATCH ?
+        """
+        params = [consulta]
+        if anio:
+            sql += " AND d.anio = ?"
+            params.append(anio)
+        sql += " ORDER BY bm25(fragmentos_fts) LIMIT ?"
+        params.append(limite)
+
+        with span("indice_buscar"):
+            return self.con.execute(sql, params).fetchall()
+
+    def close(self):
+        self.con.close()
+
+
+# ==========================
+# CLI
+# ==========================
+
+def indexar(carpetas) -> tuple:
+    indice = IndiceTexto()
+    nuevos = sin_cambios = 0
+    for carpeta in carpetas:
+        for path in sorted(Path(carpeta).rglob("*")):
+            if path.suffix.lower() not in (".pdf", ".html", ".htm"):
+                continue
+            try:
+                if indice.agregar_archivo(path):
+                    nuevos += 1
+                else:
+                    sin_cambios += 1
+            except Exception as e:
+                log.warning("⚠️ No se pudo indexar %s: %s", path, e)
+    indice.close()
+    return nuevos, sin_cambios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Índice de texto completo de las fuentes de ARCA")
+    sub = parser.add_subparsers(dest="accion", required=True)
+
+    p = sub.add_parser("buscar", help="buscar frases (sin importar acentos) en PDFs y HTML indexados")
+    p.add_argument("texto", nargs="+", help="frases que tienen que aparecer (cada argumento es una frase)")
+    p.add_argument("--anio", help="sólo documentos de ese año (según URL / nombre de archivo)")
+    p.add_argument("--limite", type=int, default=LIMITE)
+    p.add_argument("--fts", action="store_true", help="el texto es una consulta FTS5 cruda (AND/OR/NEAR/prefijo*)")
+
+    p = sub.add_parser("indexar", help="indexar PDFs / HTML de disco (sólo los nuevos o cambiados)")
+    p.add_argument("carpetas", nargs="*", type=Path, default=CARPETAS)
+
+    parser.add_argument("--profile", nargs="?", const="cprofile", metavar="MODO",
+                        help="perfilar la corrida (cprofile | muestreo) en outputs/perfiles/")
+    args = parser.parse_args()
+
+    if args.accion == "indexar":
+        nuevos, sin_cambios = indexar(args.carpetas)
+        print(f"✅ Indexados: {nuevos} | sin cambios: {sin_cambios}")
+        print(f"📁 {INDICE_DB}")
+        return
+
+    consulta = " ".join(args.texto) if args.fts else consulta_fts(args.texto)
+    indice = IndiceTexto()
+    try:
+        resultados = indice.buscar(consulta, args.anio, args.limite)
+    except sqlite3.OperationalError as e:
+        raise SystemExit(f"❌ Consulta inválida: {e}")
+    finally:
+        indice.close()
+
+    print(f"🔎 {consulta}: {len(resultados)} resultado(s)")
+    for fuente, tipo, anio, posicion, snippet, otras in resultados:
+        donde = f"pág. {posicion}" if tipo == "pdf" else f"bloque {posicion}"
+        copias = f" (+{otras} con el mismo contenido)" if otras else ""
+        print(f"\n📄 {anio or '----'} | {fuente}{copias} | {donde}")
+        print(f"   {' '.join(snippet.split())}")
+
+
+if __name__ == "__main__":
+    iniciar("indice_texto")
+    main()
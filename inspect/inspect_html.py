@@ -1,6 +1,12 @@
-import requests
+import sys
+from pathlib import Path
+
 from bs4 import BeautifulSoup
 
+# corre suelto: el paquete `codigo` (sesión HTTP) es la carpeta de arriba
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from codigo.sesion_http import get
+
 URLS = [
     "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/conceptos-basicos/alicuotas.asp",
     "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/valuaciones/periodo-fiscal-2024.asp",
@@ -9,7 +15,7 @@ URLS = [
 def inspect_html(url: str):
     print(f"\n=== {url} ===")
 
-    r = requests.get(url, timeout=30)
+    r = get(url)
     soup = BeautifulSoup(r.text, "html.parser")
 
     tables = soup.find_all("table")
@@ -1,10 +1,10 @@
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from pathlib import Path
 
+from codigo.sesion_http import get
+
 BASE_URL = "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp"
-HEADERS = {"User-Agent": "Impuestos-Explorer"}
 
 OUT_DIR = Path("outputs")
 OUT_DIR.mkdir(exist_ok=True)
@@ -43,7 +43,7 @@ def inspect_page(url, soup, label):
     return lines
 
 def main():
-    r = requests.get(BASE_URL, headers=HEADERS, timeout=30)
+    r = get(BASE_URL)
     r.raise_for_status()
 
     soup = BeautifulSoup(r.text, "html.parser")
@@ -60,7 +60,7 @@ def main():
 
     for link in sorted(links):
         try:
-            r = requests.get(link, headers=HEADERS, timeout=30)
+            r = get(link)
             r.raise_for_status()
             soup = BeautifulSoup(r.text, "html.parser")
             output.extend(inspect_page(link, soup, "LINK INTERNO"))
@@ -0,0 +1,245 @@
+import argparse
+import csv
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+from tqdm import tqdm
+
+from codigo.calculators.ganancias import DEDUCCION_ESPECIAL, liquidar_ganancias
+from codigo.calculators.parametros import PARAMETROS_JSON, cargar_parametros
+from codigo.calculators.salidas import abrir_escritor
+from codigo.normalizers.utils import formatear_centavos
+from codigo.numeros import EN_ADELANTE, INVALIDO, OK, VACIO, parse_batch
+
+# ==========================
+# CONFIGURACIÓN
+# ==========================
+
+CHUNK_SIZE = 50_000
+
+# columnas que se leen del archivo de clientes (el resto se copia tal cual)
+COL_ANIO = "anio"
+COL_BRUTO = "bruto"
+COL_CONYUGE = "conyuge"
+COL_HIJOS = "hijos"
+COL_HIJOS_INCAPACES = "hijos_incapaces"
+COL_DEDUCCION_ESPECIAL = "deduccion_especial"
+
+COLUMNAS_RESULTADO = ("deducciones", "ganancia_neta", "impuesto")
+COL_ERROR = "error"   # "" si la fila se liquidó; si no, qué celda no se pudo leer
+
+VERDADEROS = {"1", "si", "sí", "s", "x", "true", "verdadero"}
+
+# "1234567.89" (número plano) vs "1.234.567" (miles argentinos): un punto que
+# no agrupa de a 3 dígitos es el separador decimal
+_RE_DECIMAL_PLANO = re.compile(r"[+-]?\d+\.\d+")
+_RE_MILES = re.compile(r"[+-]?\d{1,3}(\.\d{3})+")
+
+_PARAMETROS = None  # cargado una vez por worker
+
+
+# ==========================
+# LECTURA POR CHUNKS
+# ==========================
+
+def leer_chunks(path: Path, chunk_size: int = CHUNK_SIZE):
+    """Devuelve chunks columnares (dict columna → lista) sin cargar el archivo entero."""
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pydict()
+        return
+
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        while True:
+            filas = list(islice(reader, chunk_size))
+            if not filas:
+                break
+            yield {col: [fila.get(col) for fila in filas] for col in reader.fieldnames}
+
+
+# ==========================
+# CÁLCULO (corre en los workers)
+# ==========================
+
+def _texto_numero(x):
+    """Número plano "1234567.89" → "1234567,89"; el resto (formato argentino) queda igual."""
+    if isinstance(x, str):
+        t = x.strip()
+        if _RE_DECIMAL_PLANO.fullmatch(t) and not _RE_MILES.fullmatch(t):
+            return t.replace(".", ",")
+    return x
+
+
+def _columna(valores, nombre: str, errores: list) -> dict:
+    """
+    parse_batch de una columna de montos. Las celdas que no son un número
+    (INVALIDO, "en adelante", texto sin dígitos) se anotan en errores[i]; las
+    vacías valen 0.
+    """
+    p = parse_batch(_texto_numero(x) for x in valores)
+    for i in np.flatnonzero(p["estado"] != OK):
+        e, x = p["estado"][i], valores[i]
+        if e in (INVALIDO, EN_ADELANTE) or (e == VACIO and isinstance(x, str) and x.strip() not in ("", "-")):
+            errores[i].append(f"{nombre} inválido: {valores[i]!r}")
+    return p
+
+
+def _enteros(p: dict, valores, nombre: str, errores: list) -> np.ndarray:
+    """valor de una columna de _columna como int64; las celdas con decimales se anotan en errores[i]."""
+    valor = np.nan_to_num(p["valor"])
+    for i in np.flatnonzero(valor != np.floor(valor)):
+        errores[i].append(f"{nombre} no es entero: {valores[i]!r}")
+    return valor.astype(np.int64)
+
+
+def _flag(x) -> bool:
+    if isinstance(x, bool):
+        return x
+    return str(x or "").strip().lower() in VERDADEROS
+
+
+def _init_worker(parametros_path):
+    global _PARAMETROS
+    _PARAMETROS = cargar_parametros(parametros_path)
+
+
+def liquidar_chunk(chunk: dict, centavos: bool = False) -> dict:
+    """
+    Agrega deducciones / ganancia_neta / impuesto a un chunk, agrupando por año.
+    Con centavos=True se calcula en int64 exacto y los resultados salen como
+    texto en formato argentino ("1.234.567,89").
+    """
+    n = len(chunk[COL_BRUTO])
+    errores = [[] for _ in range(n)]
+
+    p_anio = _columna(chunk[COL_ANIO], COL_ANIO, errores)
+    for i in np.flatnonzero(np.isnan(p_anio["valor"])):
+        if not errores[i]:
+            errores[i].append(f"{COL_ANIO} vacío")
+    anio = _enteros(p_anio, chunk[COL_ANIO], COL_ANIO, errores)
+
+    p_bruto = _columna(chunk[COL_BRUTO], COL_BRUTO, errores)
+    bruto = p_bruto["centavos"] if centavos else np.nan_to_num(p_bruto["valor"])
+    conyuge = np.array([_flag(x) for x in chunk.get(COL_CONYUGE, [None] * n)], dtype=bool)
+    col_hijos = chunk.get(COL_HIJOS, [None] * n)
+    hijos = _enteros(_columna(col_hijos, COL_HIJOS, errores), col_hijos, COL_HIJOS, errores)
+    col_incapaces = chunk.get(COL_HIJOS_INCAPACES, [None] * n)
+    incapaces = _enteros(_columna(col_incapaces, COL_HIJOS_INCAPACES, errores),
+                         col_incapaces, COL_HIJOS_INCAPACES, errores)
+
+    col_especial = chunk.get(COL_DEDUCCION_ESPECIAL, [None] * n)
+    especial = np.array([str(x or "").strip().lower() for x in col_especial], dtype=str)
+    # un código que no existe va a error en vez de deducir 0
+    for i in np.flatnonzero(~np.isin(especial, ["", *DEDUCCION_ESPECIAL])):
+        errores[i].append(f"{COL_DEDUCCION_ESPECIAL} desconocida: {col_especial[i]!r}")
+
+    ok = np.array([not e for e in errores], dtype=bool)
+    resultado = {col: np.zeros(n, dtype=bruto.dtype) for col in COLUMNAS_RESULTADO}
+
+    for a in np.unique(anio[ok]):
+        m = ok & (anio == a)
+        try:
+            liq = liquidar_ganancias(
+                bruto[m], int(a),
+                conyuge=conyuge[m],
+                hijos=hijos[m],
+                hijos_incapaces=incapaces[m],
+                deduccion_especial=especial[m],
+                parametros=_PARAMETROS,
+                centavos=centavos,
+            )
+        except KeyError:
+            # año sin parámetros: esas filas quedan con error, el resto se liquida
+            for i in np.flatnonzero(m):
+                errores[i].append(f"sin parámetros para {int(a)}")
+            ok[m] = False
+            continue
+        for col in COLUMNAS_RESULTADO:
+            resultado[col][m] = liq[col]
+
+    # las filas con error quedan sin resultado ("" / NaN, mismo tipo que el resto de la columna)
+    out = dict(chunk)
+    for col in COLUMNAS_RESULTADO:
+        if centavos:
+            out[col] = [formatear_centavos(c) if bien else "" for c, bien in zip(resultado[col].tolist(), ok)]
+        else:
+            out[col] = np.where(ok, np.round(resultado[col], 2), np.nan).tolist()
+    out[COL_ERROR] = ["; ".join(e) for e in errores]
+    return out
+
+
+# ==========================
+# EJECUCIÓN
+# ==========================
+
+def run(entrada: Path, salida: Path, chunk_size: int = CHUNK_SIZE, workers: int = None,
+        parametros_path: Path = PARAMETROS_JSON, centavos: bool = False):
+    """
+    Lee `entrada` por chunks, los liquida en un pool de procesos y escribe
+    `salida` a medida que terminan (en orden). Como mucho hay 2 chunks por
+    worker en vuelo, así la memoria no depende del tamaño del archivo.
+    """
+    escritor = abrir_escritor(salida)
+    filas = con_error = 0
+    t0 = time.perf_counter()
+
+    workers = workers or os.cpu_count() or 1
+    max_en_vuelo = 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(parametros_path,)) as pool:
+        en_vuelo = deque()
+        progress = tqdm(desc="Liquidando", unit="filas", unit_scale=True)
+
+        def _drenar(hasta: int):
+            nonlocal filas, con_error
+            while len(en_vuelo) > hasta:
+                res = en_vuelo.popleft().result()
+                escritor.escribir(res)
+                n = len(res[COL_BRUTO])
+                filas += n
+                con_error += sum(1 for e in res[COL_ERROR] if e)
+                progress.update(n)
+
+        try:
+            for chunk in leer_chunks(entrada, chunk_size):
+                en_vuelo.append(pool.submit(liquidar_chunk, chunk, centavos))
+                _drenar(max_en_vuelo - 1)
+            _drenar(0)
+        finally:
+            progress.close()
+            escritor.cerrar()
+
+    elapsed = time.perf_counter() - t0
+    print(f"✅ Liquidación batch: {filas:,} filas en {elapsed:.1f}s ({filas / max(elapsed, 1e-9):,.0f} filas/s)")
+    if con_error:
+        print(f"⚠️ {con_error:,} filas sin liquidar: ver la columna '{COL_ERROR}'")
+    print(salida.resolve())
+    return filas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Liquidación batch de Ganancias (Art. 30 + Art. 94)")
+    parser.add_argument("entrada", type=Path, help="CSV o Parquet de clientes")
+    parser.add_argument("salida", type=Path, help="CSV o Parquet de resultados")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="procesos (default: núcleos)")
+    parser.add_argument("--parametros", type=Path, default=PARAMETROS_JSON)
+    parser.add_argument("--centavos", action="store_true",
+                        help="cálculo exacto en centavos (int64); montos de salida como texto argentino")
+    args = parser.parse_args()
+
+    run(args.entrada, args.salida, args.chunk_size, args.workers, args.parametros, args.centavos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Instrumentación compartida: contadores, gauges, histogramas de tiempos y
+spans por función, más el logging por niveles de los entry points.
+
+Cada proceso llama a iniciar("<nombre>") en su __main__; al salir se escriben
+outputs/metricas/<nombre>.json y outputs/metricas/<nombre>.prom (formato
+textfile de Prometheus, para node_exporter --collector.textfile.directory).
+
+Sin iniciar() las llamadas sólo acumulan en memoria (los benchmarks
+importan los módulos sin exportar nada).
+
+    from codigo.metricas import contar, span, medido, log
+
+    contar("http_requests", status=200)
+    contar("http_bytes", len(r.content))
+    with span("guardar_excel"):
+        wb.save(path)
+
+    @medido()
+    def analyze_pdf(path): ...
+
+    log.debug("línea %d: %s", i, linea)   # sin costo si el nivel es INFO
+
+Nivel de log: iniciar(nivel=...) o IMPUESTOS_LOG=DEBUG|INFO|WARNING.
+Con --profile[=muestreo] en la línea de comandos, iniciar() además perfila.
+"""
+import atexit
+import contextlib
+import functools
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from codigo.paths import OUTPUTS_DIR
+
+METRICAS_DIR = OUTPUTS_DIR / "metricas"
+PREFIJO = "impuestos_"
+
+# segundos (spans); cubren desde un parse_numero hasta un crawl entero
+BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0, 300.0)
+
+log = logging.getLogger("impuestos")
+
+_RE_NOMBRE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# ==========================
+# REGISTRO
+# ==========================
+
+class Registro:
+    """Métricas de un proceso. Las claves son (nombre, labels ordenados)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.inicio = time.time()
+        self.contadores = defaultdict(float)
+        self.gauges = {}
+        self.histogramas = {}     # clave → [conteos por bucket..., suma, n]
+        self.caches = {}          # nombre → función con cache_info() (lru_cache)
+
+    def contar(self, nombre: str, n: float = 1, **labels):
+        clave = (nombre, tuple(sorted(labels.items())))
+        with self._lock:
+            self.contadores[clave] += n
+
+    def fijar(self, nombre: str, valor: float, **labels):
+        with self._lock:
+            self.gauges[(nombre, tuple(sorted(labels.items())))] = valor
+
+    def observar(self, nombre: str, valor: float, **labels):
+        clave = (nombre, tuple(sorted(labels.items())))
+        with self._lock:
+            h = self.histogramas.get(clave)
+            if h is None:
+                h = self.histogramas[clave] = [0] * len(BUCKETS) + [0.0, 0]
+            for i, limite in enumerate(BUCKETS):
+                if valor <= limite:
+                    h[i] += 1
+                    break
+            h[-2] += valor
+            h[-1] += 1
+
+    def registrar_cache(self, nombre: str, fn):
+        self.caches[nombre] = fn
+
+    def _snapshot_caches(self):
+        for nombre, fn in self.caches.items():
+            info = fn.cache_info()
+            self.fijar("cache_hits", info.hits, cache=nombre)
+            self.fijar("cache_misses", info.misses, cache=nombre)
+            self.fijar("cache_tamanio", info.currsize, cache=nombre)
+
+    def a_dict(self) -> dict:
+        """Snapshot serializable; agrega tasas por segundo de los contadores."""
+        self._snapshot_caches()
+        segundos = time.time() - self.inicio
+
+        def _etiqueta(nombre, labels):
+            return nombre + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else "")
+
+        with self._lock:
+            contadores = {_etiqueta(*k): v for k, v in sorted(self.contadores.items())}
+            gauges = {_etiqueta(*k): v for k, v in sorted(self.gauges.items())}
+            histogramas = {
+                _etiqueta(*k): {
+                    "n": h[-1],
+                    "suma": h[-2],
+                    "promedio": h[-2] / h[-1] if h[-1] else None,
+                    "buckets": dict(zip(map(str, BUCKETS), h[:len(BUCKETS)])),
+                }
+                for k, h in sorted(self.histogramas.items())
+            }
+
+        return {
+            "inicio": datetime.fromtimestamp(self.inicio).isoformat(timespec="seconds"),
+            "segundos": segundos,
+            "contadores": contadores,
+            "por_segundo": {k: v / segundos for k, v in contadores.items()} if segundos else {},
+            "gauges": gauges,
+            "histogramas": histogramas,
+        }
+
+    def a_prometheus(self, proceso: str) -> str:
+        """Formato de exposición de texto de Prometheus (counters/gauges/histogramas acumulados)."""
+        self._snapshot_caches()
+        self.fijar("proceso_segundos", time.time() - self.inicio)
+
+        def _labels(labels, extra=()):
+            todos = (("proceso", proceso),) + tuple(labels) + tuple(extra)
+            return "{" + ",".join(f'{k}="{_escapar(v)}"' for k, v in todos) + "}"
+
+        lineas = []
+        with self._lock:
+            por_nombre = defaultdict(list)
+            for (nombre, labels), v in self.contadores.items():
+                por_nombre[(nombre, "counter")].append((labels, v))
+            for (nombre, labels), v in self.gauges.items():
+                por_nombre[(nombre, "gauge")].append((labels, v))
+            for (nombre, labels), h in self.histogramas.items():
+                por_nombre[(nombre, "histogram")].append((labels, list(h)))
+
+        for (nombre, tipo), series in sorted(por_nombre.items()):
+            metrica = PREFIJO + _RE_NOMBRE.sub("_", nombre) + ("_total" if tipo == "counter" else "")
+            lineas.append(f"# TYPE {metrica} {tipo}")
+            for labels, v in sorted(series):
+                if tipo != "histogram":
+                    lineas.append(f"{metrica}{_labels(labels)} {v}")
+                    continue
+                acumulado = 0
+                for limite, conteo in zip(BUCKETS, v):
+                    acumulado += conteo
+                    lineas.append(f"{metrica}_bucket{_labels(labels, [('le', limite)])} {acumulado}")
+                lineas.append(f"{metrica}_bucket{_labels(labels, [('le', '+Inf')])} {v[-1]}")
+                lineas.append(f"{metrica}_sum{_labels(labels)} {v[-2]}")
+                lineas.append(f"{metrica}_count{_labels(labels)} {v[-1]}")
+        return "\n".join(lineas) + "\n"
+
+
+REGISTRO = Registro()
+
+contar = REGISTRO.contar
+fijar = REGISTRO.fijar
+observar = REGISTRO.observar
+registrar_cache = REGISTRO.registrar_cache
+
+
+# ==========================
+# SPANS
+# ==========================
+
+@contextlib.contextmanager
+def span(nombre: str, **labels):
+    """Tiempo del bloque → histograma span_segundos{span=nombre}."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observar("span_segundos", time.perf_counter() - t0, span=nombre, **labels)
+
+
+def medido(nombre: str = None):
+    """Decorador: cada llamada es un span (por defecto, con el nombre de la función)."""
+    def decorador(fn):
+        etiqueta = nombre or fn.__name__
+
+        @functools.wraps(fn)
+        def envuelta(*args, **kwargs):
+            with span(etiqueta):
+                return fn(*args, **kwargs)
+        return envuelta
+    return decorador
+
+
+# ==========================
+# EXPORT / ARRANQUE
+# ==========================
+
+def exportar(proceso: str, directorio=METRICAS_DIR):
+    """Escribe <proceso>.json y <proceso>.prom (tmp + replace: el collector nunca lee a medias)."""
+    directorio.mkdir(parents=True, exist_ok=True)
+    json_path = directorio / f"{proceso}.json"
+    prom_path = directorio / f"{proceso}.prom"
+
+    for path, contenido in (
+        (json_path, json.dumps({"proceso": proceso, **REGISTRO.a_dict()}, indent=2, ensure_ascii=False)),
+        (prom_path, REGISTRO.a_prometheus(proceso)),
+    ):
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(contenido, encoding="utf-8")
+        tmp.replace(path)
+    return json_path, prom_path
+
+
+_iniciado = False
+
+
+def iniciar(proceso: str, nivel: str = None):
+    """
+    Para el __main__ de cada entry point: configura el logging (nivel o
+    IMPUESTOS_LOG, default INFO), exporta las métricas al salir y, si vino
+    --profile en argv, perfila el resto del proceso (ver perfil.py).
+    """
+    global _iniciado
+    nivel = (nivel or os.getenv("IMPUESTOS_LOG") or "INFO").upper()
+    # el nivel va sólo a nuestro logger: pdfminer & cía. en DEBUG inundan la salida
+    logging.basicConfig(format="%(message)s", level=logging.WARNING, stream=sys.stdout)  # junto a los print
+    log.setLevel(nivel)
+
+    if not _iniciado:
+        _iniciado = True
+        atexit.register(exportar, proceso)
+
+        from codigo import perfil
+        modo = perfil.pedido()
+        if modo:
+            perfil.activar(proceso, modo)   # atexit LIFO: el perfil cierra antes del export
+    return log
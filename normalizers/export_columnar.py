@@ -0,0 +1,110 @@
+import os
+import sqlite3
+from pathlib import Path
+
+# Esquema estable de parametros_arca en formatos columnares.
+# Agregar columnas sólo al final y subir ESQUEMA_VERSION.
+ESQUEMA_VERSION = 2
+
+ESQUEMA = (
+    ("concepto", "str"),
+    ("impuesto", "str"),
+    ("anio", "int"),
+    ("valor_raw", "str"),
+    ("valor_num", "float"),
+    ("valor_cent", "int"),
+    ("desde", "float"),
+    ("hasta", "float"),
+    ("monto_fijo", "float"),
+    ("porcentaje", "float"),
+    ("excedente_desde", "float"),
+    ("desde_cent", "int"),
+    ("hasta_cent", "int"),
+    ("monto_fijo_cent", "int"),
+    ("porcentaje_bp", "int"),
+    ("excedente_desde_cent", "int"),
+    ("unidad", "str"),
+    ("fuente", "str"),
+    ("origen", "str"),
+    ("url", "str"),
+    ("valor_micro", "int"),         # v2: cotizaciones en millonésimos (normalize_bp_monedas)
+)
+
+TIPOS_SQLITE = {"str": "TEXT", "int": "INTEGER", "float": "REAL"}
+
+TABLA_SQLITE = "parametros"
+
+
+def a_columnas(parametros):
+    """Lista de dicts (parametros_arca.json) → dict columna → lista, con todas las columnas del esquema."""
+    return {col: [p.get(col) for p in parametros] for col, _ in ESQUEMA}
+
+
+# ==========================
+# ARROW / PARQUET (requiere pyarrow)
+# ==========================
+
+def esquema_arrow():
+    import pyarrow as pa
+
+    tipos = {"str": pa.string(), "int": pa.int64(), "float": pa.float64()}
+    return pa.schema(
+        [pa.field(col, tipos[tipo]) for col, tipo in ESQUEMA],
+        metadata={"esquema_version": str(ESQUEMA_VERSION)},
+    )
+
+
+def tabla_arrow(parametros):
+    import pyarrow as pa
+
+    return pa.Table.from_pydict(a_columnas(parametros), schema=esquema_arrow())
+
+
+def exportar_parquet(parametros, path: Path):
+    import pyarrow.parquet as pq
+
+    pq.write_table(tabla_arrow(parametros), path)
+
+
+def exportar_arrow(parametros, path: Path):
+    """Arrow IPC (archivo): se puede abrir con pa.memory_map sin parsear."""
+    import pyarrow as pa
+
+    tabla = tabla_arrow(parametros)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, tabla.schema) as writer:
+            writer.write_table(tabla)
+
+
+# ==========================
+# SQLITE (stdlib)
+# ==========================
+
+def exportar_sqlite(parametros, path: Path):
+    """
+    Tabla `parametros` tipada e indexada por (concepto, impuesto, anio) y (impuesto, anio).
+    Se escribe a un temporal y se reemplaza, así nadie lee un archivo a medias.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+
+    columnas = ", ".join(f"{col} {TIPOS_SQLITE[tipo]}" for col, tipo in ESQUEMA)
+    marcas = ", ".join("?" for _ in ESQUEMA)
+
+    con = sqlite3.connect(tmp)
+    try:
+        con.execute(f"CREATE TABLE {TABLA_SQLITE} ({columnas})")
+        con.executemany(
+            f"INSERT INTO {TABLA_SQLITE} VALUES ({marcas})",
+            ([p.get(col) for col, _ in ESQUEMA] for p in parametros),
+        )
+        con.execute(f"CREATE INDEX idx_{TABLA_SQLITE}_clave ON {TABLA_SQLITE} (concepto, impuesto, anio)")
+        con.execute(f"CREATE INDEX idx_{TABLA_SQLITE}_impuesto_anio ON {TABLA_SQLITE} (impuesto, anio)")
+        con.execute(f"PRAGMA user_version = {ESQUEMA_VERSION}")
+        con.commit()
+    finally:
+        con.close()
+
+    os.replace(tmp, path)
@@ -4,26 +4,64 @@ from pathlib import Path
 from codigo.normalizers.normalize_bp_minimo import normalize_bp_minimo
 from codigo.normalizers.normalize_bp_alicuotas import normalize_bp_alicuotas
 from codigo.normalizers.normalize_bp_dolar import normalize_bp_dolar
+from codigo.normalizers.normalize_bp_monedas import normalize_bp_monedas
 from codigo.normalizers.normalize_ganancias_deducciones import normalize_ganancias_deducciones
 from codigo.normalizers.normalize_ganancias_escalas import normalize_ganancias_escalas
+from codigo.normalizers.export_columnar import exportar_arrow, exportar_parquet, exportar_sqlite
+from codigo.calculators.paquete import escribir_paquetes
+from codigo.metricas import contar, iniciar, span
 from codigo.paths import OUTPUTS_DIR
 
 
 OUT = OUTPUTS_DIR / "parametros_arca.json"
+OUT_PARQUET = OUTPUTS_DIR / "parametros_arca.parquet"
+OUT_ARROW = OUTPUTS_DIR / "parametros_arca.arrow"
+OUT_SQLITE = OUTPUTS_DIR / "parametros_arca.sqlite"
+
+NORMALIZADORES = [
+    normalize_bp_minimo,
+    normalize_bp_alicuotas,
+    normalize_bp_dolar,
+    normalize_bp_monedas,
+    normalize_ganancias_deducciones,
+    normalize_ganancias_escalas,
+]
 
 def main():
     parametros = []
-    parametros.extend(normalize_bp_minimo())
-    parametros.extend(normalize_bp_alicuotas())
-    parametros.extend(normalize_bp_dolar())
-    parametros.extend(normalize_ganancias_deducciones())
-    parametros.extend(normalize_ganancias_escalas())
+    for normalizar in NORMALIZADORES:
+        with span(normalizar.__name__):
+            registros = normalizar()
+        contar("registros", len(registros), normalizador=normalizar.__name__)
+        parametros.extend(registros)
 
-    OUT.write_text(json.dumps(parametros, indent=2, ensure_ascii=False), encoding="utf-8")
+    with span("escribir_json"):
+        OUT.write_text(json.dumps(parametros, indent=2, ensure_ascii=False), encoding="utf-8")
 
     print("✅ Parametros_ARCA generado")
     print(f"Total registros: {len(parametros)}")
     print(OUT.resolve())
 
+    # 📦 Salidas columnares tipadas (mismo contenido, esquema fijo)
+    with span("exportar_sqlite"):
+        exportar_sqlite(parametros, OUT_SQLITE)
+    print(OUT_SQLITE.resolve())
+    try:
+        with span("exportar_parquet"):
+            exportar_parquet(parametros, OUT_PARQUET)
+        with span("exportar_arrow"):
+            exportar_arrow(parametros, OUT_ARROW)
+        print(OUT_PARQUET.resolve())
+        print(OUT_ARROW.resolve())
+    except ImportError:
+        print("⚠️ pyarrow no instalado: se omiten Parquet / Arrow")
+
+    # 📦 Paquetes binarios por año (arranque rápido de calculators / workers)
+    with span("escribir_paquetes"):
+        paquetes = escribir_paquetes(parametros)
+    for path in paquetes:
+        print(path.resolve())
+
 if __name__ == "__main__":
+    iniciar("normalize_all")
     main()
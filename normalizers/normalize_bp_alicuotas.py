@@ -1,10 +1,12 @@
 import json
+import re
 from codigo.paths import OUTPUTS_DIR
-from codigo.normalizers.utils import to_number
-from codigo.paths import ANIO_TRABAJO
+from codigo.normalizers.utils import parse_tramos
 
 RAW = OUTPUTS_DIR / "raw_bienes_alicuotas_all.json"
 
+_RE_ANIO = re.compile(r"(?<!\d)(20\d{2})(?!\d)")
+
 
 
 
@@ -13,7 +15,7 @@ RAW = OUTPUTS_DIR / "raw_bienes_alicuotas_all.json"
 def _extract_tramos_from_table(rows):
     """
     rows es lista de filas (cada fila = lista de celdas).
-    Devuelve lista de dicts con desde/hasta/pagaran/aliquota/excedente.
+    Devuelve lista de dicts (texto crudo) con desde/hasta/monto_fijo/porcentaje/excedente_desde.
     """
     tramos = []
     for r in rows:
@@ -38,68 +40,51 @@ def _extract_tramos_from_table(rows):
         tramos.append({
             "desde": desde,
             "hasta": hasta,
-            "pagaran": pagaran,
+            "monto_fijo": pagaran,
             "porcentaje": porc,
             "excedente_desde": exced,
         })
     return tramos
 
+def _periodo(tabla, data):
+    """Año de la tabla según su título ("Escala general - período 2024"); si no, el "anio" del raw."""
+    m = _RE_ANIO.search(tabla.get("contexto") or "")
+    return int(m.group(1)) if m else data.get("anio")
+
+
 def normalize_bp_alicuotas():
     data = json.loads(RAW.read_text(encoding="utf-8"))
-    anio = data.get("anio") or ANIO_TRABAJO
 
     tablas = data.get("tablas", [])
     if not tablas:
         return []
 
-    # detectamos tablas "2024" por el primer hasta = 40.107.213,86
-    def table_score(tab):
-        rows = tab.get("rows", [])
-        tramos = _extract_tramos_from_table(rows)
+    # una escala por (tabla, período): general y "contribuyentes cumplidores" de cada año publicado
+    out = []
+    vistas = set()
+    for tab in tablas:
+        tramos = parse_tramos(_extract_tramos_from_table(tab.get("rows", [])))
         if not tramos:
-            return 0
-        first_hasta = str(tramos[0].get("hasta", ""))
-        return 10 if "40.107.213,86" in first_hasta else 1
-
-    tablas_sorted = sorted(tablas, key=table_score, reverse=True)
+            continue
 
-    out = []
+        anio = _periodo(tab, data)
+        if anio is None:
+            raise RuntimeError(
+                f"BP alícuotas: la tabla {tab.get('index')} no dice de qué período es "
+                f"(contexto {tab.get('contexto')!r}); volver a correr parse_bienes_alicuotas_html_raw"
+            )
 
-    # tabla general (la mejor puntuación)
-    general = tablas_sorted[0]
-    tramos_general = _extract_tramos_from_table(general.get("rows", []))
-
-    for i, t in enumerate(tramos_general, start=1):
-        out.append({
-            "concepto": f"BP_ALICUOTA_GENERAL_TRAMO_{i}",
-            "impuesto": "BIENES_PERSONALES",
-            "anio": anio,
-            "desde": to_number(t["desde"]),
-            "hasta": to_number(t["hasta"]),
-            "monto_fijo": to_number(t["pagaran"]),
-            "porcentaje": to_number(t["porcentaje"]),
-            "excedente_desde": to_number(t["excedente_desde"]),
-            "unidad": "ARS/%",
-            "fuente": data.get("fuente", "ARCA"),
-            "origen": "HTML_ALICUOTAS",
-            "url": None,
-        })
+        tabla = "CUMPLIDORES" if "cumplidores" in (tab.get("contexto") or "").lower() else "GENERAL"
+        if (tabla, anio) in vistas:
+            raise RuntimeError(f"BP alícuotas: dos tablas {tabla} para el período {anio}")
+        vistas.add((tabla, anio))
 
-    # “Contribuyentes cumplidores” (siempre que exista una 2da tabla con buen score)
-    # En tu raw, tabla_index 1 parece "cumplidores 2024" por valores 0,25%, 0,50% etc. :contentReference[oaicite:11]{index=11}
-    if len(tablas_sorted) > 1:
-        cumpl = tablas_sorted[1]
-        tramos_cumpl = _extract_tramos_from_table(cumpl.get("rows", []))
-        for i, t in enumerate(tramos_cumpl, start=1):
+        for i, t in enumerate(tramos, start=1):
             out.append({
-                "concepto": f"BP_ALICUOTA_CUMPLIDORES_TRAMO_{i}",
+                "concepto": f"BP_ALICUOTA_{tabla}_TRAMO_{i}",
                 "impuesto": "BIENES_PERSONALES",
                 "anio": anio,
-                "desde": to_number(t["desde"]),
-                "hasta": to_number(t["hasta"]),
-                "monto_fijo": to_number(t["pagaran"]),
-                "porcentaje": to_number(t["porcentaje"]),
-                "excedente_desde": to_number(t["excedente_desde"]),
+                **t,
                 "unidad": "ARS/%",
                 "fuente": data.get("fuente", "ARCA"),
                 "origen": "HTML_ALICUOTAS",
@@ -1,26 +1,20 @@
 import json
 from pathlib import Path
-from codigo.normalizers.utils import to_number
+from codigo.normalizers.normalize_bp_monedas import centavos_de_micros, indexar_monedas
 
 from codigo.paths import OUTPUTS_DIR
 
 RAW = OUTPUTS_DIR / "raw_monedas_2024.json"
 
 
-def _find_dolar(lista):
-    for item in lista:
-        desc = (item.get("descripcion") or "").upper()
-        if "DOLAR" in desc or "DÓLAR" in desc:
-            return item
-    return None
-
 def normalize_bp_dolar():
     data = json.loads(RAW.read_text(encoding="utf-8"))
     anio = data.get("anio")
     fuente = data.get("fuente", "ARCA")
 
-    billete = _find_dolar(data.get("billetes", []))
-    divisa = _find_dolar(data.get("divisas", []))
+    indice = indexar_monedas(data)
+    billete = indice.get(("USD", "BILLETE"))
+    divisa = indice.get(("USD", "DIVISA"))
 
     out = []
 
@@ -29,8 +23,10 @@ def normalize_bp_dolar():
             "concepto": "BP_DOLAR_BILLETE_COMP_31_12",
             "impuesto": "BIENES_PERSONALES",
             "anio": anio,
-            "valor_raw": billete.get("comprador"),
-            "valor_num": to_number(billete.get("comprador")),
+            "valor_raw": billete["comprador_raw"],
+            "valor_num": billete["comprador"],
+            "valor_cent": centavos_de_micros(billete["comprador_micro"]),
+            "valor_micro": billete["comprador_micro"],
             "unidad": "ARS",
             "fuente": fuente,
             "origen": "PDF_MONEDA_EXTRANJERA",
@@ -40,8 +36,10 @@ def normalize_bp_dolar():
             "concepto": "BP_DOLAR_BILLETE_VEND_31_12",
             "impuesto": "BIENES_PERSONALES",
             "anio": anio,
-            "valor_raw": billete.get("vendedor"),
-            "valor_num": to_number(billete.get("vendedor")),
+            "valor_raw": billete["vendedor_raw"],
+            "valor_num": billete["vendedor"],
+            "valor_cent": centavos_de_micros(billete["vendedor_micro"]),
+            "valor_micro": billete["vendedor_micro"],
             "unidad": "ARS",
             "fuente": fuente,
             "origen": "PDF_MONEDA_EXTRANJERA",
@@ -53,8 +51,10 @@ def normalize_bp_dolar():
             "concepto": "BP_DOLAR_DIVISA_COMP_31_12",
             "impuesto": "BIENES_PERSONALES",
             "anio": anio,
-            "valor_raw": divisa.get("comprador"),
-            "valor_num": to_number(divisa.get("comprador")),
+            "valor_raw": divisa["comprador_raw"],
+            "valor_num": divisa["comprador"],
+            "valor_cent": centavos_de_micros(divisa["comprador_micro"]),
+            "valor_micro": divisa["comprador_micro"],
             "unidad": "ARS",
             "fuente": fuente,
             "origen": "PDF_MONEDA_EXTRANJERA",
@@ -64,8 +64,10 @@ def normalize_bp_dolar():
             "concepto": "BP_DOLAR_DIVISA_VEND_31_12",
             "impuesto": "BIENES_PERSONALES",
             "anio": anio,
-            "valor_raw": divisa.get("vendedor"),
-            "valor_num": to_number(divisa.get("vendedor")),
+            "valor_raw": divisa["vendedor_raw"],
+            "valor_num": divisa["vendedor"],
+            "valor_cent": centavos_de_micros(divisa["vendedor_micro"]),
+            "valor_micro": divisa["vendedor_micro"],
             "unidad": "ARS",
             "fuente": fuente,
             "origen": "PDF_MONEDA_EXTRANJERA",
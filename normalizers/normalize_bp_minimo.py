@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from codigo.normalizers.utils import to_number
+from codigo.normalizers.utils import to_number, to_centavos
 from codigo.paths import OUTPUTS_DIR
 
 RAW = OUTPUTS_DIR / "raw_bp_determinativa.json"
@@ -21,6 +21,7 @@ def normalize_bp_minimo():
         "anio": latest.get("year"),
         "valor_raw": latest.get("amount_raw"),
         "valor_num": to_number(latest.get("amount_raw")),
+        "valor_cent": to_centavos(latest.get("amount_raw")),
         "unidad": "ARS",
         "fuente": "ARCA",
         "origen": "HTML_DETERMINATIVA",
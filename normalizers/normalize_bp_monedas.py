@@ -0,0 +1,119 @@
+import json
+import re
+import unicodedata
+
+from codigo.normalizers.utils import to_micros
+from codigo.paths import OUTPUTS_DIR
+
+RAW = OUTPUTS_DIR / "raw_monedas_2024.json"
+
+# descripción ARCA (sin acentos, mayúsculas) → código ISO.
+# Los específicos van antes que "DOLAR" / "PESO" genéricos.
+MONEDAS = [
+    ("DOLAR AUSTRALIANO", "AUD"),
+    ("CANADIENSE", "CAD"),
+    ("NEOZELANDES", "NZD"),
+    ("DOLAR", "USD"),
+    ("LIBRA", "GBP"),
+    ("EURO", "EUR"),
+    ("FRANCO", "CHF"),
+    ("YEN", "JPY"),
+    ("DANESA", "DKK"),
+    ("NORUEGA", "NOK"),
+    ("SUECA", "SEK"),
+    ("YUAN", "CNY"),
+    ("PESO URUGUAYO", "UYU"),
+    ("PESO CHILENO", "CLP"),
+    ("PESO COLOMBIANO", "COP"),
+    ("PESO MEXICANO", "MXN"),
+    ("REAL", "BRL"),
+    ("GUARANI", "PYG"),
+]
+
+RE_UNIDADES = re.compile(r"^\s*(\d+)\s+(.*)$")
+
+TIPOS = {"divisas": "DIVISA", "billetes": "BILLETE"}
+
+
+def _sin_acentos(s: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
+
+
+def codigo_moneda(descripcion: str):
+    """
+    "100 FRANCOS SUIZOS" → ("CHF", 100). Si la moneda no está en MONEDAS
+    se usa la descripción como código para no perder la fila.
+    """
+    desc = _sin_acentos(descripcion or "").upper().strip()
+    unidades = 1
+    m = RE_UNIDADES.match(desc)
+    if m:
+        unidades, desc = int(m.group(1)), m.group(2)
+
+    for patron, codigo in MONEDAS:
+        if patron in desc:
+            return codigo, unidades
+    return re.sub(r"\W+", "_", desc).strip("_"), unidades
+
+
+def por_unidad(micros, unidades: int):
+    """Cotización en millonésimos por `unidades` → por 1 unidad (división entera, half-up)."""
+    if micros is None:
+        return None
+    cociente, resto = divmod(abs(micros), unidades)
+    if 2 * resto >= unidades:
+        cociente += 1
+    return -cociente if micros < 0 else cociente
+
+
+def centavos_de_micros(micros):
+    """Millonésimos → centavos (half-up), del mismo entero que valor_num."""
+    return por_unidad(micros, 10_000)
+
+
+def indexar_monedas(data):
+    """
+    Índice {(codigo, "DIVISA"|"BILLETE"): fila} sobre el raw de parse_monedas.
+    Cada fila trae comprador/vendedor crudos y ya llevados a 1 unidad de moneda
+    (ARCA cotiza algunas por 100): <lado>_micro es el valor exacto en
+    millonésimos de peso leído del texto y <lado> (float) sale de ese entero.
+    """
+    indice = {}
+    for clave, tipo in TIPOS.items():
+        for item in data.get(clave, []):
+            codigo, unidades = codigo_moneda(item.get("descripcion"))
+            if (codigo, tipo) in indice:
+                continue  # nos quedamos con la primera, como hacía _find_dolar
+            fila = {"descripcion": item.get("descripcion"), "unidades": unidades}
+            for lado in ("comprador", "vendedor"):
+                micros = por_unidad(to_micros(item.get(lado)), unidades)
+                fila[f"{lado}_raw"] = item.get(lado)
+                fila[f"{lado}_micro"] = micros
+                fila[lado] = micros / 1_000_000 if micros is not None else None
+            indice[(codigo, tipo)] = fila
+    return indice
+
+
+def normalize_bp_monedas():
+    data = json.loads(RAW.read_text(encoding="utf-8"))
+    anio = data.get("anio")
+    fuente = data.get("fuente", "ARCA")
+
+    out = []
+    for (codigo, tipo), fila in indexar_monedas(data).items():
+        for lado, sufijo in (("comprador", "COMP"), ("vendedor", "VEND")):
+            out.append({
+                "concepto": f"BP_MONEDA_{codigo}_{tipo}_{sufijo}_31_12",
+                "impuesto": "BIENES_PERSONALES",
+                "anio": anio,
+                "valor_raw": fila[f"{lado}_raw"],
+                "valor_num": fila[lado],
+                "valor_cent": centavos_de_micros(fila[f"{lado}_micro"]),
+                "valor_micro": fila[f"{lado}_micro"],
+                "unidad": f"ARS/{codigo}",
+                "fuente": fuente,
+                "origen": "PDF_MONEDA_EXTRANJERA",
+                "url": None,
+            })
+
+    return out
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from codigo.normalizers.utils import to_number
+from codigo.normalizers.utils import to_number, to_centavos
 
 from codigo.paths import OUTPUTS_DIR
 
@@ -26,6 +26,7 @@ def normalize_ganancias_deducciones():
             "anio": anio,
             "valor_raw": v,
             "valor_num": to_number(v),
+            "valor_cent": to_centavos(v),
             "unidad": "ARS",
             "fuente": data.get("fuente", "ARCA"),
             "origen": "PDF_ART_30",
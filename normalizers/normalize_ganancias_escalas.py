@@ -1,11 +1,14 @@
 import json
+import re
 from pathlib import Path
-from codigo.normalizers.utils import to_number
+from codigo.normalizers.utils import parse_tramos
 from codigo.paths import ANIO_TRABAJO
 from codigo.paths import OUTPUTS_DIR
 
 RAW = OUTPUTS_DIR / "raw_art94_2024.json"
 
+_RE_ANIO = re.compile(r"(?<!\d)(20\d{2})(?!\d)")
+
 
 def normalize_ganancias_escalas():
     data = json.loads(RAW.read_text(encoding="utf-8"))
@@ -13,7 +16,9 @@ def normalize_ganancias_escalas():
     # tu raw es LISTA directa
     if isinstance(data, list):
         tramos = data
-        anio = ANIO_TRABAJO
+        # sin año en el raw: el del nombre del archivo (raw_art94_2024.json)
+        m = _RE_ANIO.search(RAW.name)
+        anio = int(m.group(1)) if m else ANIO_TRABAJO
         url = None
         fuente = "ARCA"
     else:
@@ -23,16 +28,12 @@ def normalize_ganancias_escalas():
         fuente = data.get("fuente", "ARCA")
 
     out = []
-    for i, t in enumerate(tramos, start=1):
+    for i, t in enumerate(parse_tramos(tramos), start=1):
         out.append({
             "concepto": f"GAN_ESCALA_TRAMO_{i}",
             "impuesto": "GANANCIAS",
             "anio": anio,
-            "desde": to_number(t.get("desde")),
-            "hasta": to_number(t.get("hasta")),
-            "monto_fijo": to_number(t.get("monto_fijo")),
-            "porcentaje": to_number(t.get("porcentaje")),
-            "excedente_desde": to_number(t.get("excedente_desde")),
+            **t,
             "unidad": "ARS/%",
             "fuente": fuente,
             "origen": "PDF_ART_94",
@@ -1,32 +1,46 @@
-import re
+from codigo.numeros import (  # noqa: F401  (re-export: los normalizers importan desde acá)
+    OK,
+    parse_batch,
+    to_number,
+    to_centavos,
+    to_micros,
+    to_basis_points,
+    formatear_centavos,
+)
 
-def to_number(x):
-    if x is None:
-        return None
-    if isinstance(x, (int, float)):
-        return float(x)
+CAMPOS_TRAMO = ("desde", "hasta", "monto_fijo", "porcentaje", "excedente_desde")
 
-    s = str(x).strip()
+# campo float → campo en punto fijo
+CAMPOS_ENTEROS = {
+    "desde": "desde_cent",
+    "hasta": "hasta_cent",
+    "monto_fijo": "monto_fijo_cent",
+    "porcentaje": "porcentaje_bp",
+    "excedente_desde": "excedente_desde_cent",
+}
 
-    # porcentaje
-    if s.endswith("%"):
-        s = s.replace("%", "").strip()
-        return to_number(s)
 
-    # limpiar moneda y separadores
-    s = s.replace("$", "").replace(" ", "")
-    s = s.replace(".", "")          # miles
-    s = s.replace(",", ".")         # decimal
+def parse_tramos(tramos):
+    """
+    Parsea en una sola llamada todas las celdas de una tabla de tramos
+    (lista de dicts con CAMPOS_TRAMO en texto ARCA).
 
-    # caso "en adelante"
-    if "adelante" in s.lower():
-        return None
+    Devuelve un dict por tramo con los CAMPOS_TRAMO en float (None si la celda
+    es '-' o 'en adelante') y sus equivalentes en punto fijo (CAMPOS_ENTEROS).
+    """
+    celdas = [t.get(campo) for t in tramos for campo in CAMPOS_TRAMO]
+    res = parse_batch(celdas)
+    valido = (res["estado"] == OK).tolist()
+    valor = res["valor"].tolist()
+    centavos = res["centavos"].tolist()
 
-    # solo números
-    if not re.search(r"\d", s):
-        return None
-
-    try:
-        return float(s)
-    except:
-        return None
+    out = []
+    for i in range(len(tramos)):
+        base = i * len(CAMPOS_TRAMO)
+        fila = {}
+        for j, campo in enumerate(CAMPOS_TRAMO):
+            fila[campo] = valor[base + j] if valido[base + j] else None
+        for j, campo in enumerate(CAMPOS_TRAMO):
+            fila[CAMPOS_ENTEROS[campo]] = centavos[base + j] if valido[base + j] else None
+        out.append(fila)
+    return out
@@ -0,0 +1,178 @@
+import math
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from codigo.metricas import registrar_cache
+
+# Estados de parse_batch
+OK = 0
+VACIO = 1          # None, "", "-"
+EN_ADELANTE = 2    # último tramo de una escala ("en adelante")
+INVALIDO = 3       # tiene dígitos pero no es un número argentino válido
+
+# "$ 1.234,56" → "1234.56": fuera moneda, espacios y miles; coma → punto
+_LIMPIEZA = str.maketrans({"$": None, " ": None, ".": None, ",": "."})
+_NO_DIGITO = re.compile(r"\D")
+
+
+@lru_cache(maxsize=65_536)
+def _parse_str(s: str):
+    """(valor float, centavos int, estado) de un texto. Memoizado: las tablas repiten mucho."""
+    s = s.strip()
+    if "adelante" in s.lower():
+        return None, None, EN_ADELANTE
+    if not any(c.isdigit() for c in s):
+        return None, None, VACIO
+
+    if s.endswith("%"):
+        s = s.replace("%", "").strip()
+
+    try:
+        valor = float(s.translate(_LIMPIEZA))
+    except ValueError:
+        return None, None, INVALIDO
+
+    return valor, _escalado(s, 2), OK
+
+
+def _escalado(s: str, decimales: int) -> int:
+    """Texto argentino ya validado → int en unidades de 10^-decimales, sin pasar por float (half-up)."""
+    entero, _, dec = s.replace("$", "").replace(" ", "").partition(",")
+    entero = _NO_DIGITO.sub("", entero)
+    dec = _NO_DIGITO.sub("", dec)
+    n = int(entero or 0) * 10 ** decimales + int((dec + "0" * decimales)[:decimales])
+    if len(dec) > decimales and dec[decimales] >= "5":
+        n += 1
+    if s.lstrip("$ ").startswith("-"):
+        n = -n
+    return n
+
+
+registrar_cache("numeros._parse_str", _parse_str)
+
+
+def parse_numero(x):
+    """Número argentino ("292.994.964,89", "0,50%", "$ 100") → (valor, centavos, estado)."""
+    if x is None:
+        return None, None, VACIO
+    if isinstance(x, int):
+        return float(x), x * 100, OK
+    if isinstance(x, (float, np.floating)):
+        if math.isnan(x):          # celda vacía de pandas / pyarrow
+            return None, None, VACIO
+        if math.isinf(x):
+            return None, None, INVALIDO
+        return float(x), int(round(x * 100)), OK
+    return _parse_str(str(x))
+
+
+def parse_batch(valores):
+    """
+    Parsea una columna entera en un solo pase.
+
+    Devuelve dict de arrays del mismo largo:
+      valor    float64 (NaN si no hay número)
+      centavos int64   (0 si no hay número; porcentajes → puntos básicos)
+      estado   uint8   (OK / VACIO / EN_ADELANTE / INVALIDO)
+    """
+    valores = list(valores)
+    n = len(valores)
+    valor = np.full(n, np.nan, dtype=np.float64)
+    centavos = np.zeros(n, dtype=np.int64)
+    estado = np.empty(n, dtype=np.uint8)
+
+    for i, x in enumerate(valores):
+        v, c, e = parse_numero(x)
+        estado[i] = e
+        if e == OK:
+            valor[i] = v
+            centavos[i] = c
+
+    return {"valor": valor, "centavos": centavos, "estado": estado}
+
+
+# ==========================
+# API escalar (la que usan los normalizers)
+# ==========================
+
+def to_number(x):
+    return parse_numero(x)[0]
+
+
+def to_centavos(x):
+    """
+    Monto argentino → int en centavos, sin pasar por float.
+    "292.994.964,89" → 29299496489. Más de 2 decimales: redondeo half-up.
+    """
+    return parse_numero(x)[1]
+
+
+def to_micros(x):
+    """
+    Monto argentino → int en millonésimos (10^-6), sin pasar por float. Para
+    cotizaciones con más de 2 decimales: "1.290,366000" → 1290366000.
+    """
+    if isinstance(x, str):
+        if _parse_str(x)[2] != OK:
+            return None
+        return _escalado(x.strip().replace("%", ""), 6)
+    v, _, estado = parse_numero(x)
+    return int(round(v * 1_000_000)) if estado == OK else None
+
+
+def to_basis_points(x):
+    """Porcentaje → int en puntos básicos (1 bp = 0,01%). "0,50%" → 50, "35" → 3500."""
+    # mismo escalado ×100 que los centavos
+    return parse_numero(x)[1]
+
+
+def formatear_centavos(cent) -> str:
+    """29299496489 → "292.994.964,89" (sólo para salida)."""
+    if cent is None:
+        return ""
+    cent = int(cent)
+    signo = "-" if cent < 0 else ""
+    entero, dec = divmod(abs(cent), 100)
+    return f"{signo}{entero:,}".replace(",", ".") + f",{dec:02d}"
+
+
+# ==========================
+# Reconstrucción de números extraídos de PDF
+# ==========================
+
+_PUNTOS = re.compile(r"\.{2,}")
+
+
+def reconstruir_ar(cleaned: str, completar_decimal=None, min_enteros: int = 1):
+    """
+    Rearma un número argentino que pdfplumber devolvió con puntos de más o
+    dígitos partidos: "1.36.0200,0" → "1.360.200,00".
+
+    completar_decimal: función para decimales de un solo dígito (default: "0" a la derecha).
+    Devuelve None si la parte entera tiene menos de `min_enteros` dígitos.
+    Sin coma sólo se colapsan los puntos repetidos.
+    """
+    cleaned = _PUNTOS.sub(".", cleaned)
+    if "," not in cleaned:
+        return cleaned
+
+    antes, _, despues = cleaned.partition(",")
+    enteros = _NO_DIGITO.sub("", antes)
+    decimales = _NO_DIGITO.sub("", despues)
+
+    if len(decimales) < 2:
+        if completar_decimal is not None:
+            decimales = completar_decimal(decimales)
+        decimales = decimales.ljust(2, "0")
+    else:
+        decimales = decimales[:2]
+
+    if len(enteros) < min_enteros:
+        return None
+
+    # agrupado de a 3 desde la derecha, conservando ceros a la izquierda
+    cabeza = len(enteros) % 3 or 3
+    grupos = [enteros[:cabeza]] + [enteros[i:i + 3] for i in range(cabeza, len(enteros), 3)]
+    return ".".join(grupos) + "," + decimales
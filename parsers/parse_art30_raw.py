@@ -1,13 +1,22 @@
 import json
 import re
-from pathlib import Path
+from functools import lru_cache
 import pdfplumber
 import sys
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-FILES_DIR = Path(r"C:\Users\franl\Desktop\impuestos\files")
+from codigo.metricas import contar, iniciar, log, medido, registrar_cache
+from codigo.numeros import reconstruir_ar, to_number
+from codigo.paths import FILES_DIR, OUTPUTS_DIR
 
 
+# decimales de un dígito que el PDF corta: "6" → "63", "2" → "23"
+DECIMALES_CORTADOS = {"6": "63", "2": "23"}
+
+RE_VALIDO = re.compile(r"^\d{1,2}\.\d{3}")
+RE_CANDIDATO = re.compile(r"[\s\d\.,]+,\d+")
+
+
+@lru_cache(maxsize=4096)
 def clean_number(raw: str) -> str:
     """
     Limpia y reconstruye números argentinos del PDF ARCA 2024 corrupto.
@@ -63,54 +72,29 @@ def clean_number(raw: str) -> str:
     # Números que empiezan con punto y tienen 6 dígitos → falta el "3"
     if cleaned.startswith(".") and "," in cleaned:
         parte_entera = cleaned.split(",")[0]
-        digitos = re.sub(r"[^\d]", "", parte_entera)
+        digitos = "".join(c for c in parte_entera if c.isdigit())
         
         if len(digitos) == 6 and digitos[0] in ["2", "5", "6"]:
             cleaned = "3" + cleaned
     
-    # Normalizar puntos múltiples
-    cleaned = re.sub(r"\.{2,}", ".", cleaned)
-    
-    # Reconstruir formato argentino si es necesario
-    if "," in cleaned:
-        partes = cleaned.split(",", 1)
-        antes_coma = partes[0]
-        despues_coma = partes[1] if len(partes) > 1 else "00"
-        
-        # Extraer dígitos
-        digitos_enteros = "".join(re.findall(r"\d", antes_coma))
-        digitos_decimales = "".join(re.findall(r"\d", despues_coma))
-        
-        # Completar decimales si faltan
-        if len(digitos_decimales) < 2:
-            if digitos_decimales == "6":
-                digitos_decimales = "63"
-            elif digitos_decimales == "2":
-                digitos_decimales = "23"
-            else:
-                digitos_decimales = digitos_decimales.ljust(2, "0")
-        else:
-            digitos_decimales = digitos_decimales[:2]
-        
-        # Formatear parte entera con puntos de miles
-        if len(digitos_enteros) >= 4:
-            resultado = []
-            for i, digito in enumerate(reversed(digitos_enteros)):
-                if i > 0 and i % 3 == 0:
-                    resultado.append(".")
-                resultado.append(digito)
-            
-            cleaned = "".join(reversed(resultado)) + "," + digitos_decimales
-        else:
-            return ""  # Número muy corto, probablemente ruido
+    # Reconstruir formato argentino (menos de 4 dígitos enteros = ruido)
+    cleaned = reconstruir_ar(
+        cleaned,
+        completar_decimal=lambda d: DECIMALES_CORTADOS.get(d, d),
+        min_enteros=4,
+    )
     
     # Validación final de formato
-    if not re.match(r"^\d{1,2}\.\d{3}", cleaned):
+    if not cleaned or not RE_VALIDO.match(cleaned):
         return ""
     
     return cleaned
 
 
+registrar_cache("parse_art30.clean_number", clean_number)
+
+
+@medido("parse_art30")
 def parse(year: int = None):
     """
     Parser robusto para Art. 30 - Deducciones Personales.
@@ -136,9 +120,9 @@ def parse(year: int = None):
     if not pdf_path.exists():
         raise FileNotFoundError(f"No se encontró PDF Art.30 para {year}: {pdf_path}")
 
-    out_path = BASE_DIR / "outputs" / f"raw_art30_{year}.json"
+    out_path = OUTPUTS_DIR / f"raw_art30_{year}.json"
 
-    print(f"📄 Parseando Art. 30 {year}: {pdf_path.name}")
+    log.info(f"📄 Parseando Art. 30 {year}: {pdf_path.name}")
 
     data = {
         "anio": year,
@@ -148,11 +132,13 @@ def parse(year: int = None):
     }
 
     with pdfplumber.open(pdf_path) as pdf:
+        contar("pdf_paginas", len(pdf.pages), parser="art30")
         page = pdf.pages[0]
         
         # Extraer texto línea por línea
         texto = page.extract_text() or ""
         lineas = [l.strip() for l in texto.split("\n") if l.strip()]
+        contar("lineas", len(lineas), parser="art30")
         
         # Extraer TODOS los números del documento
         numeros_encontrados = []
@@ -160,25 +146,23 @@ def parse(year: int = None):
         for i, linea in enumerate(lineas):
             # REGEX CRÍTICO: permite espacios, puntos, comas Y dígitos
             # Captura números fragmentados como ".53 .688,17" y " . 28.17 ,6"
-            matches = re.findall(r"[\s\d\.,]+,\d+", linea)
+            matches = RE_CANDIDATO.findall(linea)
             
             for match in matches:
                 numero_limpio = clean_number(match)
                 
-                if numero_limpio and re.match(r"^\d{1,2}\.\d{3}", numero_limpio):
+                if numero_limpio:
                     # Validar rango razonable
-                    try:
-                        valor_numerico = float(numero_limpio.replace(".", "").replace(",", "."))
-                        
-                        # Filtrar ruido (años, códigos, etc.)
-                        # ARCA 2024: valores entre 1.6M y 17M
-                        if 500_000 < valor_numerico < 100_000_000:
-                            numeros_encontrados.append(numero_limpio)
-                            print(f"   · Línea {i:2d}: {linea[:55]:55} → {numero_limpio}")
-                    except:
-                        pass
+                    valor_numerico = to_number(numero_limpio)
+                    
+                    # Filtrar ruido (años, códigos, etc.)
+                    # ARCA 2024: valores entre 1.6M y 17M
+                    if valor_numerico is not None and 500_000 < valor_numerico < 100_000_000:
+                        numeros_encontrados.append(numero_limpio)
+                        log.debug("   · Línea %2d: %-55s → %s", i, linea[:55], numero_limpio)
         
-        print(f"\n   ✓ Total números extraídos: {len(numeros_encontrados)}")
+        contar("numeros_extraidos", len(numeros_encontrados), parser="art30")
+        log.info(f"\n   ✓ Total números extraídos: {len(numeros_encontrados)}")
         
         # Orden estructural del Art. 30 (SIEMPRE el mismo por ley)
         ORDEN_ESPERADO = [
@@ -205,19 +189,18 @@ def parse(year: int = None):
     
     if found_count < expected_count:
         faltantes = set(ORDEN_ESPERADO) - set(data["items"].keys())
-        print(f"\n   ⚠ ADVERTENCIA: Solo {found_count}/{expected_count} conceptos encontrados")
-        print(f"   Faltantes: {', '.join(faltantes)}")
+        log.warning(f"\n   ⚠ ADVERTENCIA: Solo {found_count}/{expected_count} conceptos encontrados")
+        log.warning(f"   Faltantes: {', '.join(faltantes)}")
     else:
-        print(f"\n   ✅ Completo: {found_count}/{expected_count} conceptos extraídos correctamente")
+        log.info(f"\n   ✅ Completo: {found_count}/{expected_count} conceptos extraídos correctamente")
     
     # Validar rangos esperados
     for key, valor in data["items"].items():
-        try:
-            monto = float(valor.replace(".", "").replace(",", "."))
-            if monto < 1_000_000 or monto > 20_000_000:
-                print(f"   ⚠ {key}: valor fuera de rango esperado ({valor})")
-        except:
-            print(f"   ⚠ {key}: formato inválido ({valor})")
+        monto = to_number(valor)
+        if monto is None:
+            log.warning(f"   ⚠ {key}: formato inválido ({valor})")
+        elif monto < 1_000_000 or monto > 20_000_000:
+            log.warning(f"   ⚠ {key}: valor fuera de rango esperado ({valor})")
     
     # Guardar JSON
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -226,12 +209,13 @@ def parse(year: int = None):
         encoding="utf-8"
     )
 
-    print(f"\n✅ JSON guardado: {out_path}")
+    log.info(f"\n✅ JSON guardado: {out_path}")
     
     return data
 
 
 if __name__ == "__main__":
+    iniciar("parse_art30")
     year = int(sys.argv[1]) if len(sys.argv) > 1 else 2024
     result = parse(year)
     
@@ -1,16 +1,17 @@
 import json
-import requests
-from pathlib import Path
 from bs4 import BeautifulSoup
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-OUT = BASE_DIR / "outputs" / "raw_bienes_alicuotas_all.json"
+from codigo.metricas import contar, iniciar, log, medido
+from codigo.paths import OUTPUTS_DIR
+from codigo.sesion_http import get
+
+OUT = OUTPUTS_DIR / "raw_bienes_alicuotas_all.json"
 
 URL = "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/conceptos-basicos/alicuotas.asp"
-HEADERS = {"User-Agent": "Impuestos-Explorer"}
 
+@medido("parse_bp_alicuotas")
 def parse():
-    r = requests.get(URL, headers=HEADERS, timeout=30)
+    r = get(URL)
     r.raise_for_status()
 
     soup = BeautifulSoup(r.text, "html.parser")
@@ -22,8 +23,9 @@ def parse():
     }
 
     for idx, table in enumerate(tables):
-        # texto cercano (contexto humano)
-        context = table.find_previous(text=True)
+        # texto cercano (contexto humano): el título de la tabla, ej. "Escala general - período 2024".
+        # El primer texto no vacío: justo antes de la tabla suele haber sólo un salto de línea.
+        context = table.find_previous(string=lambda t: t.strip())
         context_text = context.strip() if context else ""
 
         rows = []
@@ -43,7 +45,9 @@ def parse():
         encoding="utf-8"
     )
 
-    print(f"OK → {OUT} (tablas: {len(data['tablas'])})")
+    contar("tablas", len(data["tablas"]), parser="bp_alicuotas")
+    log.info(f"OK → {OUT} (tablas: {len(data['tablas'])})")
 
 if __name__ == "__main__":
+    iniciar("parse_bp_alicuotas")
     parse()
@@ -1,16 +1,16 @@
 import json
 import re
-import requests
 from bs4 import BeautifulSoup, Tag
-from pathlib import Path
+
+from codigo.metricas import contar, iniciar, log, medido
+from codigo.paths import OUTPUTS_DIR
+from codigo.sesion_http import get
 
 URL = "https://www.arca.gob.ar/gananciasYBienes/bienes-personales/declaracion-jurada/determinativa.asp"
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-OUT = BASE_DIR / "outputs" / "raw_bienes_alicuotas_all.json"
+OUT = OUTPUTS_DIR / "raw_bp_determinativa.json"
 
 
-HEADERS = {"User-Agent": "Impuestos-Explorer"}
 
 # Regex robustos (AR $ con separadores argentinos)
 RE_PERIODO = re.compile(r"per[ií]odo\s+(20\d{2})", re.IGNORECASE)
@@ -65,8 +65,9 @@ def extract_amount_from_li(li: Tag) -> str | None:
     return m.group(0) if m else None
 
 
+@medido("parse_bp_determinativa")
 def parse():
-    r = requests.get(URL, headers=HEADERS, timeout=30)
+    r = get(URL)
     r.raise_for_status()
 
     # ✅ Arregla el “DeclaraciÃ³n” y similares
@@ -113,12 +114,14 @@ def parse():
 
     OUT.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
 
-    print("✅ Parser BP determinativa ejecutado")
-    print(f"Archivo generado: {OUT.resolve()}")
-    print(f"Thresholds encontrados: {len(thresholds)}")
+    contar("thresholds", len(thresholds), parser="bp_determinativa")
+    log.info("✅ Parser BP determinativa ejecutado")
+    log.info(f"Archivo generado: {OUT.resolve()}")
+    log.info(f"Thresholds encontrados: {len(thresholds)}")
     if thresholds:
-        print("Ejemplo:", thresholds[0])
+        log.debug("Ejemplo: %s", thresholds[0])
 
 
 if __name__ == "__main__":
+    iniciar("parse_bp_determinativa")
     parse()
@@ -1,14 +1,18 @@
 import pdfplumber
 import json
-from pathlib import Path
+from functools import lru_cache
 import sys
 import re
 
+from codigo.metricas import contar, iniciar, log, medido, registrar_cache
+from codigo.numeros import reconstruir_ar
+from codigo.paths import FILES_DIR, OUTPUTS_DIR
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-FILES_DIR = Path(r"C:\Users\franl\Desktop\impuestos\files")
 
+RE_CANDIDATO = re.compile(r"[\d\.\s]+,\d{2}")
 
+
+@lru_cache(maxsize=4096)
 def clean_number(raw: str) -> str:
     """Limpia números argentinos del PDF ARCA Art. 94"""
     if not raw or not isinstance(raw, str):
@@ -32,32 +36,14 @@ def clean_number(raw: str) -> str:
     if cleaned.startswith(".78.767"):
         return "9.978.767,25"
     
-    cleaned = re.sub(r"\.{2,}", ".", cleaned)
-    
-    if "," in cleaned:
-        partes = cleaned.split(",", 1)
-        antes = partes[0]
-        despues = partes[1] if len(partes) > 1 else "00"
-        
-        dig_ent = "".join(re.findall(r"\d", antes))
-        dig_dec = "".join(re.findall(r"\d", despues))
-        
-        if len(dig_dec) < 2:
-            dig_dec = dig_dec.ljust(2, "0")
-        else:
-            dig_dec = dig_dec[:2]
-        
-        if len(dig_ent) >= 1:
-            res = []
-            for i, d in enumerate(reversed(dig_ent)):
-                if i > 0 and i % 3 == 0:
-                    res.append(".")
-                res.append(d)
-            cleaned = "".join(reversed(res)) + "," + dig_dec
-    
-    return cleaned
+    # sin dígitos enteros se devuelve tal cual (sólo con los puntos colapsados)
+    return reconstruir_ar(cleaned) or re.sub(r"\.{2,}", ".", cleaned)
+
+
+registrar_cache("parse_art94.clean_number", clean_number)
 
 
+@medido("parse_art94")
 def parse(year: int = None):
     """Parser para Art. 94 - Escalas del impuesto a las ganancias"""
     
@@ -69,9 +55,9 @@ def parse(year: int = None):
     if not pdf_path.exists():
         raise FileNotFoundError(f"No se encontró PDF Art.94 para {year}: {pdf_path}")
     
-    out_path = BASE_DIR / "outputs" / f"raw_art94_{year}.json"
+    out_path = OUTPUTS_DIR / f"raw_art94_{year}.json"
     
-    print(f"📄 Parseando Art. 94 {year}: {pdf_path.name}")
+    log.info(f"📄 Parseando Art. 94 {year}: {pdf_path.name}")
     
     # VALORES OFICIALES ARCA 2024 (fallback si extracción falla)
     ESCALAS_OFICIALES = [
@@ -88,6 +74,7 @@ def parse(year: int = None):
     
     try:
         with pdfplumber.open(pdf_path) as pdf:
+            contar("pdf_paginas", len(pdf.pages), parser="art94")
             page = pdf.pages[0]
             texto = page.extract_text() or ""
             lineas = [l.strip() for l in texto.split("\n") if l.strip()]
@@ -97,7 +84,7 @@ def parse(year: int = None):
             i = 0
             while i < len(lineas):
                 linea = lineas[i]
-                numeros_raw = re.findall(r"[\d\.\s]+,\d{2}", linea)
+                numeros_raw = RE_CANDIDATO.findall(linea)
                 
                 if len(numeros_raw) >= 2:
                     numeros = [clean_number(n) for n in numeros_raw]
@@ -126,7 +113,8 @@ def parse(year: int = None):
                 
                 i += 1
             
-            print(f"   ✓ Filas parseadas: {len(escalas_raw)}")
+            contar("filas", len(escalas_raw), parser="art94")
+            log.info(f"   ✓ Filas parseadas: {len(escalas_raw)}")
             
             # Construir escalas
             escalas = []
@@ -171,11 +159,12 @@ def parse(year: int = None):
                             "excedente_desde": nums[0]
                         })
             
-            print(f"   ✓ Escalas construidas: {len(escalas)}")
+            log.info(f"   ✓ Escalas construidas: {len(escalas)}")
             
             # Validar
             if len(escalas) != 9:
-                print(f"   ⚠ Extracción incompleta ({len(escalas)}/9), usando valores oficiales")
+                contar("fallback_oficial", parser="art94")
+                log.warning(f"   ⚠ Extracción incompleta ({len(escalas)}/9), usando valores oficiales")
                 escalas = ESCALAS_OFICIALES
             else:
                 # Completar porcentajes faltantes
@@ -184,8 +173,9 @@ def parse(year: int = None):
                         escalas[i]["porcentaje"] = ESCALAS_OFICIALES[i]["porcentaje"]
     
     except Exception as e:
-        print(f"   ❌ Error en extracción: {e}")
-        print(f"   → Usando valores oficiales ARCA 2024")
+        contar("fallback_oficial", parser="art94")
+        log.error(f"   ❌ Error en extracción: {e}")
+        log.error(f"   → Usando valores oficiales ARCA 2024")
         escalas = ESCALAS_OFICIALES
     
     # Guardar
@@ -195,13 +185,14 @@ def parse(year: int = None):
         encoding="utf-8"
     )
     
-    print(f"\n✅ JSON guardado: {out_path}")
-    print(f"   Total escalas: {len(escalas)}")
+    log.info(f"\n✅ JSON guardado: {out_path}")
+    log.info(f"   Total escalas: {len(escalas)}")
     
     return escalas
 
 
 if __name__ == "__main__":
+    iniciar("parse_art94")
     year = int(sys.argv[1]) if len(sys.argv) > 1 else 2024
     result = parse(year)
     
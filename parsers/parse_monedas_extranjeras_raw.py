@@ -1,15 +1,10 @@
 import json
 import re
-from pathlib import Path
 import pdfplumber
 import sys
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-FILES_DIR = Path(r"C:\Users\franl\Desktop\impuestos\files")
-year = int(sys.argv[1]) if len(sys.argv) > 1 else 2024
-PDF = FILES_DIR / f"Valuaciones-{year}-Moneda-Extranjera.pdf"
-OUT = BASE_DIR / "outputs" / f"raw_monedas_{year}.json"
-
+from codigo.metricas import contar, iniciar, log, medido
+from codigo.paths import FILES_DIR, OUTPUTS_DIR
 
 MONEY_RE = re.compile(r"\d{1,3}(?:\.\d{3})*,\d{2,6}")  # 1.029,000000 / 113.643,398800
 
@@ -47,15 +42,23 @@ def parse_table(table, kind: str):
         })
     return out
 
-def parse():
+@medido("parse_monedas")
+def parse(year: int = None):
+    if year is None:
+        year = 2024
+
+    pdf_path = FILES_DIR / f"Valuaciones-{year}-Moneda-Extranjera.pdf"
+    out_path = OUTPUTS_DIR / f"raw_monedas_{year}.json"
+
     data = {
-        "anio": 2024,
+        "anio": year,
         "fuente": "ARCA",
         "divisas": [],
         "billetes": [],
     }
 
-    with pdfplumber.open(PDF) as pdf:
+    with pdfplumber.open(pdf_path) as pdf:
+        contar("pdf_paginas", len(pdf.pages), parser="monedas")
         page = pdf.pages[0]
         tables = page.extract_tables() or []
 
@@ -65,9 +68,11 @@ def parse():
         # En este PDF salen como table[0]=DIVISAS y table[1]=BILLETES
         data["divisas"] = parse_table(tables[0], "divisas")
         data["billetes"] = parse_table(tables[1], "billetes")
+        contar("filas", len(data["divisas"]) + len(data["billetes"]), parser="monedas")
 
-    OUT.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"OK -> {OUT}")
+    out_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    log.info(f"OK -> {out_path}")
 
 if __name__ == "__main__":
-    parse()
+    iniciar("parse_monedas")
+    parse(int(sys.argv[1]) if len(sys.argv) > 1 else 2024)
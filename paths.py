@@ -6,3 +6,4 @@ ANIO_TRABAJO = datetime.now().year
 BASE_DIR = Path(__file__).resolve().parents[1]   # .../impuestos
 
 OUTPUTS_DIR = BASE_DIR / "outputs"
+FILES_DIR = BASE_DIR / "files"           # PDFs descargados de ARCA
@@ -0,0 +1,185 @@
+"""
+--profile para todos los entry points (lo engancha metricas.iniciar()).
+
+    python -m codigo.parsers.parse_art30_raw 2024 --profile             # cProfile
+    python -m codigo.normalizers.normalize_all --profile=muestreo       # muestreo (menos overhead)
+
+Cada corrida deja en outputs/perfiles/<proceso>_<fecha>/:
+    perfil.prof           cProfile (pstats / snakeviz)
+    stacks.txt            muestreo, formato "collapsed" (flamegraph.pl / speedscope)
+    memoria_inicio.snap   snapshots de tracemalloc (tracemalloc.Snapshot.load)
+    memoria_fin.snap
+    reporte.txt           top-N de funciones y de sitios de asignación (también se imprime)
+"""
+import atexit
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from codigo.paths import OUTPUTS_DIR
+
+PERFILES_DIR = OUTPUTS_DIR / "perfiles"
+MODOS = ("cprofile", "muestreo")
+TOP = 15
+INTERVALO_MUESTREO = 0.005     # segundos entre muestras
+FRAMES_TRACEMALLOC = 10
+
+
+def pedido(argv=None):
+    """
+    Saca --profile / --profile=MODO / --profile MODO de argv y devuelve el
+    modo (None si no se pidió). Se saca antes de que el script lea sus
+    argumentos: varios leen sys.argv a mano. El argumento que sigue a
+    --profile sólo se toma como modo si es uno de MODOS.
+    """
+    argv = sys.argv if argv is None else argv
+    modo = None
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--profile":
+            if i + 1 < len(argv) and argv[i + 1] in MODOS:
+                modo = argv.pop(i + 1)
+            else:
+                modo = "cprofile"
+        elif arg.startswith("--profile="):
+            modo = arg.split("=", 1)[1]
+        else:
+            i += 1
+            continue
+        del argv[i]
+
+    if modo is not None and modo not in MODOS:
+        raise SystemExit(f"--profile: modo desconocido {modo!r} (opciones: {', '.join(MODOS)})")
+    return modo
+
+
+# ==========================
+# MUESTREO
+# ==========================
+
+class Muestreador:
+    """Cada `intervalo` segundos anota la pila del hilo principal."""
+
+    def __init__(self, intervalo: float = INTERVALO_MUESTREO):
+        self.intervalo = intervalo
+        self.stacks = Counter()
+        self._hilo_principal = threading.main_thread().ident
+        self._parar = threading.Event()
+        self._hilo = threading.Thread(target=self._correr, daemon=True)
+
+    def start(self):
+        self._hilo.start()
+
+    def stop(self):
+        self._parar.set()
+        self._hilo.join()
+
+    def _correr(self):
+        while not self._parar.wait(self.intervalo):
+            frame = sys._current_frames().get(self._hilo_principal)
+            pila = []
+            while frame is not None:
+                pila.append(f"{Path(frame.f_code.co_filename).name}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if pila:
+                self.stacks[";".join(reversed(pila))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{pila} {n}\n" for pila, n in self.stacks.most_common())
+
+    def top(self, n: int = TOP) -> str:
+        total = sum(self.stacks.values()) or 1
+        propio, incluido = Counter(), Counter()
+        for pila, k in self.stacks.items():
+            funciones = pila.split(";")
+            propio[funciones[-1]] += k
+            for f in set(funciones):
+                incluido[f] += k
+
+        lineas = [f"{'PROPIO':>8} {'INCLUIDO':>9}  FUNCIÓN   ({total} muestras cada {self.intervalo * 1e3:.0f} ms)"]
+        for f, k in propio.most_common(n):
+            lineas.append(f"{k / total:8.1%} {incluido[f] / total:9.1%}  {f}")
+        return "\n".join(lineas)
+
+
+# ==========================
+# PERFIL DE UNA CORRIDA
+# ==========================
+
+class Perfil:
+    def __init__(self, proceso: str, modo: str = "cprofile", top: int = TOP):
+        self.proceso, self.modo, self.top = proceso, modo, top
+        self.dir = PERFILES_DIR / f"{proceso}_{datetime.now():%Y%m%d_%H%M%S}"
+        self._perfilador = None
+        self._snap_inicio = None
+        self._t0 = None
+
+    def iniciar(self):
+        tracemalloc.start(FRAMES_TRACEMALLOC)
+        self._snap_inicio = tracemalloc.take_snapshot()
+        if self.modo == "muestreo":
+            self._perfilador = Muestreador()
+            self._perfilador.start()
+        else:
+            self._perfilador = cProfile.Profile()
+            self._perfilador.enable()
+        self._t0 = time.perf_counter()
+
+    def terminar(self) -> str:
+        """Frena todo, guarda los archivos e imprime el reporte."""
+        segundos = time.perf_counter() - self._t0
+        if self.modo == "muestreo":
+            self._perfilador.stop()
+        else:
+            self._perfilador.disable()
+        snap_fin = tracemalloc.take_snapshot()
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._snap_inicio.dump(str(self.dir / "memoria_inicio.snap"))
+        snap_fin.dump(str(self.dir / "memoria_fin.snap"))
+
+        if self.modo == "muestreo":
+            (self.dir / "stacks.txt").write_text(self._perfilador.collapsed(), encoding="utf-8")
+            funciones = self._perfilador.top(self.top)
+        else:
+            self._perfilador.dump_stats(self.dir / "perfil.prof")
+            buf = io.StringIO()
+            pstats.Stats(self._perfilador, stream=buf).sort_stats("tottime").print_stats(self.top)
+            funciones = buf.getvalue().strip()
+
+        filtros = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        crecimiento = snap_fin.filter_traces(filtros).compare_to(self._snap_inicio.filter_traces(filtros), "lineno")
+        asignaciones = "\n".join(str(s) for s in crecimiento[:self.top])
+
+        reporte = "\n".join([
+            f"⏱️ Perfil {self.proceso} ({self.modo}): {segundos:.2f}s | pico de memoria {pico / 1024 ** 2:.1f} MB",
+            "",
+            f"🔥 Top {self.top} funciones",
+            funciones,
+            "",
+            f"🧠 Top {self.top} sitios de asignación (memoria viva al final vs. al inicio)",
+            asignaciones,
+            "",
+            f"📁 {self.dir.resolve()}",
+        ])
+        (self.dir / "reporte.txt").write_text(reporte + "\n", encoding="utf-8")
+        print("\n" + reporte)
+        return reporte
+
+
+def activar(proceso: str, modo: str = "cprofile") -> Perfil:
+    """Perfila desde ya hasta que termine el proceso."""
+    perfil = Perfil(proceso, modo)
+    perfil.iniciar()
+    atexit.register(perfil.terminar)
+    return perfil
@@ -0,0 +1,420 @@
+"""
+Orquestador incremental: crawl → descarga → parse → normalize → Excel.
+
+Cada etapa declara sus entradas y salidas (archivos). Las dependencias salen
+solas de quién produce cada entrada, y una etapa se vuelve a correr sólo si
+cambió el contenido (sha256) de sus entradas o de su código, o si le falta
+alguna salida. Las ramas independientes (PDFs de Ganancias, PDF de monedas,
+HTML de Bienes Personales) corren en paralelo.
+
+Las etapas "externas" (las que bajan cosas de ARCA) no tienen entradas
+propias que mirar: se consideran al día mientras existan sus salidas, salvo
+que se pidan con --forzar o --refrescar.
+
+Uso (desde la carpeta que contiene `codigo`):
+    python -m codigo.pipeline                      # todo lo que esté desactualizado
+    python -m codigo.pipeline normalize            # sólo hasta normalize
+    python -m codigo.pipeline --refrescar          # vuelve a bajar todo de ARCA
+    python -m codigo.pipeline --plan               # muestra qué correría
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+from codigo.paths import BASE_DIR, FILES_DIR, OUTPUTS_DIR
+
+# ==========================
+# CONFIGURACIÓN
+# ==========================
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# los normalizers leen los raw_*_2024
+ANIO = 2024
+
+EXCEL_PATH = Path(r"C:\Users\franl\Desktop\impuestos\CH - Anuales 2024.xlsx")
+
+ESTADO_JSON = OUTPUTS_DIR / "pipeline_estado.json"
+TIEMPOS_JSONL = OUTPUTS_DIR / "pipeline_tiempos.jsonl"
+LOGS_DIR = OUTPUTS_DIR / "logs"
+
+SITE_MAP_JSONL = OUTPUTS_DIR / "site_map.jsonl"
+PDFS_ENCONTRADOS_TXT = OUTPUTS_DIR / "pdfs_encontrados.txt"
+PARAMETROS_JSON = OUTPUTS_DIR / "parametros_arca.json"
+
+
+class Etapa:
+    """
+    Una etapa del pipeline.
+
+    cmd: argumentos para `python` (se corre con cwd = carpeta impuestos/)
+    funcion: alternativa a cmd, se llama en el mismo proceso
+    codigo: archivos del repo (globs) cuyo contenido forma parte de la firma
+    externa: baja datos de ARCA; al día mientras existan sus salidas
+    """
+
+    def __init__(self, nombre, cmd=None, funcion=None, entradas=(), salidas=(), codigo=(),
+                 externa=False, rama=""):
+        self.nombre = nombre
+        self.cmd = [str(c) for c in cmd] if cmd else None
+        self.funcion = funcion
+        self.entradas = [Path(p) for p in entradas]
+        self.salidas = [Path(p) for p in salidas]
+        self.codigo = list(codigo)
+        self.externa = externa
+        self.rama = rama
+
+    def __repr__(self):
+        return f"Etapa({self.nombre!r})"
+
+
+def _listar_pdfs():
+    """site_map.jsonl del crawler → pdfs_encontrados.txt (entrada de prefilter_pdfs)."""
+    urls = set()
+    with SITE_MAP_JSONL.open(encoding="utf-8") as f:
+        for linea in f:
+            if linea.strip():
+                e = json.loads(linea)
+                if e.get("type") == "pdf":
+                    urls.add(e["url"])
+    urls = sorted(urls)
+    PDFS_ENCONTRADOS_TXT.write_text("\n".join(urls), encoding="utf-8")
+    print(f"PDFs encontrados: {len(urls)}")
+
+
+def etapas(excel_path: Path = EXCEL_PATH, anio: int = ANIO):
+    mapper = REPO_DIR / "arca_mapper"
+    raw_art30 = OUTPUTS_DIR / f"raw_art30_{anio}.json"
+    raw_art94 = OUTPUTS_DIR / f"raw_art94_{anio}.json"
+    raw_monedas = OUTPUTS_DIR / f"raw_monedas_{anio}.json"
+    raw_alicuotas = OUTPUTS_DIR / "raw_bienes_alicuotas_all.json"
+    raw_determinativa = OUTPUTS_DIR / "raw_bp_determinativa.json"
+    pdf_art30 = FILES_DIR / f"Deducciones-personales-art-30-liquidacion-anual-{anio}.pdf"
+    pdf_art94 = FILES_DIR / f"Tabla-art-94-liquidacion-anual-final-{anio}.pdf"
+    pdf_monedas = FILES_DIR / f"Valuaciones-{anio}-Moneda-Extranjera.pdf"
+
+    return [
+        # 🌐 Relevamiento del sitio
+        Etapa("crawl", cmd=[mapper / "crawler.py"], externa=True, rama="sitio",
+              salidas=[SITE_MAP_JSONL, OUTPUTS_DIR / "summary.txt"]),
+        Etapa("listar_pdfs", funcion=_listar_pdfs, rama="sitio",
+              entradas=[SITE_MAP_JSONL], salidas=[PDFS_ENCONTRADOS_TXT], codigo=["pipeline.py"]),
+        Etapa("prefilter", cmd=[mapper / "prefilter_pdfs.py"], rama="sitio",
+              entradas=[PDFS_ENCONTRADOS_TXT],
+              salidas=[OUTPUTS_DIR / "fuentes_utiles_ganancias.txt", OUTPUTS_DIR / "fuentes_utiles_bienes.txt",
+                       OUTPUTS_DIR / "pdfs_descartados.txt"],
+              codigo=["arca_mapper/prefilter_pdfs.py"]),
+
+        # 📄 Ganancias (PDFs)
+        Etapa("descargar_ganancias", cmd=[mapper / "descargar_pdfs.py", "ganancias"], externa=True,
+              rama="ganancias", entradas=[OUTPUTS_DIR / "fuentes_utiles_ganancias.txt"],
+              salidas=[pdf_art30, pdf_art94]),
+        Etapa("parse_art30", cmd=["-m", "codigo.parsers.parse_art30_raw", anio], rama="ganancias",
+              entradas=[pdf_art30], salidas=[raw_art30],
+              codigo=["parsers/parse_art30_raw.py", "numeros.py"]),
+        Etapa("parse_art94", cmd=["-m", "codigo.parsers.parse_escalas_art94_raw", anio], rama="ganancias",
+              entradas=[pdf_art94], salidas=[raw_art94],
+              codigo=["parsers/parse_escalas_art94_raw.py", "numeros.py"]),
+
+        # 💱 Bienes Personales: monedas (PDF)
+        Etapa("descargar_bienes", cmd=[mapper / "descargar_pdfs.py", "bienes"], externa=True,
+              rama="bienes_pdf", entradas=[OUTPUTS_DIR / "fuentes_utiles_bienes.txt"],
+              salidas=[pdf_monedas]),
+        Etapa("parse_monedas", cmd=["-m", "codigo.parsers.parse_monedas_extranjeras_raw", anio],
+              rama="bienes_pdf", entradas=[pdf_monedas], salidas=[raw_monedas],
+              codigo=["parsers/parse_monedas_extranjeras_raw.py"]),
+
+        # 🏠 Bienes Personales: HTML
+        Etapa("parse_bp_alicuotas", cmd=["-m", "codigo.parsers.parse_bienes_alicuotas_html_raw"],
+              externa=True, rama="bienes_html", salidas=[raw_alicuotas]),
+        Etapa("parse_bp_determinativa", cmd=["-m", "codigo.parsers.parse_bp_determinativa_html_raw"],
+              externa=True, rama="bienes_html", salidas=[raw_determinativa]),
+
+        # 🧮 Normalización y Excel
+        Etapa("normalize", cmd=["-m", "codigo.normalizers.normalize_all"],
+              entradas=[raw_art30, raw_art94, raw_monedas, raw_alicuotas, raw_determinativa],
+              salidas=[PARAMETROS_JSON],
+              codigo=["normalizers/*.py", "numeros.py", "calculators/paquete.py", "calculators/parametros.py"]),
+        Etapa("excel", cmd=["-m", "codigo.excel_loader", "--sync", "--excel", excel_path,
+                            "--parametros", PARAMETROS_JSON],
+              entradas=[PARAMETROS_JSON], codigo=["excel_loader.py"]),
+    ]
+
+
+# ==========================
+# HASHES / ESTADO
+# ==========================
+
+_HASHES = {}  # (path, mtime, tamaño) → sha256, dentro de una corrida
+
+
+def hash_archivo(path: Path):
+    """sha256 del contenido (None si no existe)."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    clave = (str(path), st.st_mtime_ns, st.st_size)
+    if clave not in _HASHES:
+        h = hashlib.sha256()
+        with path.open("rb") as f:
+            for bloque in iter(lambda: f.read(1 << 20), b""):
+                h.update(bloque)
+        _HASHES[clave] = h.hexdigest()
+    return _HASHES[clave]
+
+
+def archivos_codigo(etapa: Etapa):
+    paths = set()
+    for patron in etapa.codigo:
+        paths.update(REPO_DIR.glob(patron))
+    return sorted(paths)
+
+
+def firma(etapa: Etapa) -> str:
+    """Hash de lo que determina el resultado: comando, contenido de entradas y de código."""
+    datos = {
+        "cmd": etapa.cmd,
+        "entradas": {str(p): hash_archivo(p) for p in etapa.entradas},
+        "codigo": {str(p.relative_to(REPO_DIR)): hash_archivo(p) for p in archivos_codigo(etapa)},
+    }
+    return hashlib.sha256(json.dumps(datos, sort_keys=True).encode()).hexdigest()
+
+
+def cargar_estado():
+    if ESTADO_JSON.exists():
+        return json.loads(ESTADO_JSON.read_text(encoding="utf-8"))
+    return {"etapas": {}}
+
+
+def guardar_estado(estado):
+    tmp = ESTADO_JSON.with_name(ESTADO_JSON.name + ".tmp")
+    tmp.write_text(json.dumps(estado, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(ESTADO_JSON)
+
+
+def motivo_para_correr(etapa: Etapa, estado, forzadas):
+    """Motivo por el que la etapa está desactualizada, o None si está al día."""
+    if etapa.nombre in forzadas:
+        return "forzada"
+    faltan = [p for p in etapa.salidas if not p.exists()]
+    if faltan:
+        return f"falta {faltan[0].name}"
+    if etapa.externa:
+        return None
+
+    previo = estado["etapas"].get(etapa.nombre)
+    if previo is None:
+        return "sin corridas previas"
+    if previo.get("firma") != firma(etapa):
+        return "cambiaron entradas o código"
+    for p, h in previo.get("salidas", {}).items():
+        if hash_archivo(Path(p)) != h:
+            return f"{Path(p).name} modificado a mano"
+    return None
+
+
+# ==========================
+# GRAFO
+# ==========================
+
+def dependencias(lista):
+    """nombre → nombres de las etapas que producen sus entradas."""
+    productor = {}
+    for e in lista:
+        for p in e.salidas:
+            productor[p] = e.nombre
+    return {
+        e.nombre: sorted({productor[p] for p in e.entradas if p in productor and productor[p] != e.nombre})
+        for e in lista
+    }
+
+
+def seleccionar(lista, deps, objetivos, forzadas):
+    """
+    Etapas necesarias para los objetivos. Una etapa externa con sus salidas
+    presentes (y no forzada) corta la búsqueda: no hace falta lo de arriba.
+    """
+    por_nombre = {e.nombre: e for e in lista}
+    elegidas = set()
+    pendientes = list(objetivos)
+    while pendientes:
+        nombre = pendientes.pop()
+        if nombre in elegidas:
+            continue
+        elegidas.add(nombre)
+        e = por_nombre[nombre]
+        if e.externa and nombre not in forzadas and all(p.exists() for p in e.salidas):
+            continue
+        pendientes.extend(deps[nombre])
+    return [e for e in lista if e.nombre in elegidas]
+
+
+# ==========================
+# EJECUCIÓN
+# ==========================
+
+def correr_etapa(etapa: Etapa, estado, forzadas):
+    """Corre la etapa si hace falta. Devuelve dict estado/motivo/segundos/log."""
+    motivo = motivo_para_correr(etapa, estado, forzadas)
+    if motivo is None:
+        return {"estado": "al_dia", "segundos": 0.0}
+
+    faltan = [p for p in etapa.entradas if not p.exists()]
+    if faltan and not etapa.externa:
+        return {"estado": "error", "segundos": 0.0, "motivo": motivo,
+                "error": f"falta la entrada {faltan[0]}"}
+
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    log = LOGS_DIR / f"{etapa.nombre}.log"
+    t0 = time.perf_counter()
+
+    if etapa.funcion is not None:
+        try:
+            etapa.funcion()
+            ok, error = True, None
+        except Exception as e:
+            ok, error = False, f"{type(e).__name__}: {e}"
+    else:
+        with log.open("w", encoding="utf-8") as f:
+            proc = subprocess.run(
+                [sys.executable, *etapa.cmd], cwd=BASE_DIR, stdout=f, stderr=subprocess.STDOUT,
+                env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+            )
+        ok, error = proc.returncode == 0, f"salió con código {proc.returncode}"
+
+    segundos = time.perf_counter() - t0
+    if ok:
+        faltan = [p for p in etapa.salidas if not p.exists()]
+        if faltan:
+            ok, error = False, f"no generó {faltan[0]}"
+
+    resultado = {"estado": "ok" if ok else "error", "segundos": segundos, "motivo": motivo, "log": str(log)}
+    if not ok:
+        resultado["error"] = error
+    return resultado
+
+
+def run(objetivos=None, forzadas=(), refrescar=False, workers=None, plan=False, excel_path: Path = EXCEL_PATH):
+    lista = etapas(excel_path)
+    por_nombre = {e.nombre: e for e in lista}
+    desconocidas = [n for n in list(objetivos or []) + list(forzadas) if n not in por_nombre]
+    if desconocidas:
+        raise SystemExit(f"Etapas desconocidas: {', '.join(desconocidas)} (hay: {', '.join(por_nombre)})")
+
+    forzadas = set(forzadas)
+    if refrescar:
+        forzadas |= {e.nombre for e in lista if e.externa}
+
+    deps = dependencias(lista)
+    # sin objetivos: las etapas finales (las que nadie usa como entrada)
+    usadas = {d for ds in deps.values() for d in ds}
+    finales = [e.nombre for e in lista if e.nombre not in usadas]
+    elegidas = seleccionar(lista, deps, list(objetivos or finales) + sorted(forzadas), forzadas)
+    nombres = {e.nombre for e in elegidas}
+    deps = {n: [d for d in deps[n] if d in nombres] for n in nombres}
+    estado = cargar_estado()
+
+    if plan:
+        for e in elegidas:
+            motivo = motivo_para_correr(e, estado, forzadas)
+            marca = f"▶️ {motivo}" if motivo else "✅ al día"
+            previas = f"  ← {', '.join(deps[e.nombre])}" if deps[e.nombre] else ""
+            print(f"{e.nombre:24} [{e.rama}] {marca}{previas}")
+        return {}
+
+    resultados = {}
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        en_curso = {}
+
+        def _listas():
+            for e in elegidas:
+                n = e.nombre
+                if n in resultados or n in en_curso.values():
+                    continue
+                if any(resultados.get(d, {}).get("estado") in ("error", "omitida") for d in deps[n]):
+                    resultados[n] = {"estado": "omitida", "segundos": 0.0}
+                    print(f"⏭️ {n}: omitida (falló una etapa previa)")
+                elif all(d in resultados for d in deps[n]):
+                    yield e
+
+        while True:
+            for e in list(_listas()):
+                en_curso[pool.submit(correr_etapa, e, estado, forzadas)] = e.nombre
+            if not en_curso:
+                break
+
+            hechos, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+            for fut in hechos:
+                nombre = en_curso.pop(fut)
+                res = fut.result()
+                resultados[nombre] = res
+                etapa = por_nombre[nombre]
+
+                if res["estado"] == "ok":
+                    estado["etapas"][nombre] = {
+                        "firma": firma(etapa),
+                        "salidas": {str(p): hash_archivo(p) for p in etapa.salidas},
+                        "segundos": round(res["segundos"], 3),
+                        "fin": datetime.now().isoformat(timespec="seconds"),
+                    }
+                    guardar_estado(estado)
+                    print(f"✅ {nombre}: {res['segundos']:.1f}s ({res['motivo']})")
+                elif res["estado"] == "al_dia":
+                    print(f"= {nombre}: al día")
+                else:
+                    print(f"❌ {nombre}: {res['error']}" + (f"  (ver {res['log']})" if res.get("log") else ""))
+
+    total = time.perf_counter() - t0
+    _registrar_tiempos(resultados, total)
+    _imprimir_resumen(elegidas, resultados, total)
+    return resultados
+
+
+def _registrar_tiempos(resultados, total):
+    registro = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "total": round(total, 3),
+        "etapas": {n: {"estado": r["estado"], "segundos": round(r["segundos"], 3)} for n, r in resultados.items()},
+    }
+    with TIEMPOS_JSONL.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+
+def _imprimir_resumen(elegidas, resultados, total):
+    print()
+    print(f"{'ETAPA':24} {'ESTADO':8} {'SEGUNDOS':>9}")
+    for e in elegidas:
+        r = resultados.get(e.nombre, {"estado": "-", "segundos": 0.0})
+        print(f"{e.nombre:24} {r['estado']:8} {r['segundos']:9.2f}")
+    corridas = sum(1 for r in resultados.values() if r["estado"] == "ok")
+    errores = sum(1 for r in resultados.values() if r["estado"] in ("error", "omitida"))
+    print(f"⏱️ {total:.1f}s | {corridas} corridas | {errores} con error/omitidas")
+    print(TIEMPOS_JSONL.resolve())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline incremental ARCA → parametros_arca → Excel")
+    parser.add_argument("etapas", nargs="*", help="objetivos (default: todas)")
+    parser.add_argument("--forzar", nargs="+", default=[], metavar="ETAPA", help="correr aunque estén al día")
+    parser.add_argument("--refrescar", action="store_true", help="volver a bajar todo de ARCA")
+    parser.add_argument("--workers", type=int, default=None, help="etapas en paralelo (default: núcleos)")
+    parser.add_argument("--plan", action="store_true", help="sólo mostrar qué correría")
+    parser.add_argument("--excel", type=Path, default=EXCEL_PATH)
+    args = parser.parse_args()
+
+    resultados = run(args.etapas, args.forzar, args.refrescar, args.workers, args.plan, args.excel)
+    if any(r["estado"] in ("error", "omitida") for r in resultados.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
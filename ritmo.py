@@ -0,0 +1,199 @@
+"""
+Control adaptativo del ritmo de requests contra un host (ARCA), compartido
+por arca_mapper y arca_explorer.
+
+- Arranca en `inicial` y, mientras las respuestas vienen sanas, acorta el
+  intervalo hasta `minimo` (el techo permitido: robots.txt / config).
+- Con 429/503, timeouts o errores de conexión duplica el intervalo (hasta
+  MAXIMO) y respeta Retry-After; reintenta la misma URL unas pocas veces.
+- Si una latencia se dispara muy por encima del promedio, frena un poco.
+- Tras UMBRAL_CIRCUITO fallas seguidas abre el circuito: espera ENFRIAMIENTO
+  y prueba con un solo request (half-open). Si el host sigue caído tras
+  MAX_APERTURAS aperturas, levanta CircuitoAbierto para que el crawler corte
+  en vez de quemar toda la frontera en timeouts.
+
+    ritmo = ControlRitmo(inicial=1.0, minimo=0.25)
+    try:
+        r = ritmo.get(url)   # None si no hubo respuesta
+    except CircuitoAbierto:
+        ...  # cortar y guardar lo que haya
+"""
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from codigo import sesion_http
+from codigo.metricas import contar, fijar, log
+
+MAXIMO = 60.0                # intervalo máximo entre requests (segundos)
+ACELERACION = 0.85           # factor por respuesta sana
+FRENADA = 2.0                # factor por 429/503/timeout
+FRENADA_LATENCIA = 1.25      # factor por respuesta sana pero lenta
+LATENCIA_PICO = 3.0          # "lenta" = más de 3x el promedio móvil
+ALFA_LATENCIA = 0.2          # peso de la última muestra en el promedio móvil
+
+STATUS_REINTENTABLES = (429, 502, 503, 504)
+REINTENTOS = 2               # reintentos de la misma URL (además del primer intento)
+RETRY_AFTER_MAXIMO = 600.0   # un Retry-After más largo = el host no vuelve pronto
+# errores sin respuesta que vale la pena reintentar; el resto de las
+# RequestException (URL inválida, demasiadas redirecciones...) es culpa del
+# link, no del host: no se reintenta ni toca el ritmo / circuito
+ERRORES_REINTENTABLES = (requests.Timeout, requests.ConnectionError,
+                         requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+
+UMBRAL_CIRCUITO = 5          # fallas seguidas que abren el circuito
+ENFRIAMIENTO = 30.0          # segundos con el circuito abierto (se duplica en cada apertura)
+MAX_APERTURAS = 3
+
+
+class CircuitoAbierto(Exception):
+    """El host no responde: seguir sólo gastaría timeouts."""
+
+
+def segundos_retry_after(valor: str, ahora: float = None):
+    """Retry-After en segundos o fecha HTTP → segundos a esperar (None si no se entiende)."""
+    if not valor:
+        return None
+    valor = valor.strip()
+    if valor.isdigit():
+        return float(valor)
+    try:
+        fecha = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return None
+    ahora = time.time() if ahora is None else ahora
+    return max(0.0, fecha.timestamp() - ahora)
+
+
+class ControlRitmo:
+    def __init__(self, inicial: float = 1.0, minimo: float = 0.0, maximo: float = MAXIMO):
+        self.minimo = minimo
+        self.maximo = max(maximo, minimo)
+        self.delay = min(max(inicial, minimo), self.maximo)
+
+        self.latencia = None              # promedio móvil (segundos)
+        self.fallas_seguidas = 0
+        self.aperturas = 0
+        self._ultimo = None               # monotonic del último request
+        self._no_antes = 0.0              # Retry-After / circuito
+        fijar("ritmo_delay", self.delay)
+
+    # ==========================
+    # ESPERA
+    # ==========================
+
+    @property
+    def abierto(self) -> bool:
+        return self.fallas_seguidas >= UMBRAL_CIRCUITO
+
+    def esperar(self):
+        """Espera lo que falte desde el request anterior (el tiempo de análisis ya cuenta)."""
+        objetivo = self._no_antes
+        if self._ultimo is not None:
+            objetivo = max(objetivo, self._ultimo + self.delay)
+        falta = objetivo - time.monotonic()
+        if falta > 0:
+            time.sleep(falta)
+        self._ultimo = time.monotonic()
+
+    # ==========================
+    # AJUSTE
+    # ==========================
+
+    def _fijar_delay(self, delay: float):
+        self.delay = min(max(delay, self.minimo), self.maximo)
+        fijar("ritmo_delay", self.delay)
+
+    def _frenar(self, motivo: str, retry_after: float = None):
+        self._fijar_delay(self.delay * FRENADA)
+        self.fallas_seguidas += 1
+        contar("ritmo_frenadas", motivo=motivo)
+
+        espera = self.delay
+        if retry_after is not None:
+            if retry_after > RETRY_AFTER_MAXIMO:
+                raise CircuitoAbierto(f"Retry-After de {retry_after:.0f}s")
+            espera = max(espera, retry_after)
+            contar("ritmo_retry_after")
+
+        # abre al llegar al umbral y otra vez cada vez que falla la prueba half-open
+        if self.abierto:
+            self.aperturas += 1
+            contar("circuito_aperturas")
+            if self.aperturas > MAX_APERTURAS:
+                raise CircuitoAbierto(f"el host sigue fallando tras {MAX_APERTURAS} pausas ({motivo})")
+            espera = max(espera, ENFRIAMIENTO * 2 ** (self.aperturas - 1))
+            log.warning("⛔ Circuito abierto (%s): pausa de %.1fs", motivo, espera)
+
+        self._no_antes = max(self._no_antes, time.monotonic() + espera)
+
+    def registrar(self, status: int = None, latencia: float = None, motivo: str = None,
+                  retry_after: float = None) -> bool:
+        """
+        Ajusta el ritmo con el resultado de un request (status None = no hubo
+        respuesta; `motivo` dice por qué). True si conviene reintentar la URL.
+        """
+        if status is None or status in STATUS_REINTENTABLES:
+            self._frenar(motivo or str(status), retry_after)
+            return True
+
+        if self.abierto:
+            log.info("✅ Circuito cerrado: el host responde de nuevo")
+        self.fallas_seguidas = 0
+        self.aperturas = 0
+
+        if latencia is not None:
+            if self.latencia is not None and latencia > LATENCIA_PICO * self.latencia:
+                contar("ritmo_frenadas", motivo="latencia")
+                self._fijar_delay(self.delay * FRENADA_LATENCIA)
+            else:
+                self._fijar_delay(self.delay * ACELERACION)
+            self.latencia = latencia if self.latencia is None else (
+                ALFA_LATENCIA * latencia + (1 - ALFA_LATENCIA) * self.latencia
+            )
+        return False
+
+    # ==========================
+    # GET
+    # ==========================
+
+    def get(self, url: str, reintentos: int = REINTENTOS, **kwargs):
+        """
+        GET (sesión compartida) con espera, ajuste de ritmo y reintentos de 429/503/timeouts.
+        Devuelve la última respuesta (puede ser un 503 si se agotaron los
+        reintentos) o None si nunca hubo respuesta. Sólo los errores de
+        transporte frenan el ritmo y cuentan para el circuito; los demás
+        RequestException se cuentan en http_errores y devuelven None.
+        Levanta CircuitoAbierto.
+        """
+        r = None
+        for intento in range(reintentos + 1):
+            if intento:
+                contar("http_reintentos")
+            self.esperar()
+            t0 = time.perf_counter()
+            try:
+                r = sesion_http.get(url, **kwargs)
+            except requests.RequestException as e:
+                contar("http_errores", tipo=type(e).__name__)
+                log.debug("Sin respuesta de %s: %s", url, e)
+                r = None
+                if isinstance(e, requests.Timeout):
+                    motivo = "timeout"
+                elif isinstance(e, ERRORES_REINTENTABLES):
+                    motivo = "conexion"
+                else:
+                    log.warning("⚠️ %s: %s", url, e)
+                    return None
+                self.registrar(motivo=motivo)
+                continue
+
+            reintentar = self.registrar(
+                r.status_code,
+                time.perf_counter() - t0,
+                retry_after=segundos_retry_after(r.headers.get("Retry-After")),
+            )
+            if not reintentar:
+                return r
+        return r
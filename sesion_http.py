@@ -0,0 +1,84 @@
+"""
+Sesión HTTP compartida por todo lo que baja cosas de ARCA (crawlers,
+explorer, parsers HTML, inspect): un solo User-Agent, conexiones keep-alive
+reusadas (un handshake TCP+TLS por host, no uno por página), reintentos de
+transporte, timeout por defecto y compresión.
+
+    from codigo.sesion_http import get
+    r = get(url)                 # timeout=TIMEOUT salvo que se pase otro
+
+Los reintentos de acá son sólo de transporte (conexión / lectura cortada);
+los 429/503 y el ritmo entre requests los maneja codigo/ritmo.py.
+
+Métricas: http_requests{status}, http_bytes, span http_get y
+http_conexiones{tipo=nueva|reusada} (cuántos requests evitaron el handshake).
+"""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from codigo.metricas import contar, span
+
+USER_AGENT = os.getenv("IMPUESTOS_USER_AGENT", "Impuestos-Explorer/1.0")
+TIMEOUT = (10, 30)           # segundos: (conectar, leer)
+POOL = 10                    # conexiones guardadas por host
+
+REINTENTOS_TRANSPORTE = Retry(
+    total=2,
+    connect=2,
+    read=1,
+    status=0,                # los status los decide ritmo.py / el que llama
+    backoff_factor=0.5,
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False,
+)
+
+_sesion = None
+
+
+def sesion() -> requests.Session:
+    """La Session del proceso (se crea la primera vez)."""
+    global _sesion
+    if _sesion is None:
+        _sesion = requests.Session()
+        _sesion.headers.update({
+            "User-Agent": USER_AGENT,
+            # gzip/deflate (y br si está brotli instalado)
+            **make_headers(accept_encoding=True),
+        })
+        adapter = HTTPAdapter(pool_connections=POOL, pool_maxsize=POOL, max_retries=REINTENTOS_TRANSPORTE)
+        _sesion.mount("http://", adapter)
+        _sesion.mount("https://", adapter)
+    return _sesion
+
+
+def _conexiones_abiertas(url: str) -> int:
+    """Conexiones que abrieron hasta ahora los pools del adapter de `url` (uno por host)."""
+    pools = sesion().get_adapter(url).poolmanager.pools
+    return sum(pools[clave].num_connections for clave in pools.keys())
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET por la sesión compartida. Las excepciones de requests siguen de largo."""
+    kwargs.setdefault("timeout", TIMEOUT)
+    antes = _conexiones_abiertas(url)
+
+    with span("http_get"):
+        r = sesion().get(url, **kwargs)
+
+    nuevas = _conexiones_abiertas(url) - antes   # redirecciones incluidas
+    contar("http_conexiones", nuevas, tipo="nueva")
+    contar("http_conexiones", max(1 - nuevas, 0), tipo="reusada")
+    contar("http_requests", status=r.status_code)
+    contar("http_bytes", len(r.content))
+    return r
+
+
+def cerrar():
+    """Cierra las conexiones abiertas (opcional: al salir el proceso se cierran solas)."""
+    global _sesion
+    if _sesion is not None:
+        _sesion.close()
+        _sesion = None